@@ -0,0 +1,26 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains benchmarks for the performance critical parts of the simulation.
+The benchmarks require a SOFA installation and are run from the repository root, e.g.
+`python -m benchmarks.magnetic_controller_benchmark`.
+"""
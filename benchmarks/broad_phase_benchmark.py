@@ -0,0 +1,131 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the broad phases of the collision detection.
+Compares the steps per second of scenes with several copies of the shipped models 
+side by side for every broad phase and prints the broad phase the heuristic selects.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import Sofa.Core
+import Sofa.Simulation
+
+from src import Config, ElasticObject, MeshLoader, SceneBuilder
+from src.mesh_loader import Mode, read_mesh
+from src.scene_builder import select_broad_phase
+from src.sofa_instantiator import count_collision_elements
+from benchmarks.utils import SHIPPED_MODELS, print_table, time_call
+
+
+COPIES = (1, 2, 4, 8)
+BROAD_PHASES = (Config.BroadPhase.BRUTE_FORCE,
+                Config.BroadPhase.PARALLEL_BRUTE_FORCE,
+                Config.BroadPhase.INCREMENTAL_SAP)
+
+
+def build_scene(name: str, copies: int, broad_phase: Config.BroadPhase) -> Sofa.Core.Node:
+    """Builds and initializes a scene with copies of a shipped model next to each other along z. 
+    The constraint box is extended to hold all copies.
+
+    Args:
+        name (str): The name of the model.
+        copies (int): The number of copies.
+        broad_phase (Config.BroadPhase): The broad phase.
+
+    Returns:
+        Sofa.Core.Node: The initialized root node of the scene.
+    """
+    Config.reset()
+    Config.set_test_env()
+    Config.set_model(name)
+    Config.set_default_constraints()
+    Config.set_broad_phase(broad_phase)
+
+    volume_path = Path(__file__).parents[1] / f"lib/models/{name}.msh"
+    positions = read_mesh(volume_path).positions * Config.get_scale()
+    spacing = 1.2 * np.ptp(positions[:, 2])
+    point_a, point_b = Config.get_constraints()
+    Config.set_constraints(point_a, point_b + [0, 0, spacing * (copies - 1)])
+
+    root = Sofa.Core.Node("root")
+    scene_builder = SceneBuilder(
+        root, total_collision_elements=count_collision_elements([volume_path] * copies))
+    for i in range(copies):
+        mesh_loader = MeshLoader(scaling_factor=Config.get_scale())
+        mesh_loader.load_file(volume_path, Mode.VOLUMETRIC)
+        mesh_loader.derive_surface()
+        elastic_object = ElasticObject(scene_builder.create_child(f"robot_{i}"),
+                                       mesh_loader=mesh_loader,
+                                       poisson_ratio=Config.get_poisson_ratio(),
+                                       youngs_modulus=Config.get_youngs_modulus(),
+                                       density=Config.get_density())
+        elastic_object.mech_obj.translation = [0, 0, spacing * i]
+    Sofa.Simulation.init(root)
+    return root
+
+
+def steps_per_second(name: str, copies: int, broad_phase: Config.BroadPhase,
+                     repeats: int) -> float:
+    """Measures the simulation steps per second of a scene.
+
+    Args:
+        name (str): The name of the model.
+        copies (int): The number of copies.
+        broad_phase (Config.BroadPhase): The broad phase.
+        repeats (int): The number of timed steps.
+
+    Returns:
+        float: The number of steps per second.
+    """
+    root = build_scene(name, copies, broad_phase)
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    return 1 / time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+
+
+def main(repeats: int = 10) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per scene. Defaults to 10.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        volume_path = Path(__file__).parents[1] / f"lib/models/{name}.msh"
+        for copies in COPIES:
+            elements = count_collision_elements([volume_path] * copies)
+            row = [name, copies, elements]
+            for broad_phase in BROAD_PHASES:
+                row.append(f"{steps_per_second(name, copies, broad_phase, repeats):.1f}")
+            row.append(select_broad_phase(elements).name.lower())
+            rows.append(row)
+
+    print_table(("model", "copies", "triangles",
+                 *(f"{broad_phase.name.lower()} [1/s]" for broad_phase in BROAD_PHASES),
+                 "auto"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the FieldMap.
+Compares the cached trilinear interpolation with scipy's RegularGridInterpolator 
+for growing numbers of evaluation points that move slightly each step.
+"""
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from src import FieldMap
+from benchmarks.utils import print_table, time_call
+
+
+def main(repeats: int = 10, grid_shape: tuple = (64, 64, 64)) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed calls per implementation. Defaults to 10.
+        grid_shape (tuple, optional): The number of grid points along each axis. 
+            Defaults to (64, 64, 64).
+    """
+    rng = np.random.default_rng(0)
+    field = rng.random((*grid_shape, 3))
+    spacing = 1e-3
+    field_map = FieldMap(field, np.zeros(3), spacing)
+    axes = [np.arange(n) * spacing for n in grid_shape]
+    reference = RegularGridInterpolator(axes, field)
+    upper = (np.array(grid_shape) - 1) * spacing
+
+    rows = []
+    for count in (10**3, 10**4, 10**5):
+        points = rng.random((count, 3)) * upper
+        steps = [np.clip(points + rng.normal(scale=spacing / 20, size=points.shape), 0, upper)
+                 for _ in range(repeats)]
+
+        field_map.evaluate(points)
+        step_iter = iter(steps)
+        cached_time = time_call(
+            lambda: field_map.evaluate(next(step_iter)), repeats)
+        cold_time = time_call(
+            lambda: FieldMap(field, np.zeros(3), spacing).evaluate(points), repeats)
+        scipy_time = time_call(lambda: reference(points), repeats)
+        max_error = np.max(np.abs(field_map.evaluate(points) - reference(points)))
+
+        rows.append((count, f"{scipy_time * 1e3:.2f}", f"{cold_time * 1e3:.2f}",
+                     f"{cached_time * 1e3:.2f}", f"{max_error:.1e}"))
+
+    print_table(("points", "scipy [ms]", "uncached [ms]", "cached [ms]", "max error"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the magnetic force field of the ElasticObject.
+Compares the single ConstantForceField acting on all nodes with the previous layout
+of one ConstantForceField per node, regarding scene build time and per step cost.
+"""
+
+import time
+from typing import List, Tuple
+
+import numpy as np
+import Sofa
+import Sofa.Core
+import Sofa.Simulation
+
+from src import MagneticController
+from benchmarks.utils import SHIPPED_MODELS, build_scene, find_object, print_table, time_call
+
+
+def _build(name: str, legacy: bool) -> Tuple[Sofa.Core.Node, List[Sofa.Core.Object], float]:
+    """Builds the scene of the given model and measures the build time.
+
+    Args:
+        name (str): The name of the model.
+        legacy (bool): If True, additionally adds one ConstantForceField per node.
+
+    Returns:
+        Tuple[Sofa.Core.Node, List[Sofa.Core.Object], float]: The root node, 
+        the per node force fields (empty if not legacy) and the build time in seconds.
+    """
+    start = time.perf_counter()
+    root = build_scene(name, init=False)
+    eo_node = root.getChild('object')
+    node_count = len(eo_node.getObject('dofs').position.value)
+    per_node_fields = []
+    if legacy:
+        per_node_fields = [eo_node.addObject('ConstantForceField', indices=f"{i}", name=f"force_{i}",
+                                             forces=[0, 0, 0], showArrowSize="0")
+                           for i in range(node_count)]
+    Sofa.Simulation.init(root)
+    return root, per_node_fields, time.perf_counter() - start
+
+
+def main(repeats: int = 10) -> None:
+    """Runs the benchmark on all shipped models and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed calls per measurement. Defaults to 10.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        legacy_root, per_node_fields, legacy_build = _build(name, legacy=True)
+        root, _, build = _build(name, legacy=False)
+
+        controller = find_object(root, MagneticController)
+        positions = np.array(
+            root.getChild('object').getObject('dofs').position.value)
+        nodes, torques = controller.calculate_torques(positions)
+
+        def per_node_write():
+            for node, torque in zip(nodes, torques):
+                per_node_fields[node].forces = [torque]
+
+        legacy_write = time_call(per_node_write, repeats)
+        write = time_call(lambda: controller._elastic_object.vertex_forces.set_forces(
+            nodes, torques), repeats)
+        legacy_step = time_call(lambda: Sofa.Simulation.animate(
+            legacy_root, legacy_root.dt.value), repeats)
+        step = time_call(lambda: Sofa.Simulation.animate(
+            root, root.dt.value), repeats)
+
+        rows.append((name, len(positions),
+                     f"{legacy_build:.3f}", f"{build:.3f}",
+                     f"{legacy_write * 1e3:.3f}", f"{write * 1e3:.3f}",
+                     f"{legacy_step * 1e3:.2f}", f"{step * 1e3:.2f}"))
+
+    print_table(("model", "nodes",
+                 "build per node [s]", "build single [s]",
+                 "write per node [ms]", "write single [ms]",
+                 "step per node [ms]", "step single [ms]"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
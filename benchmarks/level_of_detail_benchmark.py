@@ -0,0 +1,79 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the level of detail.
+Compares the time of a simulation step of the shipped models with the full collision surface 
+and with collision surfaces decimated to a fraction of its triangles.
+"""
+
+from pathlib import Path
+
+import Sofa.Simulation
+
+from src import Config
+from src.mesh_loader import read_surface
+from benchmarks.utils import SHIPPED_MODELS, build_scene, print_table, time_call
+
+
+FRACTIONS = (1 / 2, 1 / 4, 1 / 8)
+
+
+def step_time(name: str, repeats: int, collision_triangles: int = None) -> float:
+    """Measures the mean time of a simulation step of a model.
+
+    Args:
+        name (str): The name of the model.
+        repeats (int): The number of timed steps.
+        collision_triangles (int, optional): The maximum number of triangles 
+            of the collision surface. Defaults to the full surface.
+
+    Returns:
+        float: The mean time of a step in seconds.
+    """
+    root = build_scene(name, configure=lambda: Config.set_level_of_detail(collision_triangles))
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    return time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+
+
+def main(repeats: int = 20) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per model and surface. Defaults to 20.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        triangles = len(read_surface(
+            Path(__file__).parents[1] / f"lib/models/{name}.msh", use_cache=False).triangles)
+        row = [name, triangles, f"{step_time(name, repeats) * 1e3:.2f}"]
+        for fraction in FRACTIONS:
+            row.append(f"{step_time(name, repeats, int(triangles * fraction)) * 1e3:.2f}")
+        rows.append(row)
+
+    print_table(("model", "triangles", "full [ms]",
+                 *(f"1/{round(1 / fraction)} [ms]" for fraction in FRACTIONS)), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the MagneticController.
+Compares the per tetrahedron loops the controller used before with the batched NumPy versions,
+both for the setup in the constructor and for the torque calculation in each step.
+"""
+
+from typing import Dict, List
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from src import Config, MagneticController
+from src.magnetic_controller import MU0
+from benchmarks.utils import SHIPPED_MODELS, build_scene, find_object, print_table, time_call
+
+
+def _loop_rotations(controller: MagneticController, initial_positions: np.ndarray) -> List[Rotation]:
+    """Calculates the rotations of all tetrahedra with one iteration per tetrahedron.
+
+    Args:
+        controller (MagneticController): The controller holding the mesh data.
+        initial_positions (np.ndarray): The initial positions of all nodes.
+
+    Returns:
+        List[Rotation]: The rotation of each tetrahedron.
+    """
+    rotations = []
+    for tetrahedron in controller._tetrahedra:
+        normal = controller._normal(initial_positions, tetrahedron)[0]
+        rotations.append(controller.calculate_rotation(
+            normal, Config.get_initial_dipole_moment()))
+    return rotations
+
+
+def _loop_torques(controller: MagneticController, rotations: List[Rotation],
+                  cur_positions: np.ndarray) -> Dict[int, np.ndarray]:
+    """Calculates the torques with one iteration per tetrahedron.
+
+    Args:
+        controller (MagneticController): The controller holding the mesh data.
+        rotations (List[Rotation]): The rotation of each tetrahedron.
+        cur_positions (np.ndarray): The current positions of all nodes.
+
+    Returns:
+        Dict[int, np.ndarray]: The torques mapped to the node indices.
+    """
+    torques = {}
+    for index, tetrahedron in enumerate(controller._tetrahedra):
+        normal = controller._normal(cur_positions, tetrahedron)[0]
+        orientation = rotations[index].apply(normal)
+        for node in tetrahedron:
+            if node not in torques:
+                dipole_moment = Config.get_remanence().T * controller._volume / MU0
+                torques[node] = np.cross(
+                    dipole_moment * orientation, Config.get_b_field())
+    return torques
+
+
+def main(repeats: int = 10) -> None:
+    """Runs the benchmark on all shipped models and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed calls per implementation. Defaults to 10.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        root = build_scene(name)
+        controller = find_object(root, MagneticController)
+        elastic_object = controller._elastic_object
+        initial_positions = np.array(elastic_object.mesh.position.value)
+        positions = np.array(
+            root.getChild('object').getObject('dofs').position.value)
+
+        rotations = _loop_rotations(controller, initial_positions)
+        reference = _loop_torques(controller, rotations, positions)
+        nodes, torques = controller.calculate_torques(positions)
+        identical = all(np.array_equal(reference[node], torque)
+                        for node, torque in zip(nodes, torques))
+
+        loop_init = time_call(
+            lambda: _loop_rotations(controller, initial_positions), repeats)
+        batched_init = time_call(
+            lambda: MagneticController(elastic_object, controller._material_loader), repeats)
+        loop_time = time_call(
+            lambda: _loop_torques(controller, rotations, positions), repeats)
+        batched_time = time_call(
+            lambda: controller.calculate_torques(positions), repeats)
+        rows.append((name, len(controller._tetrahedra),
+                     f"{loop_init * 1e3:.1f}", f"{batched_init * 1e3:.2f}",
+                     f"{loop_time * 1e3:.2f}", f"{batched_time * 1e3:.3f}",
+                     f"{loop_time / batched_time:.0f}x", identical))
+
+    print_table(("model", "tetrahedra", "init loop [ms]", "init batched [ms]",
+                 "step loop [ms]", "step batched [ms]", "step speedup", "identical"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the mesh readers.
+Compares loading the volumetric meshes of the shipped models with SOFA's MeshGmshLoader 
+with the NumPy reader, once parsing the file and once reading the memory-mapped cache.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import Sofa
+import Sofa.Core
+import Sofa.Simulation
+
+from src.mesh_loader import read_mesh
+from benchmarks.utils import SHIPPED_MODELS, print_table, time_call
+
+
+def load_with_sofa(path: Path) -> np.ndarray:
+    """Loads the given mesh with SOFA's MeshGmshLoader.
+
+    Args:
+        path (Path): The path to the mesh file.
+
+    Returns:
+        np.ndarray: The positions of the nodes.
+    """
+    root = Sofa.Core.Node("root")
+    loader = root.addObject("MeshGmshLoader", filename=str(path))
+    Sofa.Simulation.init(root)
+    return np.array(loader.position.value)
+
+
+def main(repeats: int = 10) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed loads per reader. Defaults to 10.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in SHIPPED_MODELS:
+            # The cache is written beside the model, so a copy keeps lib/models clean
+            path = Path(directory) / f"{name}.msh"
+            shutil.copyfile(Path("lib/models") / f"{name}.msh", path)
+
+            sofa_time = time_call(lambda: load_with_sofa(path), repeats)
+            parse_time = time_call(lambda: read_mesh(path, use_cache=False), repeats)
+            mesh = read_mesh(path)
+            cached_time = time_call(lambda: read_mesh(path), repeats)
+
+            rows.append((name, len(mesh.positions), len(mesh.tetrahedra),
+                         f"{sofa_time * 1e3:.2f}", f"{parse_time * 1e3:.2f}",
+                         f"{cached_time * 1e3:.2f}"))
+
+    print_table(("model", "nodes", "tetrahedra", "SOFA [ms]", "NumPy [ms]", "cached [ms]"),
+                rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the node ordering.
+Compares the bandwidth and the time of a simulation step of the shipped models 
+with the nodes of the Gmsh export and the nodes reordered by reverse Cuthill-McKee.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import Sofa.Simulation
+
+from src.mesh_loader import node_bandwidth, read_mesh, reorder_nodes, write_gmsh
+from benchmarks.utils import SHIPPED_MODELS, build_scene, print_table, time_call
+
+
+MODELS_PATH = Path(__file__).parents[1] / "lib/models"
+
+
+def step_time(name: str, repeats: int) -> float:
+    """Measures the mean time of a simulation step of a model.
+
+    Args:
+        name (str): The name of the model relative to the model library.
+        repeats (int): The number of timed steps.
+
+    Returns:
+        float: The mean time of a step in seconds.
+    """
+    root = build_scene(name)
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    return time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+
+
+def main(repeats: int = 20) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per model. Defaults to 20.
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in SHIPPED_MODELS:
+            mesh = read_mesh(MODELS_PATH / f"{name}.msh", use_cache=False)
+            reordered, _ = reorder_nodes(mesh)
+
+            # The scene loads the models from the library, so a relative path is used as name
+            original_name = Path(directory) / name
+            reordered_name = Path(directory) / f"{name}_rcm"
+            shutil.copyfile(MODELS_PATH / f"{name}.msh", f"{original_name}.msh")
+            shutil.copyfile(MODELS_PATH / f"{name}.stl", f"{original_name}.stl")
+            # Without a surface mesh file, the surface is derived from the reordered nodes
+            write_gmsh(Path(f"{reordered_name}.msh"), reordered)
+
+            original_time = step_time(os.path.relpath(original_name, MODELS_PATH), repeats)
+            reordered_time = step_time(os.path.relpath(reordered_name, MODELS_PATH), repeats)
+
+            rows.append((name, len(mesh.positions),
+                         node_bandwidth(mesh), node_bandwidth(reordered),
+                         f"{original_time * 1e3:.2f}", f"{reordered_time * 1e3:.2f}"))
+
+    print_table(("model", "nodes", "bandwidth", "RCM bandwidth",
+                 "step [ms]", "RCM step [ms]"), rows)
+
+
+if __name__ == "__main__":
+    main()
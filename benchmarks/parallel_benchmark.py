@@ -0,0 +1,70 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the ChunkedExecutor.
+Measures the torque calculation of the MagneticController and the deformation update 
+of the SimulationAnalyser with different numbers of worker threads.
+"""
+
+import os
+import numpy as np
+
+from src import MagneticController, ChunkedExecutor, SimulationAnalyser
+from benchmarks.utils import build_scene, find_object, print_table, time_call
+
+
+def main(name: str = "gripper_4_arm", repeats: int = 20) -> None:
+    """Runs the benchmark on a shipped model and prints the results.
+
+    Args:
+        name (str, optional): The name of the model. Defaults to "gripper_4_arm".
+        repeats (int, optional): The number of timed calls per worker count. Defaults to 20.
+    """
+    root = build_scene(name)
+    controller = find_object(root, MagneticController)
+    positions = np.array(
+        root.getChild('object').getObject('dofs').position.value)
+
+    rows = []
+    serial_time = None
+    worker_counts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    for workers in worker_counts:
+        executor = ChunkedExecutor(workers)
+        uut = MagneticController(controller._elastic_object, controller._material_loader,
+                                 executor=executor)
+        analyser = SimulationAnalyser(root, executor)
+
+        torque_time = time_call(lambda: uut.calculate_torques(positions), repeats)
+        deformation_time = time_call(analyser.update_deformation, repeats)
+        executor.shutdown()
+
+        if serial_time is None:
+            serial_time = torque_time
+        rows.append((workers, f"{torque_time * 1e3:.3f}", f"{serial_time / torque_time:.2f}x",
+                     f"{deformation_time * 1e3:.3f}"))
+
+    print(f"{name}: {len(controller._tetrahedra)} tetrahedra, {len(positions)} nodes")
+    print_table(("workers", "torques [ms]", "speedup", "deformation [ms]"), rows)
+
+
+if __name__ == "__main__":
+    main()
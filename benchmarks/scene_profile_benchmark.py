@@ -0,0 +1,68 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the scene profiles.
+Compares the time of a simulation step of the shipped models with the contact profile,
+i.e. self-collision and contact constraints, and with the free profile without them.
+"""
+
+import Sofa.Simulation
+
+from src import Config
+from benchmarks.utils import SHIPPED_MODELS, build_scene, print_table, time_call
+
+
+def step_time(name: str, repeats: int, scene_profile: Config.SceneProfile) -> float:
+    """Measures the mean time of a simulation step of a model.
+
+    Args:
+        name (str): The name of the model.
+        repeats (int): The number of timed steps.
+        scene_profile (Config.SceneProfile): The scene profile.
+
+    Returns:
+        float: The mean time of a step in seconds.
+    """
+    root = build_scene(name, configure=lambda: Config.set_scene_profile(scene_profile))
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    return time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+
+
+def main(repeats: int = 20) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per model and profile. Defaults to 20.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        contact = step_time(name, repeats, Config.SceneProfile.CONTACT)
+        free = step_time(name, repeats, Config.SceneProfile.FREE)
+        rows.append([name, f"{contact * 1e3:.2f}", f"{free * 1e3:.2f}", f"{contact / free:.1f}x"])
+
+    print_table(("model", "contact [ms]", "free [ms]", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the solver profiles.
+Compares the time of a simulation step and the peak memory of the shipped models 
+for every solver profile. Every measurement runs in a new process, 
+so the peak memory only contains one scene.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Tuple
+
+import Sofa.Simulation
+
+from src import Config
+from src.elastic_object import select_solver_profile
+from src.mesh_loader import read_mesh
+from benchmarks.utils import SHIPPED_MODELS, build_scene, peak_memory, print_table, time_call
+
+
+SOLVER_PROFILES = (Config.SolverProfile.DIRECT,
+                   Config.SolverProfile.ITERATIVE,
+                   Config.SolverProfile.ASYNC)
+
+
+def measure(name: str, solver_profile: Config.SolverProfile, repeats: int) -> Tuple[float, int]:
+    """Measures the mean time of a simulation step and the peak memory of a model.
+
+    Args:
+        name (str): The name of the model.
+        solver_profile (Config.SolverProfile): The solver profile.
+        repeats (int): The number of timed steps.
+
+    Returns:
+        Tuple[float, int]: The mean time of a step in seconds and the peak memory in bytes.
+    """
+    root = build_scene(name, configure=lambda: Config.set_solver_profile(solver_profile))
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    step_time = time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+    return step_time, peak_memory()
+
+
+def main(repeats: int = 20) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per model and profile. Defaults to 20.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        node_count = len(read_mesh(Path(__file__).parents[1] / f"lib/models/{name}.msh").positions)
+        row = [name, node_count]
+        for solver_profile in SOLVER_PROFILES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                step_time, memory = executor.submit(
+                    measure, name, solver_profile, repeats).result()
+            row += [f"{step_time * 1e3:.2f}", f"{memory / 2**20:.0f}"]
+        row.append(select_solver_profile(node_count).name.lower())
+        rows.append(row)
+
+    header = ["model", "nodes"]
+    for solver_profile in SOLVER_PROFILES:
+        header += [f"{solver_profile.name.lower()} [ms]", f"{solver_profile.name.lower()} [MB]"]
+    print_table(header + ["auto"], rows)
+
+
+if __name__ == "__main__":
+    main()
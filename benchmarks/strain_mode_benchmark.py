@@ -0,0 +1,68 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""Benchmark of the strain modes.
+Compares the time of a simulation step of the shipped models for every strain mode 
+of the FEM force field, without the checks of the StrainMonitor.
+"""
+
+import Sofa.Simulation
+
+from src import Config
+from benchmarks.utils import SHIPPED_MODELS, build_scene, print_table, time_call
+
+
+def step_time(name: str, repeats: int, strain_mode: Config.StrainMode) -> float:
+    """Measures the mean time of a simulation step of a model.
+
+    Args:
+        name (str): The name of the model.
+        repeats (int): The number of timed steps.
+        strain_mode (Config.StrainMode): The strain mode.
+
+    Returns:
+        float: The mean time of a step in seconds.
+    """
+    root = build_scene(name, configure=lambda: Config.set_strain_mode(strain_mode))
+    # The first steps include the first factorization
+    for _ in range(3):
+        Sofa.Simulation.animate(root, root.dt.value)
+    return time_call(lambda: Sofa.Simulation.animate(root, root.dt.value), repeats)
+
+
+def main(repeats: int = 20) -> None:
+    """Runs the benchmark and prints the results.
+
+    Args:
+        repeats (int, optional): The number of timed steps per model and strain mode. Defaults to 20.
+    """
+    rows = []
+    for name in SHIPPED_MODELS:
+        rows.append([name, *(f"{step_time(name, repeats, strain_mode) * 1e3:.2f}"
+                             for strain_mode in Config.StrainMode)])
+
+    print_table(("model", *(f"{strain_mode.name.lower()} [ms]"
+                            for strain_mode in Config.StrainMode)), rows)
+
+
+if __name__ == "__main__":
+    main()
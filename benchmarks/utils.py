@@ -0,0 +1,150 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains utilities shared by all benchmarks."""
+
+import ctypes
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Type
+
+import Sofa
+import Sofa.Core
+import Sofa.Simulation
+
+from src import Config, sofa_instantiator
+
+
+SHIPPED_MODELS = [
+    "beam",
+    "butterfly",
+    "gripper_3_arm",
+    "gripper_4_arm",
+    "simple_butterfly",
+]
+
+
+def build_scene(name: str, init: bool = True,
+                configure: Optional[Callable[[], None]] = None) -> Sofa.Core.Node:
+    """Builds and initializes the scene of a shipped model with the test configuration.
+
+    Args:
+        name (str): The name of the model.
+        init (bool, optional): If False, the scene is not initialized. Defaults to True.
+        configure (Optional[Callable[[], None]], optional): Changes the configuration 
+            before the scene is built. Defaults to None.
+
+    Returns:
+        Sofa.Core.Node: The (initialized) root node of the scene.
+    """
+    Config.reset()
+    Config.set_test_env()
+    Config.set_model(name)
+    Config.set_default_constraints()
+    if configure is not None:
+        configure()
+
+    root = Sofa.Core.Node("root")
+    sofa_instantiator.createScene(root)
+    if init:
+        Sofa.Simulation.init(root)
+    return root
+
+
+def find_object(node: Sofa.Core.Node, object_type: Type) -> object:
+    """Finds the first object of the given type in the given node.
+
+    Args:
+        node (Sofa.Core.Node): The node to search in.
+        object_type (Type): The type of the object.
+
+    Raises:
+        ValueError: If the node contains no object of the given type.
+
+    Returns:
+        object: The found object.
+    """
+    for obj in node.objects:
+        if isinstance(obj, object_type):
+            return obj
+    raise ValueError(f"No object of type {object_type.__name__} found.")
+
+
+def time_call(func: Callable[[], object], repeats: int = 10) -> float:
+    """Measures the mean wall time of the given function.
+
+    Args:
+        func (Callable[[], object]): The function to measure.
+        repeats (int, optional): The number of calls. Defaults to 10.
+
+    Returns:
+        float: The mean wall time of one call in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+
+def print_table(header: Sequence[str], rows: List[Sequence[object]]) -> None:
+    """Prints the given rows as a plain text table.
+
+    Args:
+        header (Sequence[str]): The column names.
+        rows (List[Sequence[object]]): The rows of the table.
+    """
+    cells = [list(map(str, header))] + [list(map(str, row)) for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    for i, row in enumerate(cells):
+        print(" | ".join(cell.rjust(width)
+              for cell, width in zip(row, widths)))
+        if i == 0:
+            print("-+-".join("-" * width for width in widths))
+
+
+def peak_memory() -> int:
+    """Returns the peak memory of the current process, i.e. the resident set size 
+    or the working set size on Windows.
+
+    Returns:
+        int: The peak memory in bytes.
+    """
+    if sys.platform == "win32":
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [("cb", ctypes.c_ulong), ("PageFaultCount", ctypes.c_ulong)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                    "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                    "PagefileUsage", "PeakPagefileUsage")]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.kernel32.GetCurrentProcess.restype = ctypes.c_void_p
+        process = ctypes.c_void_p(ctypes.windll.kernel32.GetCurrentProcess())
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb)
+        return counters.PeakWorkingSetSize
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
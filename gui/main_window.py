@@ -35,6 +35,7 @@ from __future__ import annotations
 import multiprocessing as mp
 import os
 import re
+import time
 from builtins import ValueError
 from typing import Optional, List, Tuple
 from pathlib import Path
@@ -46,10 +47,8 @@ from PySide6.QtWidgets import (
 )
 
 from PySide6.QtCore import Qt, QThread
-import Sofa.Core
 from src.units import Tesla
-from src import AnalysisParameters, Config, MeshLoader, sofa_instantiator
-from src.mesh_loader import Mode as MeshMode
+from src import AnalysisParameters, Config, ModelIndex, sofa_instantiator
 
 from gui import MSRHeaderWidget, MSRMaterialGroup, MSRDeformationAnalysisWidget, MSRMaterialParameter, MSRStressAnalysisWidget
 
@@ -93,6 +92,7 @@ class MainWindow(QMainWindow):
                 "deform_update": self.parent().deformation_widget.update_results,
                 "deform_error": self.parent().deformation_widget.display_input_error,
                 "deform_reset": self.parent().deformation_widget.reset,
+                "startup_time": self.parent().show_startup_time,
             }
             while self._runs:
                 while not self.parent()._reciever.poll(1):
@@ -259,32 +259,35 @@ class MainWindow(QMainWindow):
         Config.set_model("butterfly", None, False)
 
         self._simulation = None
+        self._simulation_conn = None
+        self._scene_settings = None
+        self._apply_time = None
         self._reciever, self._caller = mp.Pipe()
         self._listener = self.Listener(self)
         self.destroyed.connect(self._listener.terminate)
         self._listener.start()
 
+        # A simulation process that already imported SOFA and loaded the plugins
+        self._standby = None
+        self._standby_conn = None
+        self._spawn_standby()
+
     def update_model(self) -> None:
         """Updates the model value fields in the GUI after setting the model."""
         name = Config.get_name()
 
-        # SOFA to get nodes and tetrahedra
-        root = Sofa.Core.Node("root")
-        root.addObject(
-            "RequiredPlugin", pluginName='Sofa.Component.IO.Mesh')
-        mesh_loader = MeshLoader()
-        # TODO: still hardcoded mesh file type (GUI - Import Meshes)
         # TODO: hardcodced path --> change for packaging
-        mesh_loader.load_file(
-            Path(__file__).parents[1] / f'lib/models/{name}.msh', MeshMode.VOLUMETRIC)
-        model_obj = mesh_loader.load_mesh_into(root, MeshMode.VOLUMETRIC)
+        path = Path(__file__).parents[1] / f'lib/models/{name}'
+        entry = ModelIndex(path.parent).get(path.name)
 
-        # updating the values
-        node_count = len(model_obj.position.value)
-        tetrahedron_count = len(model_obj.tetrahedra.value)
+        # updating the values, the index has no counts for meshes it could not read
+        unreadable = entry["nodes"] is None
+        tool_tip = "The mesh could not be read." if unreadable else ""
         self._model_name.setText(name)
-        self._model_nodes.setText(str(node_count))
-        self._model_tetrahedra.setText(str(tetrahedron_count))
+        for label, count in [(self._model_nodes, entry["nodes"]),
+                             (self._model_tetrahedra, entry["tetrahedra"])]:
+            label.setText("unknown" if unreadable else str(count))
+            label.setToolTip(tool_tip)
 
     def _field_strength_update(self, strength: float, spinbox: bool,
                                slider: bool) -> None:
@@ -335,6 +338,8 @@ class MainWindow(QMainWindow):
 
         This method retrieves material parameters, field strength, and direction 
         from the UI and updates the simulation settings accordingly. 
+        A running simulation is updated in place, it is only restarted 
+        if the model, the constraints or the stress analysis changed.
         If the direction input is invalid, a warning message is displayed.
         """
 
@@ -387,13 +392,53 @@ class MainWindow(QMainWindow):
         Config.set_stress_kwargs(show_stress)
         Config.set_analysis_parameters(analysis_parameters)
 
+        # A running simulation is updated, unless its scene has to be rebuilt
+        if self._simulation is not None and self._simulation.is_alive() \
+                and not Config.scene_changed(self._scene_settings):
+            self._simulation_conn.send(("config", Config.to_list()))
+            return
+
         if self._simulation is not None:
             self._simulation.kill()
-        parent_conn, child_conn = mp.Pipe()
-        self._simulation = mp.Process(
-            target=sofa_instantiator.main, args=(child_conn,))
-        parent_conn.send(Config.to_list())
-        self._simulation.start()
+        if not self._standby.is_alive():
+            self._spawn_standby()
+        self._apply_time = time.time()
+        self._simulation, self._simulation_conn = self._standby, self._standby_conn
+        self._simulation_conn.send(Config.to_list())
+        self._scene_settings = Config.get_scene_settings()
+        self._spawn_standby()
+
+    def _spawn_standby(self) -> None:
+        """Starts a new standby simulation process, which prepares SOFA in the background 
+        and runs the simulation of the next applied configuration.
+        """
+        self._standby_conn, child_conn = mp.Pipe()
+        self._standby = mp.Process(
+            target=sofa_instantiator.standby, args=(child_conn,))
+        self._standby.start()
+
+    def show_startup_time(self, timestamp: float, build_time: float) -> None:
+        """Shows the time from applying the parameters until the simulation was ready in the status bar.
+
+        Args:
+            timestamp (float): The wall clock time when the simulation was ready.
+            build_time (float): The time the simulation process needed to build the scene in s.
+        """
+        if self._apply_time is None:
+            return
+        self.statusBar().showMessage(
+            f"Simulation started in {timestamp - self._apply_time:.2f} s "
+            f"(scene built in {build_time:.2f} s)")
+
+    def closeEvent(self, event) -> None:
+        """Stops the standby simulation process when the window is closed.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        if self._standby is not None:
+            self._standby.kill()
+        super().closeEvent(event)
 
     def _parse_max_deformation_information(self) -> Tuple[bool, List[int | np.ndarray]]:
         """Parses the information from the deformation widget 
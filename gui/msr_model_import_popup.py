@@ -35,10 +35,12 @@ from shutil import copy2
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QFileDialog, QGridLayout, QGroupBox,
-    QLabel, QPushButton, QLineEdit, QMessageBox
+    QLabel, QPushButton, QLineEdit, QMessageBox, QCheckBox
 )
 from PySide6.QtCore import Qt
-from src.mesh_loader import MeshLoader, Mode
+from src import Config
+from src.mesh_loader import (MeshLoader, Mode, node_bandwidth, read_level_of_detail, read_mesh,
+                             read_surface, reorder_nodes, write_gmsh)
 from gui import MSROpenModelsPopup
 
 
@@ -77,6 +79,10 @@ class MSRModelImportPopup(QWidget):
                 self.volumetric_formats, self.vol_path_label)
         )
 
+        self.reorder_checkbox = QCheckBox(
+            "Reorder nodes for a faster simulation")
+        self.reorder_checkbox.setChecked(True)
+
         def_widget = QGroupBox("Define Model")
         def_layout = QGridLayout(def_widget)
         OFFSET = 1
@@ -86,6 +92,7 @@ class MSRModelImportPopup(QWidget):
         def_layout.addWidget(self.surf_path_label, OFFSET, 1)
         def_layout.addWidget(self.vol_button, OFFSET+1, 0)
         def_layout.addWidget(self.vol_path_label, OFFSET+1, 1)
+        def_layout.addWidget(self.reorder_checkbox, OFFSET+2, 0, 1, 2)
 
         import_button = QPushButton("Import and Select Model")
         import_button.clicked.connect(
@@ -125,6 +132,10 @@ class MSRModelImportPopup(QWidget):
 
         Validates the input data, checks for existing models, copies the files to the
         library, and informs the user about the success or failure of the import process.
+        If selected, the nodes of the volumetric mesh are reordered to reduce the bandwidth 
+        of the system matrix before it is written to the library. The surface mesh has to lie 
+        on the nodes of the volumetric mesh, models without a surface mesh use the surface 
+        derived from the volumetric mesh.
         """
 
         name = self.name_definition.text()
@@ -137,7 +148,8 @@ class MSRModelImportPopup(QWidget):
         name = '_'.join(name.strip().split(sep=" "))
 
         dst_dir = Path(__file__).parents[1] / "lib/imported_models"
-        existing_names = [path.stem for path in dst_dir.iterdir()]
+        existing_names = [path.stem for path in dst_dir.iterdir()
+                          if not path.name.startswith(".")]
         if name in existing_names:
             QMessageBox.warning(
                 self, "Warning", "Model with this name already exists.")
@@ -149,29 +161,55 @@ class MSRModelImportPopup(QWidget):
         # vol_path = Path(vol_path_str)
         # surf_path = Path(surf_path_str)
 
-        if vol_path_str in {"", "[path not set]"} or surf_path_str in {"", "[path not set]"}:
+        if vol_path_str in {"", "[path not set]"}:
             QMessageBox.warning(
-                self, "Warning", "At least one mesh path not set.")
+                self, "Warning", "Volumetric mesh path not set.")
             return
+        # Without a surface mesh, the surface is derived from the volumetric mesh
+        use_surface = surf_path_str not in {"", "[path not set]"}
 
         try:
             # use mesh loader for file integrity checks
-            self._mesh_loader.load_file(Path(surf_path_str), Mode.SURFACE)
+            if use_surface:
+                self._mesh_loader.load_file(Path(surf_path_str), Mode.SURFACE)
             self._mesh_loader.load_file(Path(vol_path_str), Mode.VOLUMETRIC)
-
-            copy2(vol_path_str, dst_dir / f'{name}.msh')
-            copy2(surf_path_str, dst_dir / f'{name}.stl')
+            if use_surface:
+                # Checks that the surface can be mapped onto the (reordered) nodes
+                self._mesh_loader.surface_nodes(use_cache=False)
+            else:
+                # Checks that the surface can be derived
+                read_surface(Path(vol_path_str), use_cache=False)
+
+            message = "Model imported successfully."
+            if self.reorder_checkbox.isChecked():
+                mesh = read_mesh(Path(vol_path_str), use_cache=False)
+                reordered, _ = reorder_nodes(mesh)
+                write_gmsh(dst_dir / f'{name}.msh', reordered)
+                message += f"\nThe node bandwidth was reduced from {node_bandwidth(mesh)} " \
+                    f"to {node_bandwidth(reordered)}."
+            else:
+                copy2(vol_path_str, dst_dir / f'{name}.msh')
+            if use_surface:
+                copy2(surf_path_str, dst_dir / f'{name}.stl')
+                if self.reorder_checkbox.isChecked():
+                    message += "\nThe surface mesh is mapped onto the reordered nodes."
+            else:
+                message += "\nThe surface is derived from the volumetric mesh."
+            # Builds the cache of the decimated surfaces, so the first simulation starts faster
+            for target_triangles in Config.get_level_of_detail():
+                if target_triangles is not None:
+                    read_level_of_detail(dst_dir / f'{name}.msh', target_triangles)
 
             if self._selection_widget is None:
                 raise ValueError("No MSROpenModelsPopup provided to select.")
             model_list = self._selection_widget.custom_list
-            self._selection_widget.load_models(model_list, dst_dir)
+            # Reloads the index too, so the imported model is described with its metadata
+            self._selection_widget.refresh_models()
             item = model_list.findItems(name, Qt.MatchFlag.MatchExactly)[0]
             index = model_list.indexFromItem(item)
             model_list.activated.emit(index)
 
-            QMessageBox.information(
-                self, "Success", "Model imported successfully.")
+            QMessageBox.information(self, "Success", message)
 
             # after import success as selection success should come after import success
             self._selection_widget.open_model()
@@ -30,11 +30,11 @@ Classes:
 """
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QMainWindow,
                                QLabel, QPushButton, QListWidget, QMessageBox,)
-from PySide6.QtGui import QFont
-from src import Config
+from PySide6.QtGui import QFont, QShowEvent
+from src import Config, ModelIndex
 
 
 class MSROpenModelsPopup(QWidget):
@@ -66,6 +66,7 @@ class MSROpenModelsPopup(QWidget):
         self._selected_model_name = None
         self._selected_is_custom = None
         self._selected_scale = None
+        self._indices: Dict[bool, ModelIndex] = {}
 
         default_label = QLabel("Default Models:")
         custom_label = QLabel("Custom Models:")
@@ -78,16 +79,15 @@ class MSROpenModelsPopup(QWidget):
         for label in [default_label, custom_label, selection_text_label]:
             label.setFont(fat_text)
 
-        lib_path = Path(__file__).parents[1] / "lib"
+        self._lib_path = Path(__file__).parents[1] / "lib"
+        self.refresh_models()
 
-        self.load_models(self.default_list, lib_path / "models")
         self.default_list.itemActivated.connect(
             lambda item:
             self.update_loaded_model(item.text(), False, [self.custom_list]))
         self.default_list.itemSelectionChanged.connect(
             self.custom_list.clearSelection)
 
-        self.load_models(self.custom_list, lib_path / "imported_models")
         self.custom_list.itemActivated.connect(
             lambda item:
             self.update_loaded_model(item.text(), True, [self.default_list]))
@@ -105,6 +105,23 @@ class MSROpenModelsPopup(QWidget):
         self._layout.addWidget(self._selection_label)
         self._layout.addWidget(open_button)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Refreshes the models each time the popup is shown, 
+        so models that were imported or changed in the meantime are listed with their metadata.
+
+        Args:
+            event (QShowEvent): The show event.
+        """
+        self.refresh_models()
+        super().showEvent(event)
+
+    def refresh_models(self) -> None:
+        """Reloads the default and custom models and their model indices."""
+        self._indices[False] = self.load_models(
+            self.default_list, self._lib_path / "models")
+        self._indices[True] = self.load_models(
+            self.custom_list, self._lib_path / "imported_models")
+
     def update_loaded_model(self, model_name: str, custom_model: bool,
                             other_widgets: List[QListWidget] = None, scale: Optional[float] = None) -> None:
         """Updates the loaded model in the config.
@@ -128,7 +145,30 @@ class MSROpenModelsPopup(QWidget):
         self._selected_is_custom = custom_model
         self._selected_scale = scale
 
-        self._selection_label.setText(f">> {model_name}")
+        self._selection_label.setText(
+            f">> {model_name}{self.describe_model(model_name, custom_model)}")
+
+    def describe_model(self, model_name: str, custom_model: bool) -> str:
+        """Describes a model with the metadata of the model index.
+
+        Args:
+            model_name (str): The name of the model.
+            custom_model (bool): Whether the model is a custom model.
+
+        Returns:
+            str: The description or an empty string if the model is not indexed.
+        """
+        index = self._indices.get(custom_model)
+        if index is None:
+            return ""
+        try:
+            entry = index.get(model_name)
+        except KeyError:
+            return ""
+        if entry["nodes"] is None:
+            return " (the mesh could not be read)"
+        return f" ({entry['nodes']} nodes, {entry['tetrahedra']} tetrahedra, " \
+            f"{entry['triangles']} surface triangles)"
 
     def open_model(self):
         """Loads the selected model into the configuration file and displays information on the model in the main window.
@@ -154,20 +194,29 @@ class MSROpenModelsPopup(QWidget):
         )
         self.close()
 
-    def load_models(self, list_widget: QListWidget, models_path: Path) -> None:
+    def load_models(self, list_widget: QListWidget, models_path: Path) -> Optional[ModelIndex]:
         """Loads the models from the specified directory into the given list widget.
+        The metadata of the models is taken from the model index of the directory, 
+        which only reads the models that changed since the last refresh.
 
         Args:
             list_widget (QListWidget): The widget to display the list of models.
             models_path (Path): The path to the directory containing model files.
+
+        Returns:
+            Optional[ModelIndex]: The index of the directory or None if it does not exist.
         """
         if not models_path.exists():
             QMessageBox.warning(
                 self, "Error", f"Models folder not found at: {models_path}")
-            return
+            return None
 
-        model_names = list(
-            {path.stem for path in models_path.iterdir()} - {".gitkeep"})
-        # use set comprehension to remove duplicates
-        for model_name in model_names:
+        index = ModelIndex(models_path)
+        # The list is reloaded after imports
+        list_widget.clear()
+        for model_name, entry in index.refresh().items():
             list_widget.addItem(model_name)
+            if entry["nodes"] is not None:
+                list_widget.item(list_widget.count() - 1).setToolTip(
+                    f"{entry['nodes']} nodes, {entry['tetrahedra']} tetrahedra")
+        return index
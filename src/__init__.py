@@ -23,12 +23,20 @@
 """This module is the main module of the package. It imports all the other modules and classes."""
 
 from .config import Config
+from .parallel import ChunkedExecutor
+from .profiler import Profiler, ProfilerController
+from .trajectory_recorder import TrajectoryRecorder
 from .mesh_loader import MeshLoader
+from .model_index import ModelIndex
 from .scene_builder import SceneBuilder
 from .elastic_object import ElasticObject
 from .material_loader import MaterialLoader
+from .field_map import FieldMap
+from .field_schedule import FieldSchedule
 from .magnetic_controller import MagneticController
 from .json_material_manager import JsonMaterialManager
 from .analysis_parameters import AnalysisParameters
 from .stress_analyzer import StressAnalyzer
-from .simulation_analyser import SimulationAnalyser, SimulationAnalysisController
+from .strain_monitor import StrainMonitor
+from .simulation_analyser import SimulationAnalyser, SimulationAnalysisController, ConvergenceMonitor
+from .live_update import LiveUpdateController
@@ -0,0 +1,142 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module saves the state of a simulation to a checkpoint and restores it, 
+so a later simulation can start from the deformed state instead of the undeformed mesh."""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+import Sofa.Core
+
+from src import MagneticController, SimulationAnalyser, SimulationAnalysisController
+
+
+def _find(root: Sofa.Core.Node, object_type: type) -> Optional[object]:
+    """Finds the first object of the given type in the root node.
+
+    Args:
+        root (Sofa.Core.Node): The root node.
+        object_type (type): The type of the object.
+
+    Returns:
+        Optional[object]: The object, or None if there is none.
+    """
+    return next((obj for obj in root.objects if isinstance(obj, object_type)), None)
+
+
+def _analyser(root: Sofa.Core.Node,
+              analyser: Optional[SimulationAnalyser]) -> Optional[SimulationAnalyser]:
+    """Returns the given analyser, or the analyser of the analysis controller of the scene.
+
+    Args:
+        root (Sofa.Core.Node): The root node.
+        analyser (Optional[SimulationAnalyser]): The analyser, if it is not part of the scene.
+
+    Returns:
+        Optional[SimulationAnalyser]: The analyser, or None if there is none.
+    """
+    if analyser is not None:
+        return analyser
+    controller = _find(root, SimulationAnalysisController)
+    return None if controller is None else controller.analyser
+
+
+def save_checkpoint(path: Path, root: Sofa.Core.Node,
+                    analyser: Optional[SimulationAnalyser] = None) -> None:
+    """Saves the positions and velocities of the nodes, the simulation time
+    and the state of the controllers and the analyser to a .npz file.
+
+    Args:
+        path (Path): The path of the .npz file.
+        root (Sofa.Core.Node): The root node of the simulation.
+        analyser (Optional[SimulationAnalyser], optional): An analyser that is not part of the scene. 
+            Defaults to the analyser of the analysis controller of the scene.
+    """
+    dofs = root.getChild('object').getObject('dofs')
+    checkpoint: Dict[str, np.ndarray] = {
+        "time": np.array(root.time.value),
+        "positions": np.array(dofs.position.value),
+        "velocities": np.array(dofs.velocity.value),
+    }
+
+    controller = _find(root, MagneticController)
+    if controller is not None:
+        for key, value in controller.get_state().items():
+            checkpoint[f"magnetic_controller/{key}"] = value
+
+    analyser = _analyser(root, analyser)
+    if analyser is not None:
+        for key, value in analyser.get_state().items():
+            checkpoint[f"analyser/{key}"] = value
+
+    np.savez_compressed(path, **checkpoint)
+
+
+def restore_checkpoint(path: Path, root: Sofa.Core.Node,
+                       analyser: Optional[SimulationAnalyser] = None) -> None:
+    """Restores a checkpoint into an initialized simulation before its first step.
+    The simulation may use different parameters, but has to use the same model.
+    States of objects the checkpoint or the scene do not contain are skipped.
+
+    Args:
+        path (Path): The path of the .npz file.
+        root (Sofa.Core.Node): The initialized root node of the simulation.
+        analyser (Optional[SimulationAnalyser], optional): An analyser that is not part of the scene. 
+            Defaults to the analyser of the analysis controller of the scene.
+
+    Raises:
+        FileNotFoundError: If the checkpoint does not exist.
+        ValueError: If the checkpoint belongs to a model with a different number of nodes.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"File {path} does not exist.")
+
+    with np.load(path) as data:
+        checkpoint = dict(data)
+
+    dofs = root.getChild('object').getObject('dofs')
+    if checkpoint["positions"].shape != np.shape(dofs.position.value):
+        raise ValueError("Checkpoint does not match the number of nodes of the model.")
+
+    with dofs.position.writeableArray() as positions:
+        positions[:] = checkpoint["positions"]
+    with dofs.velocity.writeableArray() as velocities:
+        velocities[:] = checkpoint["velocities"]
+    root.time.value = float(checkpoint["time"])
+
+    def state(prefix: str) -> Dict[str, np.ndarray]:
+        return {key[len(prefix):]: value for key, value in checkpoint.items()
+                if key.startswith(prefix)}
+
+    controller = _find(root, MagneticController)
+    controller_state = state("magnetic_controller/")
+    if controller is not None and controller_state:
+        controller.set_state(controller_state)
+
+    analyser = _analyser(root, analyser)
+    analyser_state = state("analyser/")
+    if analyser is not None and analyser_state:
+        analyser.set_state(analyser_state)
@@ -22,17 +22,62 @@
 
 """This module contains the configuration for the Sofa simulation."""
 
+from enum import Enum
+from pathlib import Path
 from typing import List, Tuple, Optional
 import numpy as np
 
 from .units import YoungsModulus, Density, Tesla
 from .analysis_parameters import AnalysisParameters
+from .field_schedule import FieldSchedule
 
 
 class Config:
     """This class contains the configuration for the Sofa simulation."""
+
+    class SceneProfile(Enum):
+        """Enum class for the components of the scene that handle contacts."""
+        CONTACT = 0
+        """Collision detection, contact constraints and the free motion animation loop."""
+        FREE = 1
+        """No collision and constraint components, for models that never touch anything."""
+
+    class BroadPhase(Enum):
+        """Enum class for the broad phase of the collision detection."""
+        AUTO = 0
+        """Selected by the number of collision elements of the scene, see `SceneBuilder`."""
+        BRUTE_FORCE = 1
+        """Tests all pairs of collision models, for scenes with few elements."""
+        PARALLEL_BRUTE_FORCE = 2
+        """Tests all pairs of collision models on several threads of the MultiThreading plugin."""
+        INCREMENTAL_SAP = 3
+        """Incremental sweep and prune over the elements, which also replaces the narrow phase."""
+
+    class SolverProfile(Enum):
+        """Enum class for the linear solver of the elastic object."""
+        AUTO = 0
+        """Selected by the number of nodes of the model, see `ElasticObject`."""
+        DIRECT = 1
+        """Sparse LDL factorization in every step."""
+        ITERATIVE = 2
+        """Conjugate gradient with a Jacobi preconditioner, for very large meshes."""
+        ASYNC = 3
+        """Sparse LDL factorization in a background thread, steps reuse the last factorization."""
+
+    class StrainMode(Enum):
+        """Enum class for the strain formulation of the FEM force field."""
+        SMALL = 0
+        """Linear elements without rotations, only valid for small deflections, see `StrainMonitor`."""
+        LARGE = 1
+        """Co-rotational elements, whose rotations are taken from their edges."""
+        POLAR = 2
+        """Co-rotational elements, whose rotations are taken from a polar decomposition."""
+        SVD = 3
+        """Co-rotational elements, whose rotations are taken from a singular value decomposition."""
+
     ### SOFA UI ###
     _show_force = True
+    _headless = False
     _is_first_launch = True
     _show_stress = False
     _stress_kwargs = {
@@ -46,6 +91,20 @@ class Config:
     _use_constraints = False
     _point_a = np.array([0, 0, 0])
     _point_b = np.array([0, 0, 0])
+    _surface_from_volume = False
+    _collision_triangles = None
+    _visual_triangles = None
+    _scene_profile = SceneProfile.CONTACT
+    _broad_phase = BroadPhase.AUTO
+    _solver_profile = SolverProfile.AUTO
+    _strain_mode = StrainMode.LARGE
+    _default_scales = {
+        "beam": 0.01,
+        "gripper_3_arm": 0.01,
+        "gripper_4_arm": 0.01,
+        "butterfly": 0.0002898551,
+        "simple_butterfly": 0.0002898551,
+    }
 
     ### External forces ###
     _use_gravity = True
@@ -54,6 +113,9 @@ class Config:
     _magnetic_dir = np.array([1, 0, 0])
     _b_field = np.array([0, 0, 0])
     _initial_dipole_moment = np.array([0, 0, 0])
+    _field_map_path = None
+    _field_schedule = None
+    _per_element_dipoles = False
 
     ### Material parameters ###
     _poisson_ratio = 0.0
@@ -67,6 +129,11 @@ class Config:
     ### Analysis ###
     _analysis_parameters = None
 
+    ### Performance ###
+    _lazy_torque_tolerance = None
+    _worker_count = 1
+    _profile_path = None
+
     @classmethod
     def to_list(cls) -> List:
         """Returns a list with all values of the configuration.
@@ -97,6 +164,20 @@ class Config:
             cls._remanence,
             cls._plugin_list,
             cls._analysis_parameters,
+            cls._lazy_torque_tolerance,
+            cls._field_map_path,
+            cls._field_schedule,
+            cls._worker_count,
+            cls._profile_path,
+            cls._headless,
+            cls._surface_from_volume,
+            cls._collision_triangles,
+            cls._visual_triangles,
+            cls._scene_profile,
+            cls._broad_phase,
+            cls._solver_profile,
+            cls._strain_mode,
+            cls._per_element_dipoles,
         ]
 
     @classmethod
@@ -109,11 +190,11 @@ class Config:
             config_list (List): List with all values of the configuration.
 
         Raises:
-            ValueError: If the list does not have the right amount of elements (21).
+            ValueError: If the list does not have the right amount of elements (35).
             ValueError: If a value in the list is in the wrong format or has an invalid value.
         """
-        if len(config_list) != 21:
-            raise ValueError("List does not have 21 Elements.")
+        if len(config_list) != 35:
+            raise ValueError("List does not have 35 Elements.")
 
         cls.set_show_force(config_list[0])
         cls._is_first_launch = config_list[1]
@@ -127,6 +208,66 @@ class Config:
             config_list[15], config_list[16], config_list[17], config_list[18])
         cls.set_plugin_list(config_list[19])
         cls.set_analysis_parameters(config_list[20])
+        cls.set_lazy_torque_tolerance(config_list[21])
+        cls.set_field_map(config_list[22])
+        cls.set_field_schedule(config_list[23])
+        cls.set_worker_count(config_list[24])
+        cls.set_profile_path(config_list[25])
+        cls.set_headless(config_list[26])
+        cls.set_surface_from_volume(config_list[27])
+        cls.set_level_of_detail(config_list[28], config_list[29])
+        cls.set_scene_profile(config_list[30])
+        cls.set_broad_phase(config_list[31])
+        cls.set_solver_profile(config_list[32])
+        cls.set_strain_mode(config_list[33])
+        cls.set_per_element_dipoles(config_list[34])
+
+    @classmethod
+    def get_scene_settings(cls) -> List:
+        """Returns the settings that are built into the scene. 
+        All other settings can be changed in a running simulation, see `src.live_update`.
+
+        Returns:
+            List: The settings that require a new scene when they change.
+        """
+        return [
+            cls._show_force,
+            cls._show_stress,
+            cls._stress_kwargs,
+            cls._name,
+            cls._scale,
+            cls._use_constraints,
+            cls._point_a,
+            cls._point_b,
+            cls._initial_dipole_moment,
+            cls._plugin_list,
+            cls._lazy_torque_tolerance,
+            cls._field_map_path,
+            cls._worker_count,
+            cls._profile_path,
+            cls._headless,
+            cls._surface_from_volume,
+            cls._collision_triangles,
+            cls._visual_triangles,
+            cls._scene_profile,
+            cls._broad_phase,
+            cls._solver_profile,
+            cls._strain_mode,
+            cls._per_element_dipoles,
+        ]
+
+    @classmethod
+    def scene_changed(cls, scene_settings: List) -> bool:
+        """Checks whether the current configuration requires a different scene.
+
+        Args:
+            scene_settings (List): The settings of the scene, as returned by `get_scene_settings`.
+
+        Returns:
+            bool: True, if a setting of the scene changed.
+        """
+        return any(not np.array_equal(previous, current) for previous, current
+                   in zip(scene_settings, cls.get_scene_settings()))
 
     @classmethod
     def set_show_force(cls, show_force: bool) -> None:
@@ -146,6 +287,25 @@ class Config:
         """
         return cls._show_force
 
+    @classmethod
+    def set_headless(cls, headless: bool) -> None:
+        """Sets whether the scene is built without any visual components, 
+        so it can run without a GUI or an OpenGL context.
+
+        Args:
+            headless (bool): True to build the scene without visual components.
+        """
+        cls._headless = headless
+
+    @classmethod
+    def get_headless(cls) -> bool:
+        """Returns whether the scene is built without any visual components.
+
+        Returns:
+            bool: True if the scene is built without visual components.
+        """
+        return cls._headless
+
     @classmethod
     def set_model(cls, name: str, scale: Optional[float] = None, custom_model: bool = False) -> None:
         """Set the values important for the model.
@@ -164,14 +324,7 @@ class Config:
             raise ValueError("Scale must be positive.")
 
         if scale is None:
-            scales = {
-                "beam": 0.01,
-                "gripper_3_arm": 0.01,
-                "gripper_4_arm": 0.01,
-                "butterfly": 0.0002898551,
-                "simple_butterfly": 0.0002898551,
-            }
-            scale = scales.get(name, 0.01)
+            scale = cls.get_default_scale(name)
 
         if custom_model:
             name = "../imported_models/"+name
@@ -179,6 +332,18 @@ class Config:
         cls._name = name
         cls._scale = scale
 
+    @classmethod
+    def get_default_scale(cls, name: str) -> float:
+        """Get the default scaling factor of a model.
+
+        Args:
+            name (str): The name of the model.
+
+        Returns:
+            float: The predefined scale for the example models and `0.01` for any other model.
+        """
+        return cls._default_scales.get(name, 0.01)
+
     @classmethod
     def get_name(cls) -> str:
         """Get the name of the model.
@@ -197,6 +362,150 @@ class Config:
         """
         return cls._scale
 
+    @classmethod
+    def set_surface_from_volume(cls, surface_from_volume: bool) -> None:
+        """Sets whether the visual model uses the boundary of the volumetric mesh 
+        instead of the surface mesh file. Models without a surface mesh file always use it.
+
+        Args:
+            surface_from_volume (bool): True to derive the surface from the volumetric mesh.
+        """
+        cls._surface_from_volume = surface_from_volume
+
+    @classmethod
+    def get_surface_from_volume(cls) -> bool:
+        """Returns whether the visual model uses the boundary of the volumetric mesh.
+
+        Returns:
+            bool: True if the surface is derived from the volumetric mesh.
+        """
+        return cls._surface_from_volume
+
+    @classmethod
+    def set_level_of_detail(cls, collision_triangles: Optional[int] = None,
+                            visual_triangles: Optional[int] = None) -> None:
+        """Sets the maximum number of triangles of the collision and the visual surface. 
+        Finer surfaces are replaced by a decimated boundary of the volumetric mesh.
+
+        Args:
+            collision_triangles (Optional[int], optional): The maximum number of triangles 
+                of the collision surface. None uses the full surface. Defaults to None.
+            visual_triangles (Optional[int], optional): The maximum number of triangles 
+                of the visual surface. None uses the full surface. Defaults to None.
+
+        Raises:
+            ValueError: If a number of triangles is less than 1.
+        """
+        for triangles in (collision_triangles, visual_triangles):
+            if triangles is not None and triangles < 1:
+                raise ValueError("Number of triangles must be positive.")
+        cls._collision_triangles = collision_triangles
+        cls._visual_triangles = visual_triangles
+
+    @classmethod
+    def get_level_of_detail(cls) -> Tuple[Optional[int], Optional[int]]:
+        """Returns the maximum number of triangles of the collision and the visual surface.
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: The maximum number of triangles 
+            of the collision and the visual surface, None for the full surfaces.
+        """
+        return cls._collision_triangles, cls._visual_triangles
+
+    @classmethod
+    def set_scene_profile(cls, scene_profile: SceneProfile = SceneProfile.CONTACT) -> None:
+        """Sets the components of the scene that handle contacts. If none is provided, works as a reset.
+
+        Args:
+            scene_profile (SceneProfile, optional): CONTACT for self-collision and contact constraints,
+                FREE for models deforming freely, whose fixed nodes are only held
+                by the FixedConstraint. Defaults to SceneProfile.CONTACT.
+
+        Raises:
+            ValueError: If scene_profile is no SceneProfile.
+        """
+        if not isinstance(scene_profile, cls.SceneProfile):
+            raise ValueError(f"{scene_profile} is no scene profile.")
+        cls._scene_profile = scene_profile
+
+    @classmethod
+    def get_scene_profile(cls) -> SceneProfile:
+        """Returns the components of the scene that handle contacts.
+
+        Returns:
+            SceneProfile: The scene profile.
+        """
+        return cls._scene_profile
+
+    @classmethod
+    def set_broad_phase(cls, broad_phase: BroadPhase = BroadPhase.AUTO) -> None:
+        """Sets the broad phase of the collision detection. If none is provided, works as a reset.
+
+        Args:
+            broad_phase (BroadPhase, optional): The broad phase. Defaults to BroadPhase.AUTO.
+
+        Raises:
+            ValueError: If broad_phase is no BroadPhase.
+        """
+        if not isinstance(broad_phase, cls.BroadPhase):
+            raise ValueError(f"{broad_phase} is no broad phase.")
+        cls._broad_phase = broad_phase
+
+    @classmethod
+    def get_broad_phase(cls) -> BroadPhase:
+        """Returns the broad phase of the collision detection.
+
+        Returns:
+            BroadPhase: The broad phase.
+        """
+        return cls._broad_phase
+
+    @classmethod
+    def set_solver_profile(cls, solver_profile: SolverProfile = SolverProfile.AUTO) -> None:
+        """Sets the linear solver of the elastic object. If none is provided, works as a reset.
+
+        Args:
+            solver_profile (SolverProfile, optional): The solver profile. Defaults to SolverProfile.AUTO.
+
+        Raises:
+            ValueError: If solver_profile is no SolverProfile.
+        """
+        if not isinstance(solver_profile, cls.SolverProfile):
+            raise ValueError(f"{solver_profile} is no solver profile.")
+        cls._solver_profile = solver_profile
+
+    @classmethod
+    def get_solver_profile(cls) -> SolverProfile:
+        """Returns the linear solver of the elastic object.
+
+        Returns:
+            SolverProfile: The solver profile.
+        """
+        return cls._solver_profile
+
+    @classmethod
+    def set_strain_mode(cls, strain_mode: StrainMode = StrainMode.LARGE) -> None:
+        """Sets the strain formulation of the FEM force field. If none is provided, works as a reset.
+
+        Args:
+            strain_mode (StrainMode, optional): The strain mode. Defaults to StrainMode.LARGE.
+
+        Raises:
+            ValueError: If strain_mode is no StrainMode.
+        """
+        if not isinstance(strain_mode, cls.StrainMode):
+            raise ValueError(f"{strain_mode} is no strain mode.")
+        cls._strain_mode = strain_mode
+
+    @classmethod
+    def get_strain_mode(cls) -> StrainMode:
+        """Returns the strain formulation of the FEM force field.
+
+        Returns:
+            StrainMode: The strain mode.
+        """
+        return cls._strain_mode
+
     @classmethod
     def set_external_forces(cls,
                             use_gravity: bool,
@@ -290,6 +599,44 @@ class Config:
         """
         return cls._initial_dipole_moment
 
+    @classmethod
+    def set_field_map(cls, path: Optional[str] = None) -> None:
+        """Sets the path of a field map that replaces the uniform magnetic field. 
+        If none is provided, the uniform magnetic field is used.
+
+        Args:
+            path (Optional[str], optional): The path of the .npz field map. Defaults to None.
+        """
+        cls._field_map_path = None if path is None else str(path)
+
+    @classmethod
+    def get_field_map_path(cls) -> Optional[str]:
+        """Returns the path of the field map.
+
+        Returns:
+            Optional[str]: The path of the field map, or None if the uniform magnetic field is used.
+        """
+        return cls._field_map_path
+
+    @classmethod
+    def set_field_schedule(cls, field_schedule: Optional[FieldSchedule] = None) -> None:
+        """Sets the schedule that changes the uniform magnetic field over time.
+        If none is provided, the magnetic field stays constant.
+
+        Args:
+            field_schedule (Optional[FieldSchedule], optional): The schedule. Defaults to None.
+        """
+        cls._field_schedule = field_schedule
+
+    @classmethod
+    def get_field_schedule(cls) -> Optional[FieldSchedule]:
+        """Returns the schedule that changes the uniform magnetic field over time.
+
+        Returns:
+            Optional[FieldSchedule]: The schedule, or None if the magnetic field stays constant.
+        """
+        return cls._field_schedule
+
     @classmethod
     def set_material_parameters(cls,
                                 poisson_ratio: float,
@@ -381,6 +728,7 @@ class Config:
                              'Sofa.Component.Constraint.Projective',
                              'Sofa.Component.LinearSolver.Direct',
                              'Sofa.Component.LinearSolver.Iterative',
+                             'Sofa.Component.LinearSolver.Preconditioner',
                              'Sofa.Component.SolidMechanics.FEM.Elastic',
                              'Sofa.Component.Topology.Container.Dynamic',
                              'Sofa.Component.Topology.Mapping',
@@ -530,16 +878,122 @@ class Config:
         """
         return cls._analysis_parameters
 
+    @classmethod
+    def set_lazy_torque_tolerance(cls, tolerance: Optional[float] = None) -> None:
+        """Sets the tolerance for lazy torque updates. Torques are only recalculated
+        for tetrahedra that rotated by more than this angle since their last update.
+        If none is provided, lazy updates are disabled.
+
+        Args:
+            tolerance (Optional[float], optional): The tolerance angle in rad. Defaults to None.
+
+        Raises:
+            ValueError: If the tolerance is negative.
+        """
+        if tolerance is not None and tolerance < 0:
+            raise ValueError("Tolerance must not be negative.")
+        cls._lazy_torque_tolerance = tolerance
+
+    @classmethod
+    def get_lazy_torque_tolerance(cls) -> Optional[float]:
+        """Returns the tolerance for lazy torque updates.
+
+        Returns:
+            Optional[float]: The tolerance angle in rad, or None if lazy updates are disabled.
+        """
+        return cls._lazy_torque_tolerance
+
+    @classmethod
+    def set_per_element_dipoles(cls, per_element_dipoles: bool = False) -> None:
+        """Sets whether the dipole moment of each tetrahedron is weighted with its own volume 
+        instead of the volume of the whole model. If none is provided, works as a reset.
+
+        Args:
+            per_element_dipoles (bool, optional): True to weight with the volume of each tetrahedron. 
+                Defaults to False.
+        """
+        cls._per_element_dipoles = per_element_dipoles
+
+    @classmethod
+    def get_per_element_dipoles(cls) -> bool:
+        """Returns whether the dipole moment of each tetrahedron is weighted with its own volume.
+
+        Returns:
+            bool: True if the volume of each tetrahedron is used.
+        """
+        return cls._per_element_dipoles
+
+    @classmethod
+    def set_worker_count(cls, workers: int = 1) -> None:
+        """Sets the number of threads the controllers split their calculations on.
+
+        Args:
+            workers (int, optional): The number of threads, 1 runs everything on the Sofa thread. 
+                Defaults to 1.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1.")
+        cls._worker_count = workers
+
+    @classmethod
+    def get_worker_count(cls) -> int:
+        """Returns the number of threads the controllers split their calculations on.
+
+        Returns:
+            int: The number of threads.
+        """
+        return cls._worker_count
+
+    @classmethod
+    def set_profile_path(cls, path: Optional[str] = None) -> None:
+        """Sets the file the profile of the simulation is written to when it ends.
+        If none is provided, the simulation is not profiled.
+
+        Args:
+            path (Optional[str], optional): The path of the .json or .csv file. Defaults to None.
+
+        Raises:
+            ValueError: If the file extension is neither .json nor .csv.
+        """
+        if path is not None and Path(path).suffix not in (".json", ".csv"):
+            raise ValueError("Profile must be a .json or .csv file.")
+        cls._profile_path = None if path is None else str(path)
+
+    @classmethod
+    def get_profile_path(cls) -> Optional[str]:
+        """Returns the file the profile of the simulation is written to.
+
+        Returns:
+            Optional[str]: The path of the file, or None if the simulation is not profiled.
+        """
+        return cls._profile_path
+
     @classmethod
     def reset(cls) -> None:
         """Reset the configuration to the default values.
         """
         cls.set_show_force(True)
+        cls.set_headless(False)
         cls.set_model('', 1)
+        cls.set_surface_from_volume(False)
+        cls.set_level_of_detail()
+        cls.set_scene_profile()
+        cls.set_broad_phase()
+        cls.set_solver_profile()
+        cls.set_strain_mode()
         cls.set_default_constraints()
         cls.set_external_forces(True, np.zeros(
             3, dtype=int), Tesla.from_T(.01), np.array([1, 0, 0]), np.zeros(3, dtype=int))
         cls.set_material_parameters(0., YoungsModulus(0), Density(0), Tesla(0))
         cls.set_plugin_list([""])
         cls.set_analysis_parameters()
+        cls.set_lazy_torque_tolerance()
+        cls.set_per_element_dipoles()
+        cls.set_worker_count()
+        cls.set_profile_path()
+        cls.set_field_map()
+        cls.set_field_schedule()
         cls._reset_stress_kwargs()
@@ -23,13 +23,117 @@
 """This module contains the ElasticObject class,
    which is used to create the elastic object that is simulated in the MSR."""
 
+from typing import Optional, Sequence
 import numpy as np
 import Sofa.Core
 from . import MeshLoader, Config
-from .mesh_loader import Mode
+from .mesh_loader import Mode, surface_node_indices, vertex_normals
 from .units import YoungsModulus, Density
 
 
+class VertexForce():
+    """View of the force acting on a single node of the elastic object.
+    Mimics a ConstantForceField acting on only one node."""
+
+    def __init__(self, force_field: Sofa.Core.Object, index: int) -> None:
+        """Initializes the view of the force at the given node.
+
+        Args:
+            force_field (Sofa.Core.Object): The ConstantForceField acting on all nodes.
+            index (int): The index of the node.
+        """
+        self._force_field = force_field
+        self._index = index
+
+    @property
+    def forces(self) -> np.ndarray:
+        """Gets the force acting on the node.
+
+        Returns:
+            np.ndarray: The force in the shape (1, 3).
+        """
+        return np.array(self._force_field.forces.value[self._index:self._index+1])
+
+    @forces.setter
+    def forces(self, value: Sequence) -> None:
+        """Sets the force acting on the node.
+
+        Args:
+            value (Sequence): The force in the shape (1, 3) or (3,).
+        """
+        with self._force_field.forces.writeableArray() as forces:
+            forces[self._index] = np.reshape(value, 3)
+
+
+class VertexForces():
+    """Compatibility view that allows to access the forces of the single ConstantForceField
+    acting on all nodes of the elastic object node by node."""
+
+    def __init__(self, force_field: Sofa.Core.Object, node_count: int) -> None:
+        """Initializes the view of the forces.
+
+        Args:
+            force_field (Sofa.Core.Object): The ConstantForceField acting on all nodes.
+            node_count (int): The number of nodes of the elastic object.
+        """
+        self._force_field = force_field
+        self._node_count = node_count
+
+    def __len__(self) -> int:
+        """Returns the number of nodes.
+
+        Returns:
+            int: The number of nodes.
+        """
+        return self._node_count
+
+    def __getitem__(self, index: int) -> VertexForce:
+        """Returns the view of the force acting on the node with the given index.
+
+        Args:
+            index (int): The index of the node.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            VertexForce: The view of the force.
+        """
+        if not -self._node_count <= index < self._node_count:
+            raise IndexError(f"Node {index} is not part of the model.")
+        return VertexForce(self._force_field, index % self._node_count)
+
+    def set_forces(self, nodes: np.ndarray, forces: np.ndarray) -> None:
+        """Sets the forces acting on the given nodes with a single write.
+
+        Args:
+            nodes (np.ndarray): The indices of the nodes of shape (K,).
+            forces (np.ndarray): The forces acting on the nodes of shape (K, 3).
+        """
+        with self._force_field.forces.writeableArray() as all_forces:
+            all_forces[nodes] = forces
+
+
+ITERATIVE_NODE_THRESHOLD = 50000
+"""Number of nodes, above which the automatic solver profile no longer factorizes the system matrix."""
+
+
+def select_solver_profile(node_count: int) -> Config.SolverProfile:
+    """Selects the linear solver for a model. The factorization of the direct solver 
+    is the fastest for the shipped models, but its time and memory grow faster than 
+    the iterations of the conjugate gradient for very large meshes.
+
+    Args:
+        node_count (int): The number of nodes of the volumetric mesh.
+
+    Returns:
+        Config.SolverProfile: The solver profile, never AUTO.
+    """
+    if node_count <= ITERATIVE_NODE_THRESHOLD:
+        return Config.SolverProfile.DIRECT
+    return Config.SolverProfile.ITERATIVE
+
+
 class ElasticObject():
     """Class that holds important parameters for
        the elastic object - the MSR - that is simulated."""
@@ -52,7 +156,9 @@ class ElasticObject():
         self.mesh = None
         self.mech_obj = None
         self.volume = None
+        self.magnetic_force_field = None
         self.vertex_forces = None
+        self.solver_profile = Config.get_solver_profile()
         self.FEM_force_field = None
         self.diagonal_mass = None
         self.remanence = Config.get_remanence()
@@ -60,12 +166,24 @@ class ElasticObject():
         # Add Object
         eo_node = self._root.addChild('object')
         self.node = eo_node
+        # The SOFA loader reads the mesh on creation, which gives the node count
+        # without parsing the mesh a second time
+        self.mesh = self._mesh_loader.load_mesh_into(eo_node, Mode.VOLUMETRIC)
+        if self.solver_profile == Config.SolverProfile.AUTO:
+            self.solver_profile = select_solver_profile(len(self.mesh.position.value))
         eo_node.addObject('EulerImplicitSolver', name="cg_odesolver",
                           rayleighStiffness=0.1, rayleighMass=0.1)
-        eo_node.addObject('SparseLDLSolver', name="linear_solver",
-                          template="CompressedRowSparseMatrixMat3x3d")
+        if self.solver_profile == Config.SolverProfile.ITERATIVE:
+            eo_node.addObject('PCGLinearSolver', name="linear_solver",
+                              iterations=1000, tolerance=1e-9, preconditioner="@preconditioner")
+            eo_node.addObject('JacobiPreconditioner', name="preconditioner")
+        else:
+            # The asynchronous solver factorizes in the background and solves with the last factorization
+            solver = ('AsyncSparseLDLSolver' if self.solver_profile == Config.SolverProfile.ASYNC
+                      else 'SparseLDLSolver')
+            eo_node.addObject(solver, name="linear_solver",
+                              template="CompressedRowSparseMatrixMat3x3d")
 
-        self.mesh = self._mesh_loader.load_mesh_into(eo_node, Mode.VOLUMETRIC)
         eo_node.addObject('TetrahedronSetTopologyContainer', name="topo",
                           src=self._mesh_loader.reference(Mode.VOLUMETRIC))
         self.mech_obj = eo_node.addObject(
@@ -79,7 +197,7 @@ class ElasticObject():
             'TetrahedronFEMForceField',
             template="Vec3d",
             name="FEM",
-            method="large",
+            method=Config.get_strain_mode().name.lower(),
             poissonRatio=poisson_ratio,
             youngModulus=youngs_modulus.Pa,
             # plasticYieldThreshold = 2e-5,
@@ -90,7 +208,7 @@ class ElasticObject():
             **Config.get_stress_kwargs(),
         )
 
-        if Config.get_show_stress():
+        if Config.get_show_stress() and not Config.get_headless():
             eo_node.addObject(
                 "VisualStyle",
                 displayFlags="hideVisual showBehaviorModels showForceFields hideCollisionModels",
@@ -105,20 +223,101 @@ class ElasticObject():
                               drawBoxes=1 if visualize_constraints else 0)
             eo_node.addObject('FixedConstraint',
                               name='FixedConstraint', indices='@constraint_roi.indices')
-        eo_node.addObject('LinearSolverConstraintCorrection')
+
+        collision_triangles, visual_triangles = Config.get_level_of_detail()
+        if Config.get_scene_profile() == Config.SceneProfile.CONTACT:
+            self._add_collision(eo_node, collision_triangles)
+
+        # Add visuals
+        if Config.get_headless():
+            pos = np.array(self.mesh.position.value)
+        else:
+            visu = eo_node.addChild("VisualModel")
+            barycentric = False
+            if visual_triangles is None and not self._mesh_loader.surface_from_volume:
+                visu.loader = self._mesh_loader.load_mesh_into(visu, Mode.SURFACE)
+                ogl = visu.addObject('OglModel', name="model", src=self._mesh_loader.reference(
+                    Mode.SURFACE), color=[1., 1., 1.], updateNormals=False)
+                # The vertices of the surface mesh lie on nodes of the volume,
+                # which are no longer the first nodes once the volume is reordered.
+                # The positions read by SOFA are compared, as its order of the vertices counts
+                try:
+                    visual_nodes = surface_node_indices(np.array(self.mesh.position.value),
+                                                        np.array(visu.loader.position.value))
+                except ValueError:
+                    # Surfaces apart from the nodes follow the tetrahedra they lie in
+                    visual_nodes, barycentric = None, True
+            else:
+                if visual_triangles is None:
+                    # The derived surface keeps all nodes of the volume for the IdentityMapping
+                    visual_nodes, surface = None, self._mesh_loader.read(Mode.SURFACE)
+                else:
+                    visual_nodes, surface = self._mesh_loader.read_level_of_detail(
+                        visual_triangles)
+                ogl = visu.addObject('OglModel', name="model",
+                                     position=np.array(surface.positions),
+                                     triangles=np.array(surface.triangles),
+                                     normal=vertex_normals(surface),
+                                     color=[1., 1., 1.], updateNormals=False)
+            if barycentric:
+                visu.addObject('BarycentricMapping')
+            elif visual_nodes is None:
+                visu.addObject('IdentityMapping')
+            else:
+                visu.addObject('SubsetMapping', indices=np.array(visual_nodes))
+            pos = np.array(ogl.position.value)
+        # SOFA 24.12 seems to break the automatic calculation of the bounding box
+        self._root.bbox = np.stack((pos.min(axis=0), pos.max(axis=0)))
+
+        # One force field holding the forces of all nodes,
+        # so the forces can be updated with a single write per step
+        node_count = len(self.mesh.position.value)
+        self.magnetic_force_field = eo_node.addObject(
+            'ConstantForceField',
+            name="magnetic_forces",
+            indices=list(range(node_count)),
+            forces=np.zeros((node_count, 3)),
+            showArrowSize="0.001" if Config.get_show_force() else "0"
+        )
+        self.vertex_forces = VertexForces(
+            self.magnetic_force_field, node_count)
+
+    def _add_collision(self, eo_node: Sofa.Core.Node, collision_triangles: Optional[int]) -> None:
+        """Adds the constraint correction and the self-collision models of the surface.
+
+        Args:
+            eo_node (Sofa.Core.Node): The node of the object.
+            collision_triangles (Optional[int]): The number of triangles of the decimated
+                collision surface, None for the full surface of the volume.
+        """
+        # The iterative solver can not invert the system for the constraints
+        if self.solver_profile == Config.SolverProfile.ITERATIVE:
+            eo_node.addObject('UncoupledConstraintCorrection')
+        else:
+            eo_node.addObject('LinearSolverConstraintCorrection')
 
         # Add Surface
-        surf = eo_node.addChild('ExtractSurface')
-        surf.addObject('TriangleSetTopologyContainer',
-                       name="Container", position="@../topo.position")
-        surf.addObject('TriangleSetTopologyModifier', name="Modifier")
-        surf.addObject('Tetra2TriangleTopologicalMapping',
-                       name="SurfaceExtractMapping", input="@../topo", output="@Container")
+        if collision_triangles is None:
+            surf = eo_node.addChild('ExtractSurface')
+            surf.addObject('TriangleSetTopologyContainer',
+                           name="Container", position="@../topo.position")
+            surf.addObject('TriangleSetTopologyModifier', name="Modifier")
+            surf.addObject('Tetra2TriangleTopologicalMapping',
+                           name="SurfaceExtractMapping", input="@../topo", output="@Container")
+
+            collision = surf.addChild('Surf')
+            collision.addObject('TriangleSetTopologyContainer',
+                                name="Container", src="@../Container")
+        else:
+            # Decimated surface, whose nodes are a subset of the nodes of the volume
+            collision_nodes, collision_surface = self._mesh_loader.read_level_of_detail(
+                collision_triangles)
+            collision = eo_node.addChild('Surf')
+            collision.addObject('TriangleSetTopologyContainer', name="Container",
+                                position=np.array(collision_surface.positions),
+                                triangles=np.array(collision_surface.triangles))
 
         # Add collision
-        collision = surf.addChild('Surf')
-        collision.addObject('TriangleSetTopologyContainer',
-                            name="Container", src="@../Container")
         collision.addObject('MechanicalObject', name="surfaceDOFs")
         collision.addObject('PointCollisionModel',
                             name="PointCollisionModel", selfCollision=True)
@@ -126,26 +325,10 @@ class ElasticObject():
                             name="TriangleCollisionModel", selfCollision=True)
         collision.addObject('LineCollisionModel',
                             name="LineCollisionModel", selfCollision=True)
-        collision.addObject('IdentityMapping', name="CollisionMapping",
-                            input="@../../dofs", output="@surfaceDOFs")
-
-        # Add visuals
-        visu = eo_node.addChild("VisualModel")
-        visu.loader = self._mesh_loader.load_mesh_into(visu, Mode.SURFACE)
-        ogl = visu.addObject('OglModel', name="model", src=self._mesh_loader.reference(
-            Mode.SURFACE), color=[1., 1., 1.], updateNormals=False)
-        visu.addObject('IdentityMapping')
-        # SOFA 24.12 seems to break the automatic calculation of the bounding box
-        pos: np.ndarray = ogl.position.value
-        self._root.bbox = np.stack((pos.min(axis=0), pos.max(axis=0)))
-
-        l = len(self.mesh.position.value)
-        self.vertex_forces = [None] * l
-        for i in range(l):
-            self.vertex_forces[i] = eo_node.addObject(
-                'ConstantForceField',
-                indices=f"{i}",
-                name=f"force_{i}",
-                forces=[0, 0, 0],
-                showArrowSize="0.001" if Config.get_show_force() else "0"
-            )
+        if collision_triangles is None:
+            collision.addObject('IdentityMapping', name="CollisionMapping",
+                                input="@../../dofs", output="@surfaceDOFs")
+        else:
+            collision.addObject('SubsetMapping', name="CollisionMapping",
+                                input="@../dofs", output="@surfaceDOFs",
+                                indices=np.array(collision_nodes))
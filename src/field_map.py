@@ -0,0 +1,218 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the FieldMap class, which describes a spatially varying magnetic field."""
+
+from pathlib import Path
+from typing import Optional
+import numpy as np
+
+
+class FieldMap:
+    """This class describes a magnetic field that is sampled on a regular 3D grid.
+    The field between the grid points is trilinearly interpolated, 
+    the field outside of the grid is the field at the closest point of the grid.
+    """
+
+    def __init__(self, field: np.ndarray, origin: np.ndarray, spacing: np.ndarray) -> None:
+        """Initializes the field map.
+
+        Args:
+            field (np.ndarray): Array of shape (X, Y, Z, 3) that contains the magnetic flux density 
+                in T at each grid point.
+            origin (np.ndarray): The position of the grid point with index (0, 0, 0).
+            spacing (np.ndarray): The distance between two grid points along each axis. 
+                A scalar is used for all axes.
+
+        Raises:
+            ValueError: If the field does not have the shape (X, Y, Z, 3) with at least two points per axis.
+            ValueError: If the origin does not have the shape (3,).
+            ValueError: If the spacing is not positive.
+        """
+        field = np.asarray(field, dtype=float)
+        origin = np.asarray(origin, dtype=float)
+        spacing = np.broadcast_to(
+            np.asarray(spacing, dtype=float), (3,)).copy()
+
+        if field.ndim != 4 or field.shape[3] != 3:
+            raise ValueError("Field must have the shape (X, Y, Z, 3).")
+        if min(field.shape[:3]) < 2:
+            raise ValueError("Field must have at least two points per axis.")
+        if origin.shape != (3,):
+            raise ValueError("Origin must have the shape (3,).")
+        if np.any(spacing <= 0):
+            raise ValueError("Spacing must be positive.")
+
+        self._field = field
+        self._shape = np.array(field.shape[:3])
+        self._origin = origin
+        self._spacing = spacing
+
+        self._inverse_spacing = 1 / spacing
+
+        # Flat offsets of the eight corners of a cell, with the z index changing fastest
+        corners = np.array(np.meshgrid(
+            [0, 1], [0, 1], [0, 1], indexing='ij')).reshape(3, -1)
+        self._corner_offsets = np.ravel_multi_index(corners, field.shape[:3])
+        self._flat_field = field.reshape(-1, 3)
+
+        # Cell lookup of the last evaluation
+        self._cells = None
+        self._coefficients = None
+
+    @classmethod
+    def load(cls, path: Path, origin: Optional[np.ndarray] = None,
+             spacing: Optional[np.ndarray] = None) -> "FieldMap":
+        """Loads a field map from a file. A .npz file has to contain the arrays 
+        `field`, `origin` and `spacing`, a .npy file only contains the field, 
+        so origin and spacing have to be given.
+
+        Args:
+            path (Path): The path of the file.
+            origin (Optional[np.ndarray], optional): The origin of the grid. 
+                Overrides the origin of a .npz file. Defaults to None.
+            spacing (Optional[np.ndarray], optional): The spacing of the grid. 
+                Overrides the spacing of a .npz file. Defaults to None.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is neither a .npz nor a .npy file.
+            ValueError: If origin or spacing are missing.
+
+        Returns:
+            FieldMap: The loaded field map.
+        """
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"File {path} does not exist.")
+
+        if path.suffix == ".npz":
+            with np.load(path) as data:
+                field = data["field"]
+                if origin is None and "origin" in data:
+                    origin = data["origin"]
+                if spacing is None and "spacing" in data:
+                    spacing = data["spacing"]
+        elif path.suffix == ".npy":
+            field = np.load(path)
+        else:
+            raise ValueError("Field map must be a .npz or .npy file.")
+
+        if origin is None or spacing is None:
+            raise ValueError("Origin and spacing of the field map are missing.")
+        return cls(field, origin, spacing)
+
+    def get_field(self) -> np.ndarray:
+        """Returns the sampled field.
+
+        Returns:
+            np.ndarray: Array of shape (X, Y, Z, 3).
+        """
+        return self._field
+
+    def get_origin(self) -> np.ndarray:
+        """Returns the position of the first grid point.
+
+        Returns:
+            np.ndarray: The origin of the grid.
+        """
+        return self._origin
+
+    def get_spacing(self) -> np.ndarray:
+        """Returns the distance between two grid points along each axis.
+
+        Returns:
+            np.ndarray: The spacing of the grid.
+        """
+        return self._spacing
+
+    def evaluate(self, points: np.ndarray) -> np.ndarray:
+        """Evaluates the field at the given points.
+        The cells of the points are cached, so the interpolation coefficients 
+        are only calculated again for points that moved to another cell.
+
+        Args:
+            points (np.ndarray): Array of shape (N, 3) with the positions to evaluate the field at.
+
+        Returns:
+            np.ndarray: Array of shape (N, 3) with the magnetic flux density in T at each point.
+        """
+        grid_positions = np.clip((points - self._origin) * self._inverse_spacing,
+                                 0, self._shape - 1)
+        cells = np.minimum(grid_positions.astype(np.intp), self._shape - 2)
+
+        if self._cells is None or len(self._cells) != len(cells):
+            self._cells = cells
+            self._coefficients = self._interpolation_coefficients(cells)
+        else:
+            moved = np.flatnonzero((cells != self._cells).any(axis=1))
+            if len(moved) > 0:
+                self._cells[moved] = cells[moved]
+                self._coefficients[:, moved] = \
+                    self._interpolation_coefficients(cells[moved])
+
+        # Local coordinates within the cells, one contiguous array per axis
+        x, y, z = np.ascontiguousarray(
+            (grid_positions - cells).T)[:, :, np.newaxis]
+        a = self._coefficients
+
+        # a0 + a2 y + z (a3 + a6 y) + x (a1 + a4 y + z (a5 + a7 y)), evaluated in place
+        xz = a[7] * y
+        xz += a[5]
+        xz *= z
+        x_terms = a[4] * y
+        x_terms += a[1]
+        x_terms += xz
+        x_terms *= x
+        z_terms = a[6] * y
+        z_terms += a[3]
+        z_terms *= z
+        result = a[2] * y
+        result += a[0]
+        result += z_terms
+        result += x_terms
+        return result
+
+    def _interpolation_coefficients(self, cells: np.ndarray) -> np.ndarray:
+        """Calculates the coefficients of the trilinear interpolation 
+        a0 + a1 x + a2 y + a3 z + a4 xy + a5 xz + a6 yz + a7 xyz 
+        within the given cells, with x, y and z being the local coordinates in [0, 1].
+
+        Args:
+            cells (np.ndarray): Array of shape (N, 3) with the grid indices of the cells.
+
+        Returns:
+            np.ndarray: Array of shape (8, N, 3) with the coefficients a0 to a7.
+        """
+        base = np.ravel_multi_index(cells.T, self._shape)
+        c = self._flat_field[base + self._corner_offsets[:, np.newaxis]]
+
+        coefficients = np.empty_like(c)
+        coefficients[0] = c[0]
+        coefficients[1] = c[4] - c[0]
+        coefficients[2] = c[2] - c[0]
+        coefficients[3] = c[1] - c[0]
+        coefficients[4] = c[6] - c[4] - c[2] + c[0]
+        coefficients[5] = c[5] - c[4] - c[1] + c[0]
+        coefficients[6] = c[3] - c[2] - c[1] + c[0]
+        coefficients[7] = c[7] - c[6] - c[5] - c[3] + c[4] + c[2] + c[1] - c[0]
+        return coefficients
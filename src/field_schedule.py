@@ -0,0 +1,261 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the FieldSchedule class, which describes a time-varying uniform magnetic field."""
+
+import warnings
+from enum import Enum
+from pathlib import Path
+import numpy as np
+
+# Maximum relative change of the period by rounding it to a whole number of steps
+PERIOD_TOLERANCE = 0.01
+
+
+class FieldSchedule:
+    """This class describes how the uniform magnetic field changes over time.
+    A schedule is compiled into a table with the field of every simulation step,
+    so the simulation only has to look up the field of the current step.
+    """
+
+    class Kind(Enum):
+        """Enum class for the different kinds of schedules."""
+        ROTATING = 0
+        SINUSOIDAL = 1
+        KEYFRAMES = 2
+
+    def __init__(self, kind: Kind, **parameters) -> None:
+        """Initializes the schedule. Use the factory methods instead of calling this directly.
+
+        Args:
+            kind (Kind): The kind of the schedule.
+            **parameters: The parameters of the schedule.
+        """
+        self.kind = kind
+        self.parameters = parameters
+
+    def __repr__(self) -> str:
+        """Returns a string representation of the class.
+
+        Returns:
+            str: The string representation of the class.
+        """
+        return f"FieldSchedule({self.kind.name}, {self.parameters})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the kind and the parameters of two schedules.
+
+        Args:
+            other (object): The other schedule.
+
+        Returns:
+            bool: True, if both schedules describe the same field.
+        """
+        if not isinstance(other, FieldSchedule):
+            return NotImplemented
+        return (self.kind == other.kind and self.parameters.keys() == other.parameters.keys()
+                and all(np.array_equal(value, other.parameters[key])
+                        for key, value in self.parameters.items()))
+
+    @classmethod
+    def rotating(cls, magnitude: float, frequency: float,
+                 axis: np.ndarray = np.array([0, 0, 1]),
+                 start_dir: np.ndarray = np.array([1, 0, 0])) -> "FieldSchedule":
+        """Creates a schedule for a field of constant magnitude that rotates around an axis.
+
+        Args:
+            magnitude (float): The magnitude of the field in T.
+            frequency (float): The number of rotations per second. 
+                Negative frequencies rotate in the opposite direction.
+            axis (np.ndarray, optional): The rotation axis. Defaults to np.array([0, 0, 1]).
+            start_dir (np.ndarray, optional): The direction of the field at time 0. 
+                Only the part orthogonal to the axis is used. Defaults to np.array([1, 0, 0]).
+
+        Raises:
+            ValueError: If the frequency is 0.
+            ValueError: If the start direction is parallel to the axis.
+
+        Returns:
+            FieldSchedule: The rotating schedule.
+        """
+        if frequency == 0:
+            raise ValueError("Frequency must not be 0.")
+        axis = np.array(axis, dtype=float)
+        axis /= np.linalg.norm(axis)
+        start_dir = np.array(start_dir, dtype=float)
+        start_dir -= np.dot(start_dir, axis) * axis
+        if np.isclose(np.linalg.norm(start_dir), 0):
+            raise ValueError("Start direction must not be parallel to the axis.")
+        start_dir /= np.linalg.norm(start_dir)
+        return cls(cls.Kind.ROTATING, magnitude=float(magnitude), frequency=float(frequency),
+                   start_dir=start_dir, orthogonal_dir=np.cross(axis, start_dir))
+
+    @classmethod
+    def sinusoidal(cls, amplitude: np.ndarray, frequency: float,
+                   offset: np.ndarray = np.zeros(3), phase: float = 0.) -> "FieldSchedule":
+        """Creates a schedule for a field that oscillates along a fixed direction,
+        i.e. `offset + amplitude * sin(2 pi frequency t + phase)`.
+
+        Args:
+            amplitude (np.ndarray): The amplitude vector of the field in T.
+            frequency (float): The number of oscillations per second.
+            offset (np.ndarray, optional): The constant part of the field in T. Defaults to np.zeros(3).
+            phase (float, optional): The phase at time 0 in rad. Defaults to 0.
+
+        Raises:
+            ValueError: If the frequency is not positive.
+            ValueError: If amplitude or offset do not have shape (3,).
+
+        Returns:
+            FieldSchedule: The sinusoidal schedule.
+        """
+        if frequency <= 0:
+            raise ValueError("Frequency must be positive.")
+        amplitude = np.array(amplitude, dtype=float)
+        offset = np.array(offset, dtype=float)
+        if amplitude.shape != (3,) or offset.shape != (3,):
+            raise ValueError("Amplitude and offset must have shape [x,y,z].")
+        return cls(cls.Kind.SINUSOIDAL, amplitude=amplitude, frequency=float(frequency),
+                   offset=offset, phase=float(phase))
+
+    @classmethod
+    def keyframes(cls, times: np.ndarray, fields: np.ndarray) -> "FieldSchedule":
+        """Creates a schedule that linearly interpolates between the fields at the given times.
+        Before the first and after the last keyframe, the field of that keyframe is held.
+
+        Args:
+            times (np.ndarray): Array of shape (K,) with the strictly increasing, 
+                non-negative times in s.
+            fields (np.ndarray): Array of shape (K, 3) with the fields in T.
+
+        Raises:
+            ValueError: If there are no keyframes or the shapes do not match.
+            ValueError: If the times are not strictly increasing or negative.
+
+        Returns:
+            FieldSchedule: The keyframe schedule.
+        """
+        times = np.array(times, dtype=float)
+        fields = np.array(fields, dtype=float)
+        if times.ndim != 1 or len(times) == 0 or fields.shape != (len(times), 3):
+            raise ValueError("Keyframes must have shapes (K,) and (K, 3).")
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("Keyframe times must be strictly increasing.")
+        # The simulation starts at 0 s, so the table needs at least one step
+        if times[0] < 0:
+            raise ValueError("Keyframe times must not be negative.")
+        return cls(cls.Kind.KEYFRAMES, times=times, fields=fields)
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "FieldSchedule":
+        """Creates a keyframe schedule from a CSV file with the columns `t, bx, by, bz`.
+        The file may start with a header line.
+
+        Args:
+            path (Path): The path of the CSV file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file does not have four columns.
+
+        Returns:
+            FieldSchedule: The keyframe schedule.
+        """
+        path = Path(path)
+        if not path.is_file():
+            raise FileNotFoundError(f"File {path} does not exist.")
+
+        with open(path, encoding="utf-8") as file:
+            first_line = file.readline()
+        try:
+            [float(value) for value in first_line.split(",")]
+            skiprows = 0
+        except ValueError:
+            skiprows = 1
+
+        data = np.loadtxt(path, delimiter=",", skiprows=skiprows, ndmin=2)
+        if data.shape[1] != 4:
+            raise ValueError("CSV file must have the columns t, bx, by, bz.")
+        return cls.keyframes(data[:, 0], data[:, 1:])
+
+    def is_periodic(self) -> bool:
+        """Returns whether the schedule repeats itself.
+
+        Returns:
+            bool: True for rotating and sinusoidal schedules, False for keyframes.
+        """
+        return self.kind != self.Kind.KEYFRAMES
+
+    def sample(self, times: np.ndarray) -> np.ndarray:
+        """Evaluates the schedule at the given times.
+
+        Args:
+            times (np.ndarray): Array of shape (N,) with the times in s.
+
+        Returns:
+            np.ndarray: Array of shape (N, 3) with the fields in T.
+        """
+        times = np.asarray(times, dtype=float)
+        p = self.parameters
+        if self.kind == self.Kind.ROTATING:
+            angles = 2 * np.pi * p["frequency"] * times[:, np.newaxis]
+            return p["magnitude"] * (np.cos(angles) * p["start_dir"]
+                                     + np.sin(angles) * p["orthogonal_dir"])
+        if self.kind == self.Kind.SINUSOIDAL:
+            angles = 2 * np.pi * p["frequency"] * times[:, np.newaxis] + p["phase"]
+            return p["offset"] + np.sin(angles) * p["amplitude"]
+        return np.stack([np.interp(times, p["times"], p["fields"][:, axis])
+                         for axis in range(3)], axis=1)
+
+    def compile(self, dt: float) -> np.ndarray:
+        """Compiles the schedule into a table with the field at the start of each simulation step.
+        Periodic schedules are compiled for one period, which is rounded to a whole number of steps,
+        and are meant to be looped. A warning is issued if the rounding changes the period 
+        by more than `PERIOD_TOLERANCE`. Keyframe schedules are compiled up to the last keyframe
+        and the last field is meant to be held.
+
+        Args:
+            dt (float): The time difference between each simulation step in s.
+
+        Raises:
+            ValueError: If dt is not positive or the period of a periodic schedule is shorter than 
+                two steps, so the field cannot be resolved.
+
+        Returns:
+            np.ndarray: Array of shape (S, 3) with the field of step i in row i.
+        """
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        if self.is_periodic():
+            period = 1 / abs(self.parameters["frequency"])
+            if period < 2 * dt:
+                raise ValueError(f"The period of {period} s is shorter than two steps of {dt} s, "
+                                 "decrease dt or the frequency")
+            steps = round(period / dt)
+            if abs(steps * dt - period) > PERIOD_TOLERANCE * period:
+                warnings.warn(f"The period of {period} s is changed to {steps * dt} s, "
+                              f"as it is not a multiple of dt = {dt} s.", RuntimeWarning)
+            # Stretch the period slightly so that the looped table stays continuous
+            return self.sample(np.arange(steps) * period / steps)
+        steps = int(np.ceil(self.parameters["times"][-1] / dt)) + 1
+        return self.sample(np.arange(steps) * dt)
+
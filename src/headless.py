@@ -0,0 +1,388 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module runs simulations without the SOFA GUI, e.g. on compute nodes without a display.
+
+The simulation is configured by a JSON file, for example:
+```
+{
+    "model": "beam",
+    "magnetic_force": 0.05,
+    "magnetic_dir": [0, 0, 1],
+    "poisson_ratio": 0.47,
+    "youngs_modulus": 1e8,
+    "density": 1100,
+    "remanence": 0.35
+}
+```
+The material parameters are required, all other settings are optional. 
+See `apply_settings` for all keys. Run `python -m src.headless --help` for the command line options.
+"""
+
+import argparse
+from enum import Enum
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+import Sofa
+import Sofa.Core
+import Sofa.Simulation
+
+from src import (Config, ConvergenceMonitor, FieldSchedule, SimulationAnalyser,
+                 TrajectoryRecorder, sofa_instantiator)
+from src.checkpoint import restore_checkpoint, save_checkpoint
+from src.units import YoungsModulus, Density, Tesla
+
+
+REQUIRED_SETTINGS = ["model", "poisson_ratio", "youngs_modulus", "density", "remanence"]
+
+_schedule_factories = {
+    "rotating": FieldSchedule.rotating,
+    "sinusoidal": FieldSchedule.sinusoidal,
+    "keyframes": FieldSchedule.keyframes,
+    "csv": FieldSchedule.from_csv,
+}
+
+
+def _enum_setting(settings: Dict[str, Any], key: str, default: Enum) -> Enum:
+    """Returns the member of the enum of the default, whose lower case name is the setting.
+
+    Args:
+        settings (Dict[str, Any]): The settings.
+        key (str): The key of the setting.
+        default (Enum): The member if the setting is missing.
+
+    Raises:
+        ValueError: If the setting is no string or no member of the enum.
+
+    Returns:
+        Enum: The member.
+    """
+    value = settings.get(key, default.name.lower())
+    members = type(default).__members__
+    if not isinstance(value, str) or value.upper() not in members:
+        allowed = ", ".join(name.lower() for name in members)
+        raise ValueError(f"Invalid {key}: {value!r}, must be one of {allowed}.")
+    return members[value.upper()]
+
+
+def apply_settings(settings: Dict[str, Any]) -> None:
+    """Resets the configuration and applies the given settings for a headless run.
+
+    The following keys are supported:
+        - model (str): The name of the model.
+        - scale (float): The scaling factor. Defaults to the default scale of the model.
+        - custom_model (bool): True, if the model is an imported model. Defaults to False.
+        - gravity (List[float] | None): The gravity vector, None disables gravity. 
+          Defaults to [0, -9.81, 0].
+        - magnetic_force (float): The strength of the magnetic field in T. Defaults to 0.01.
+        - magnetic_dir (List[float]): The direction of the magnetic field. Defaults to [1, 0, 0].
+        - initial_dipole_moment (List[float]): Defaults to [1, 0, 0].
+        - poisson_ratio (float): The Poisson's ratio.
+        - youngs_modulus (float): The Young's modulus in Pa.
+        - density (float): The density in kg/m^3.
+        - remanence (float): The remanence in T.
+        - constraints (List[List[float]] | None): The corners of the box of fixed nodes, 
+          None uses the default constraints of the model. Defaults to None.
+        - stress (bool): True to calculate the von Mises stress. Defaults to False.
+        - field_map (str): The path of a field map. Defaults to None.
+        - field_schedule (Dict): The schedule of the field, with the key `type` 
+          (rotating, sinusoidal, keyframes or csv) and the arguments 
+          of the corresponding `FieldSchedule` factory. Defaults to None.
+        - collision_triangles (int): The maximum number of triangles of the collision surface, 
+          None uses the full surface. Defaults to None.
+        - scene_profile (str): contact for self-collision, free to skip the collision and 
+          constraint components. Defaults to contact.
+        - broad_phase (str): auto, brute_force, parallel_brute_force or incremental_sap, 
+          see `Config.BroadPhase`. Defaults to auto.
+        - solver_profile (str): auto, direct, iterative or async, see `Config.SolverProfile`. 
+          Defaults to auto.
+        - strain_mode (str): small, large, polar or svd, see `Config.StrainMode`. Defaults to large.
+        - per_element_dipoles (bool): True to weight the dipole moment of each tetrahedron 
+          with its own volume. Defaults to False.
+        - lazy_torque_tolerance (float): Defaults to None.
+        - worker_count (int): Defaults to 1.
+        - profile (str): The path of the profile summary. Defaults to None.
+
+    Args:
+        settings (Dict[str, Any]): The settings.
+
+    Raises:
+        ValueError: If a required setting is missing or a setting is unknown.
+    """
+    missing = [key for key in REQUIRED_SETTINGS if key not in settings]
+    if missing:
+        raise ValueError(f"Missing settings: {', '.join(missing)}")
+
+    Config.reset()
+    Config.set_default_plugin_list()
+    Config.set_headless(True)
+    Config.set_show_force(False)
+
+    Config.set_model(settings["model"], settings.get("scale"),
+                     settings.get("custom_model", False))
+
+    gravity = settings.get("gravity", [0, -9.81, 0])
+    Config.set_external_forces(
+        gravity is not None,
+        np.array(gravity if gravity is not None else [0, 0, 0], dtype=float),
+        Tesla.from_T(settings.get("magnetic_force", 0.01)),
+        np.array(settings.get("magnetic_dir", [1, 0, 0]), dtype=float),
+        np.array(settings.get("initial_dipole_moment", [1, 0, 0]), dtype=float),
+    )
+    Config.set_material_parameters(
+        settings["poisson_ratio"],
+        YoungsModulus.from_Pa(settings["youngs_modulus"]),
+        Density.from_kgpm3(settings["density"]),
+        Tesla.from_T(settings["remanence"]),
+    )
+
+    constraints = settings.get("constraints")
+    if constraints is None:
+        Config.set_default_constraints()
+    else:
+        Config.set_constraints(np.array(constraints[0], dtype=float),
+                               np.array(constraints[1], dtype=float))
+
+    Config.set_stress_kwargs(settings.get("stress", False))
+    Config.set_field_map(settings.get("field_map"))
+    schedule = settings.get("field_schedule")
+    if schedule is not None:
+        schedule = dict(schedule)
+        kind = schedule.pop("type")
+        if kind not in _schedule_factories:
+            raise ValueError(f"Unknown field schedule {kind}.")
+        Config.set_field_schedule(_schedule_factories[kind](**schedule))
+    Config.set_level_of_detail(settings.get("collision_triangles"))
+    Config.set_scene_profile(_enum_setting(settings, "scene_profile", Config.SceneProfile.CONTACT))
+    Config.set_broad_phase(_enum_setting(settings, "broad_phase", Config.BroadPhase.AUTO))
+    Config.set_solver_profile(_enum_setting(settings, "solver_profile", Config.SolverProfile.AUTO))
+    Config.set_strain_mode(_enum_setting(settings, "strain_mode", Config.StrainMode.LARGE))
+    Config.set_per_element_dipoles(settings.get("per_element_dipoles", False))
+    Config.set_lazy_torque_tolerance(settings.get("lazy_torque_tolerance"))
+    Config.set_worker_count(settings.get("worker_count", 1))
+    Config.set_profile_path(settings.get("profile"))
+
+
+def load_settings(path: Path) -> Dict[str, Any]:
+    """Loads the settings of a headless run from a JSON file.
+
+    Args:
+        path (Path): The path of the JSON file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+
+    Returns:
+        Dict[str, Any]: The settings.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"File {path} does not exist.")
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def velocity_below(tolerance: float) -> Callable[[Sofa.Core.Node], bool]:
+    """Creates a stop criterion that is met once no node moves faster than the tolerance.
+
+    Args:
+        tolerance (float): The maximum speed of all nodes in m/s.
+
+    Returns:
+        Callable[[Sofa.Core.Node], bool]: The stop criterion.
+    """
+    def criterion(root: Sofa.Core.Node) -> bool:
+        velocities = np.asarray(
+            root.getChild('object').getObject('dofs').velocity.value)
+        return np.sqrt(np.max(np.vecdot(velocities, velocities))) < tolerance
+    return criterion
+
+
+def build(root: Optional[Sofa.Core.Node] = None) -> Sofa.Core.Node:
+    """Builds and initializes the scene with the current configuration.
+
+    Args:
+        root (Optional[Sofa.Core.Node], optional): The root node. 
+            If None, a new one is created. Defaults to None.
+
+    Returns:
+        Sofa.Core.Node: The initialized root node.
+    """
+    if root is None:
+        root = Sofa.Core.Node("root")
+    sofa_instantiator.createScene(root)
+    Sofa.Simulation.init(root)
+    return root
+
+
+def run(root: Sofa.Core.Node, steps: int,
+        stop_criterion: Optional[Callable[[Sofa.Core.Node], bool]] = None,
+        analyser: Optional[SimulationAnalyser] = None,
+        monitor: Optional[ConvergenceMonitor] = None) -> Dict[str, np.ndarray]:
+    """Animates the initialized scene and collects the results.
+
+    Args:
+        root (Sofa.Core.Node): The initialized root node.
+        steps (int): The maximum number of steps.
+        stop_criterion (Optional[Callable[[Sofa.Core.Node], bool]], optional): Checked after 
+            each step, the run stops once it returns True. Defaults to None.
+        analyser (Optional[SimulationAnalyser], optional): The analyser that collects the 
+            deformation, e.g. one restored from a checkpoint. Defaults to the analyser of the monitor 
+            or a new analyser.
+        monitor (Optional[ConvergenceMonitor], optional): Updated after each step, 
+            the run stops once the state is steady. Defaults to None.
+
+    Raises:
+        ValueError: If steps is negative.
+
+    Returns:
+        Dict[str, np.ndarray]: The results of the run:
+            - steps: The number of animated steps.
+            - time: The simulated time in s.
+            - stopped: True, if the stop criterion was met or the state is steady.
+            - steady_state_step: The first step of the steady state, -1 if it was not reached.
+            - initial_positions, positions, velocities: The states of the nodes.
+            - max_deformation, min_deformation: The extrema of the deformation of each node.
+            - max_stress: The maximum von Mises stress in Pa, NaN if it is not calculated.
+    """
+    if steps < 0:
+        raise ValueError("Number of steps must not be negative.")
+
+    if analyser is None:
+        analyser = monitor.analyser if monitor is not None else SimulationAnalyser(root)
+    fem = root.getChild('object').getObject('FEM')
+    record_stress = Config.get_show_stress()
+    max_stress = -np.inf if record_stress else np.nan
+    dt = root.dt.value
+
+    step = 0
+    stopped = False
+    while step < steps and not stopped:
+        Sofa.Simulation.animate(root, dt)
+        step += 1
+        analyser.update_deformation()
+        if record_stress:
+            max_stress = max(max_stress, np.max(fem.vonMisesPerNode.value))
+        stopped = stop_criterion is not None and stop_criterion(root)
+        if monitor is not None:
+            stopped = monitor.update() or stopped
+
+    return {
+        "steps": np.array(step),
+        "time": np.array(step * dt),
+        "stopped": np.array(stopped),
+        "steady_state_step": np.array(-1 if monitor is None or monitor.steady_state_step is None
+                                      else monitor.steady_state_step),
+        "initial_positions": np.array(analyser.initial_positions),
+        "positions": np.array(analyser.mech_obj.position.value),
+        "velocities": np.array(analyser.mech_obj.velocity.value),
+        "max_deformation": analyser.maximum_deformation_array,
+        "min_deformation": analyser.minimum_deformation_array,
+        "max_stress": np.array(max_stress),
+    }
+
+
+def write_profile(root: Sofa.Core.Node) -> None:
+    """Writes the profile of the run, if profiling is enabled.
+
+    Args:
+        root (Sofa.Core.Node): The root node of the run.
+    """
+    if Config.get_profile_path() is not None:
+        root.getObject("ProfilerController").profiler.export(
+            Config.get_profile_path())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs a simulation from the command line and writes the results to a .npz file.
+
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments. 
+            Defaults to the arguments of the process.
+    """
+    parser = argparse.ArgumentParser(
+        description="Runs a simulation without the SOFA GUI.")
+    parser.add_argument("config", type=Path,
+                        help="JSON file with the settings of the simulation")
+    parser.add_argument("-o", "--output", type=Path, default=Path("results.npz"),
+                        help="the .npz file the results are written to")
+    parser.add_argument("-n", "--steps", type=int, default=1000,
+                        help="the maximum number of steps")
+    parser.add_argument("--stop-velocity", type=float, default=None,
+                        help="stop once no node is faster than this speed in m/s")
+    parser.add_argument("--steady-energy", type=float, default=None,
+                        help="stop once the kinetic energy stays below this tolerance in J")
+    parser.add_argument("--steady-displacement", type=float, default=None,
+                        help="stop once no node moves further than this tolerance in m per step")
+    parser.add_argument("--steady-window", type=int, default=20,
+                        help="the number of consecutive steps below the steady state tolerances")
+    parser.add_argument("--trajectory", type=Path, default=None,
+                        help="the .npy file the positions of the nodes are streamed to")
+    parser.add_argument("--trajectory-every", type=int, default=1,
+                        help="record the positions every n-th step")
+    parser.add_argument("--trajectory-nodes", type=int, nargs="+", default=None,
+                        help="the indices of the recorded nodes, defaults to all nodes")
+    parser.add_argument("--restore", type=Path, default=None,
+                        help="a checkpoint of the same model the run starts from")
+    parser.add_argument("--checkpoint", type=Path, default=None,
+                        help="the .npz file the final state is written to")
+    args = parser.parse_args(argv)
+    if args.steps < 1:
+        parser.error("--steps must be at least 1")
+    if args.trajectory_every < 1:
+        parser.error("--trajectory-every must be at least 1")
+
+    apply_settings(load_settings(args.config))
+    root = build()
+    analyser = SimulationAnalyser(root)
+    if args.restore is not None:
+        restore_checkpoint(args.restore, root, analyser)
+    stop_criterion = None if args.stop_velocity is None else velocity_below(
+        args.stop_velocity)
+    monitor = None
+    if args.steady_energy is not None or args.steady_displacement is not None:
+        monitor = ConvergenceMonitor(analyser, args.steady_window,
+                                     args.steady_energy, args.steady_displacement)
+    recorder = None
+    if args.trajectory is not None:
+        recorder = TrajectoryRecorder(root, args.trajectory, max(1, args.steps // args.trajectory_every),
+                                      args.trajectory_every, args.trajectory_nodes)
+        root.addObject(recorder)
+    results = run(root, args.steps, stop_criterion, analyser, monitor)
+    if recorder is not None:
+        recorder.close()
+    write_profile(root)
+    if args.checkpoint is not None:
+        save_checkpoint(args.checkpoint, root, analyser)
+
+    np.savez(args.output, **results)
+    if results["steady_state_step"] >= 0:
+        print(f"Steady state reached at step {int(results['steady_state_step'])}")
+    print(f"Simulated {int(results['steps'])} steps, results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the LiveUpdateController, which applies configuration changes 
+of the GUI to a running simulation, so the simulation does not have to be restarted."""
+
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+import Sofa
+
+from src import Config, MagneticController, MaterialLoader, SimulationAnalysisController
+
+
+class LiveUpdateController(Sofa.Core.Controller):
+    """Controller that polls the connection to the GUI at the end of each animation step.
+    The GUI sends `("config", Config.to_list())` messages for configurations that only 
+    change settings which are not built into the scene (see `Config.get_scene_settings`).
+    Only the settings that differ from the applied ones are passed on, so e.g. a running 
+    field schedule keeps its phase when other settings change.
+    The changes take effect with the next step.
+    """
+
+    def __init__(self, root: Sofa.Core.Node, conn: Connection,
+                 magnetic_controller: MagneticController, material_loader: MaterialLoader,
+                 analysis_controller: Optional[SimulationAnalysisController] = None) -> None:
+        """Initializes the controller.
+
+        Args:
+            root (Sofa.Core.Node): The root node of the simulation.
+            conn (Connection): The connection to the GUI.
+            magnetic_controller (MagneticController): The controller of the magnetic field.
+            material_loader (MaterialLoader): The material loader of the elastic object.
+            analysis_controller (Optional[SimulationAnalysisController], optional): 
+                The controller of the analysis. Defaults to None.
+        """
+        super().__init__(name="LiveUpdateController")
+        self.root = root
+        self.conn = conn
+        self.magnetic_controller = magnetic_controller
+        self.material_loader = material_loader
+        self.analysis_controller = analysis_controller
+        # The scene is built with the current configuration
+        self._applied = self._settings()
+
+    @staticmethod
+    def _settings() -> Dict[str, Any]:
+        """Returns the settings of the current configuration that are applied by `apply_config`.
+
+        Returns:
+            Dict[str, Any]: The settings.
+        """
+        gravity = Config.get_gravity_vec() if Config.get_use_gravity() else np.zeros(3)
+        analysis_parameters = Config.get_analysis_parameters()
+        return {
+            "density": Config.get_density().kgpm3,
+            "youngs_modulus": Config.get_youngs_modulus().Pa,
+            "poisson_ratio": Config.get_poisson_ratio(),
+            "remanence": Config.get_remanence().T,
+            "field_schedule": Config.get_field_schedule(),
+            "b_field": np.array(Config.get_b_field(), dtype=float).tolist(),
+            "gravity": np.array(gravity, dtype=float).tolist(),
+            "analysis_parameters": None if analysis_parameters is None else repr(analysis_parameters),
+        }
+
+    def apply_config(self) -> None:
+        """Applies the changed settings of the current configuration to the running simulation.
+        Material changes are passed to the material loader, which updates the elastic object 
+        at the beginning of the next step. A changed field schedule starts from its beginning.
+        """
+        settings = self._settings()
+        changed = {key for key, value in settings.items() if value != self._applied[key]}
+        self._applied = settings
+
+        if "density" in changed:
+            self.material_loader.set_density(Config.get_density())
+        if "youngs_modulus" in changed:
+            self.material_loader.set_youngs_modulus(Config.get_youngs_modulus())
+        if "poisson_ratio" in changed:
+            self.material_loader.set_poissons_ratio(Config.get_poisson_ratio())
+        if "remanence" in changed:
+            self.material_loader.set_remanence(Config.get_remanence())
+
+        if "field_schedule" in changed:
+            self.magnetic_controller.set_field_schedule(
+                Config.get_field_schedule(), self.root.dt.value)
+        if "b_field" in changed:
+            self.magnetic_controller.set_b_field(Config.get_b_field())
+
+        if "gravity" in changed:
+            self.root.gravity.value = settings["gravity"]
+
+        if (self.analysis_controller is not None and "analysis_parameters" in changed
+                and Config.get_analysis_parameters() is not None):
+            self.analysis_controller.set_analysis_parameters(
+                Config.get_analysis_parameters())
+
+    def onAnimateEndEvent(self, _) -> None:
+        """Method that is automatically called at the end of the Sofa animation step.
+        """
+        config_list = None
+        # Only the latest configuration is applied
+        while self.conn.poll():
+            call, args = self.conn.recv()
+            if call == "config":
+                config_list = args
+        if config_list is not None:
+            Config.from_list(config_list)
+            self.apply_config()
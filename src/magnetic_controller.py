@@ -25,13 +25,13 @@ changing the magnetic forces acting on the nodes of the elastic object during th
 """
 
 import math
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 from scipy.spatial.transform import Rotation
 import numpy as np
 
 import Sofa
 
-from . import ElasticObject, MaterialLoader, Config
+from . import ElasticObject, MaterialLoader, Config, FieldMap, FieldSchedule, ChunkedExecutor
 
 
 MU0 = (4 * np.pi) / np.pow(10, 7)  # Permeability (H/m)
@@ -86,6 +86,31 @@ class MagneticController(Sofa.Core.Controller):
         cross = np.cross(vec1, vec2)
         return (cross / np.linalg.norm(cross)), vec1, vec2
 
+    @staticmethod
+    def _normals(cur_positions: np.ndarray,
+                 tetrahedra: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculates the normals of the surfaces defined by the
+        first three points of all given tetrahedra at once.
+        This is the batched version of `_normal`.
+
+        Args:
+            cur_positions (np.ndarray): Array that maps the point inidices
+            to the current positions in the simulation.
+            tetrahedra (np.ndarray): Array of shape (M, 4) that contains
+            the point indices of all tetrahedra.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The normals of the surfaces,
+            the first vectors and the second vectors of the tetrahedra, each of shape (M, 3).
+        """
+        origins = cur_positions[tetrahedra[:, 0]]
+        vec1 = cur_positions[tetrahedra[:, 1]] - origins
+        vec2 = cur_positions[tetrahedra[:, 2]] - origins
+        cross = np.cross(vec1, vec2)
+        # vecdot reduces like the 1d norm in `_normal`, keeping both versions bitwise equal
+        norms = np.sqrt(np.vecdot(cross, cross))
+        return (cross / norms[:, np.newaxis]), vec1, vec2
+
     @staticmethod
     def calculate_angle(vec1: np.ndarray, vec2: np.ndarray, axis: str) -> float:
         """Calculates the angle between two 3d vectors along the given axis.
@@ -108,43 +133,101 @@ class MagneticController(Sofa.Core.Controller):
         )
         return angle if not math.isnan(angle) else 0
 
+    @staticmethod
+    def _rotation_matrices(sources: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+        """Calculates the rotation matrices between pairs of 3d vectors.
+        Applying a matrix to its source will result in the corresponding destination.
+
+        Args:
+            sources (np.ndarray): The source vectors of shape (M, 3) or (3,).
+            destinations (np.ndarray): The destination vectors of shape (M, 3) or (3,).
+
+        Returns:
+            np.ndarray: The rotation matrices of shape (M, 3, 3).
+        """
+        sources, destinations = np.broadcast_arrays(
+            np.asarray(sources, dtype=float).reshape(-1, 3),
+            np.asarray(destinations, dtype=float).reshape(-1, 3))
+        sources = sources.copy()
+
+        parallel = np.isclose(sources, destinations).all(axis=1)
+        # The rotation axis of antiparallel vectors is undefined, so the sources are tilted slightly
+        antiparallel = np.isclose(
+            sources, -1 * destinations).all(axis=1) & ~parallel
+        if antiparallel.any():
+            sources[antiparallel] = Rotation.from_euler(
+                'xyz', [0.000000001*np.pi]*3).apply(sources[antiparallel])
+
+        normalized_sources = sources / \
+            np.sqrt(np.vecdot(sources, sources))[:, np.newaxis]
+        normalized_destinations = destinations / \
+            np.sqrt(np.vecdot(destinations, destinations))[:, np.newaxis]
+        normals = np.cross(normalized_sources, normalized_destinations)
+        dot_products = np.vecdot(normalized_sources, normalized_destinations)
+        normal_lengths = np.sqrt(np.vecdot(normals, normals))
+
+        kmats = np.zeros((len(normals), 3, 3))
+        kmats[:, 0, 1] = -normals[:, 2]
+        kmats[:, 0, 2] = normals[:, 1]
+        kmats[:, 1, 0] = normals[:, 2]
+        kmats[:, 1, 2] = -normals[:, 0]
+        kmats[:, 2, 0] = -normals[:, 1]
+        kmats[:, 2, 1] = normals[:, 0]
+        # Parallel vectors have no rotation axis and are replaced by the identity below
+        with np.errstate(divide='ignore', invalid='ignore'):
+            factors = (1 - dot_products) / (normal_lengths ** 2)
+            rotation_matrices = np.eye(3) + kmats + \
+                np.matmul(kmats, kmats) * factors[:, np.newaxis, np.newaxis]
+        rotation_matrices[parallel] = np.eye(3)
+
+        return rotation_matrices
+
     @staticmethod
     def calculate_rotation(source: np.ndarray, destination: np.ndarray) -> Rotation:
         """Calculates the rotation between two 3d vectors. 
         Applying the result to the source will result in the destination.
+        Batches of vectors of shape (M, 3) result in a stack of M rotations,
+        a single 3d vector is broadcast against the batch.
 
         Args:
-            source (np.ndarray): The first 3d vector.
-            destination (np.ndarray): The second 3d vector.
+            source (np.ndarray): The first 3d vector or a batch of vectors.
+            destination (np.ndarray): The second 3d vector or a batch of vectors.
 
         Returns:
             Rotation: The rotation that is needed to rotate the source to the destination.
         """
-        if np.isclose(source, destination).all():
-            return Rotation.from_euler('x', 0)
-        if np.isclose(source, -1 * destination).all():
-            source = Rotation.from_euler(
-                'xyz', [0.000000001*np.pi]*3).apply(source)
-
-        normalized_source = (source / np.linalg.norm(source)).reshape(3)
-        normalized_destination = (
-            destination / np.linalg.norm(destination)).reshape(3)
-        normal = np.cross(normalized_source, normalized_destination)
-        dot_product = np.dot(normalized_source, normalized_destination)
-        normal_length = np.linalg.norm(normal)
-        kmat = np.array([[0, -normal[2], normal[1]], [normal[2],
-                        0, -normal[0]], [-normal[1], normal[0], 0]])
-        rotation_matrix = np.eye(3) + kmat + kmat.dot(kmat) * \
-            ((1 - dot_product) / (normal_length ** 2))
-
-        return Rotation.from_matrix(rotation_matrix)
-
-    def __init__(self, elastic_object: ElasticObject, material_loader: MaterialLoader) -> None:
+        rotation_matrices = MagneticController._rotation_matrices(
+            source, destination)
+        if np.size(source) == 3 and np.size(destination) == 3:
+            return Rotation.from_matrix(rotation_matrices[0])
+        return Rotation.from_matrix(rotation_matrices)
+
+    def __init__(self, elastic_object: ElasticObject, material_loader: MaterialLoader,
+                 per_element_dipoles: bool = False, lazy_tolerance: Optional[float] = None,
+                 field_map: Optional[FieldMap] = None,
+                 executor: Optional[ChunkedExecutor] = None) -> None:
         """Initializes the Magnetic Controller.
 
         Args:
             elastic_object (ElasticObject): The elastic_object that is modeled.
             material_loader (MaterialLoader): The material_loader that is used to update the material values.
+            per_element_dipoles (bool, optional): If True, the dipole moment of each tetrahedron
+                is weighted with its own volume instead of the volume of the whole model. Defaults to False.
+            lazy_tolerance (Optional[float], optional): If set, enables lazy torque updates. 
+                Torques are only recalculated for tetrahedra whose normal rotated by more than 
+                this angle (in rad) since their last update, all other nodes keep their previous force.
+                As the orientation of a dipole only depends on the normal, the relative error 
+                of each torque is bounded by this angle. If None, all torques are updated each step.
+                Defaults to None.
+            field_map (Optional[FieldMap], optional): If set, the magnetic field is evaluated 
+                at the centroid of each tetrahedron instead of using the uniform field. Defaults to None.
+            executor (Optional[ChunkedExecutor], optional): The executor that splits the torque 
+                calculation into chunks. If None, the torques are calculated on the calling thread. 
+                Defaults to None.
+
+        Raises:
+            ValueError: If lazy_tolerance is negative.
+            ValueError: If lazy updates are combined with a field map.
         """
         # Call init of Base class (required)
         super().__init__()
@@ -152,55 +235,291 @@ class MagneticController(Sofa.Core.Controller):
         # Process parameters
         self._elastic_object = elastic_object
         self._material_loader = material_loader
+        self._executor = executor if executor is not None else ChunkedExecutor()
 
         # Get list of the nodes of all tetrahedra
         self._tetrahedra = np.array(elastic_object.mesh.tetrahedra.value)
-        self._rotations = []
-        self._volume = 0
         # Get list of the positions of all nodes
         cur_positions = np.array(elastic_object.mesh.position.value)
 
         self._num_nodes = len(cur_positions)
 
-        for tetrahedron in self._tetrahedra:
-            # Calculate the normal of the tetrahedrons face formed by the first 3 nodes
-            normal, vec1, vec2 = self._normal(cur_positions, tetrahedron)
+        # Calculate the normals of the tetrahedrons faces formed by the first 3 nodes
+        normals, vecs1, vecs2 = self._normals(cur_positions, self._tetrahedra)
+        vecs3 = cur_positions[self._tetrahedra[:, 3]] - \
+            cur_positions[self._tetrahedra[:, 0]]
+        self._volumes = np.abs(np.vecdot(vecs1, np.cross(vecs2, vecs3))) / 6
+        self._volume = np.sum(self._volumes)
+
+        # Rotations from the normals to the initial direction of the magnetic dipole moment
+        # A stack of matrices keeps the shape (M, 3, 3) for a single tetrahedron,
+        # Rotation orthonormalizes them like calculate_rotation
+        self._element_rotations = Rotation.from_matrix(MagneticController._rotation_matrices(
+            normals, Config.get_initial_dipole_moment())).as_matrix()
+
+        # The first tetrahedron containing a node defines its torque (-1 if there is none)
+        self._node_owners = np.full(self._num_nodes, -1, dtype=np.int32)
+        owned_nodes, first_occurrences = np.unique(
+            self._tetrahedra.ravel(), return_index=True)
+        self._node_owners[owned_nodes] = first_occurrences // self._tetrahedra.shape[1]
+        self._owned_nodes = owned_nodes
+
+        # Only the tetrahedra that define a torque have to be evaluated each step
+        owner_indices, self._owner_slots = np.unique(
+            self._node_owners[owned_nodes], return_inverse=True)
+        self._owner_tetrahedra = self._tetrahedra[owner_indices]
+        self._owner_rotations = self._element_rotations[owner_indices]
+
+        # Lazy updates compare the current normals to the normals of the last update
+        if lazy_tolerance is not None and lazy_tolerance < 0:
+            raise ValueError("Lazy tolerance must not be negative.")
+        self._lazy_tolerance = lazy_tolerance
+        self._reference_normals = None
+        self.refreshed_elements = 0
+
+        # Dipole moments only change with the remanence, so they are cached
+        self._per_element_dipoles = per_element_dipoles
+        self._remanence = None
+        self._dipole_moments = None
+        self._node_dipole_moments = None
+        self._update_dipole_moments(material_loader.get_remanence().T)
+
+        self._b_field = None
+        self.set_b_field(Config.get_b_field())
+        self._field_map = None
+        self.set_field_map(field_map)
+
+        # Compiled field schedule that replaces the uniform magnetic field each step
+        self._step = 0
+        self._field_table = None
+        self._periodic_field = False
+
+    def _update_dipole_moments(self, remanence: float) -> None:
+        """Recalculates the magnitudes of the magnetic dipole moments of all tetrahedra
+        and the nodes their torque is defined at.
+
+        Args:
+            remanence (float): The remanence of the material in T.
+        """
+        self._remanence = remanence
+        volumes = self._volumes if self._per_element_dipoles else \
+            np.full(len(self._tetrahedra), self._volume)
+        self._dipole_moments = remanence * volumes / MU0
+        self._node_dipole_moments = self._dipole_moments[
+            self._node_owners[self._owned_nodes]]
+        # All torques are outdated
+        self._reference_normals = None
+
+    def set_b_field(self, b_field: np.ndarray) -> None:
+        """Sets the magnetic field acting on the elastic object.
+
+        Args:
+            b_field (np.ndarray): The magnetic field vector in T.
+
+        Raises:
+            ValueError: If b_field does not have shape (3,).
+        """
+        b_field = np.array(b_field, dtype=float)
+        if b_field.shape != (3,):
+            raise ValueError("Magnetic field must have shape [x,y,z].")
+        self._b_field = b_field
+        # All torques are outdated
+        self._reference_normals = None
+
+    def get_b_field(self) -> np.ndarray:
+        """Gets the magnetic field acting on the elastic object.
+
+        Returns:
+            np.ndarray: The magnetic field vector in T.
+        """
+        return self._b_field
+
+    def set_field_schedule(self, field_schedule: Optional[FieldSchedule], dt: float) -> None:
+        """Sets the schedule of the uniform magnetic field. The schedule is compiled 
+        into a table with the field of each step, starting with the next step.
+
+        Args:
+            field_schedule (Optional[FieldSchedule]): The schedule, or None to keep the current field.
+            dt (float): The time difference between each simulation step in s.
+        """
+        self._step = 0
+        if field_schedule is None:
+            self._field_table = None
+            return
+        self._field_table = field_schedule.compile(dt)
+        self._periodic_field = field_schedule.is_periodic()
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the controller that is needed to continue a simulation.
+
+        Returns:
+            Dict[str, np.ndarray]: The state, containing the index of the next step of the field schedule.
+        """
+        return {"step": np.array(self._step)}
+
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        """Restores the state of the controller. The magnetic field and the material are not 
+        restored, so a simulation can be continued with changed parameters.
+        All torques are calculated in the next step.
+
+        Args:
+            state (Dict[str, np.ndarray]): The state returned by `get_state`.
+        """
+        self._step = int(state["step"])
+        self._reference_normals = None
+
+    def _update_b_field(self) -> None:
+        """Looks up the field of the current step in the compiled schedule.
+        Periodic schedules are looped, for all others the last field is held.
+        """
+        if self._periodic_field:
+            b_field = self._field_table[self._step % len(self._field_table)]
+        else:
+            b_field = self._field_table[min(self._step, len(self._field_table) - 1)]
+        self._step += 1
+
+        if not np.array_equal(b_field, self._b_field):
+            self._b_field = b_field
+            # All torques are outdated
+            self._reference_normals = None
 
-            # Initial direction of the magnetic dipole moment
-            initial = Config.get_initial_dipole_moment()
+    def set_field_map(self, field_map: Optional[FieldMap]) -> None:
+        """Sets the field map that replaces the uniform magnetic field.
 
-            r = self.calculate_rotation(normal, initial)
-            self._rotations.append(r)
+        Args:
+            field_map (Optional[FieldMap]): The field map, or None to use the uniform magnetic field.
 
-            vec3 = cur_positions[tetrahedron[3]] - \
-                cur_positions[tetrahedron[0]]
-            self._volume += abs(np.dot(vec1, np.cross(vec2, vec3))) / 6
+        Raises:
+            ValueError: If lazy updates are enabled, 
+                as they do not account for the field changing with the position.
+        """
+        if field_map is not None and self._lazy_tolerance is not None:
+            raise ValueError("Lazy updates require a uniform magnetic field.")
+        self._field_map = field_map
+
+    def get_field_map(self) -> Optional[FieldMap]:
+        """Gets the field map that replaces the uniform magnetic field.
+
+        Returns:
+            Optional[FieldMap]: The field map, or None if the uniform magnetic field is used.
+        """
+        return self._field_map
+
+    def _owner_b_fields(self, cur_positions: np.ndarray) -> np.ndarray:
+        """Returns the magnetic field acting on the nodes that are part of a tetrahedron.
+        With a field map, the field is evaluated at the centroids of the owning tetrahedra.
+
+        Args:
+            cur_positions (np.ndarray): Array of shape (N, 3) that maps the point indices
+            to the current positions in the simulation.
+
+        Returns:
+            np.ndarray: The magnetic field vector in T, of shape (3,) or (K, 3).
+        """
+        if self._field_map is None:
+            return self._b_field
+        centroids = cur_positions[self._owner_tetrahedra].mean(axis=1)
+        return self._field_map.evaluate(centroids)[self._owner_slots]
+
+    def calculate_torques(self, cur_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculates the magnetic torques acting on the nodes for the given positions.
+        Every node gets the torque of the first tetrahedron it is part of.
+
+        Args:
+            cur_positions (np.ndarray): Array of shape (N, 3) that maps the point indices
+            to the current positions in the simulation.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The indices of all nodes that are part of 
+            a tetrahedron and the torques acting on them, of shape (K,) and (K, 3).
+        """
+        b_fields = self._owner_b_fields(cur_positions)
+        orientations = np.empty((len(self._owner_tetrahedra), 3))
+        torques = np.empty((len(self._owned_nodes), 3))
+
+        def calculate_orientations(start: int, stop: int) -> None:
+            # Calculate the normals of the owning tetrahedrons faces formed by the first 3 nodes
+            normals = self._normals(
+                cur_positions, self._owner_tetrahedra[start:stop])[0]
+
+            # Calculate the orientations of the magnetic dipole moments
+            orientations[start:stop] = np.matmul(
+                self._owner_rotations[start:stop], normals[:, :, np.newaxis])[:, :, 0]
+
+        def calculate_chunk_torques(start: int, stop: int) -> None:
+            m = self._node_dipole_moments[start:stop, np.newaxis] * \
+                orientations[self._owner_slots[start:stop]]
+            torques[start:stop] = np.cross(
+                m, b_fields if b_fields.ndim == 1 else b_fields[start:stop])
+
+        # Bytes per row include the gathered inputs and the temporary arrays
+        self._executor.map(calculate_orientations, len(orientations), 320)
+        self._executor.map(calculate_chunk_torques, len(torques), 128)
+        return self._owned_nodes, torques
+
+    def calculate_outdated_torques(self, cur_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculates the magnetic torques only for the nodes whose defining tetrahedron 
+        rotated by more than the lazy tolerance since its torque was last calculated.
+        After a change of the remanence or the magnetic field, all torques are calculated.
+
+        Args:
+            cur_positions (np.ndarray): Array of shape (N, 3) that maps the point indices
+            to the current positions in the simulation.
+
+        Raises:
+            ValueError: If the controller has no lazy tolerance.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The indices of the outdated nodes 
+            and the torques acting on them, of shape (K,) and (K, 3).
+        """
+        if self._lazy_tolerance is None:
+            raise ValueError("Lazy updates are disabled.")
+
+        normals = self._normals(cur_positions, self._owner_tetrahedra)[0]
+
+        if self._reference_normals is None:
+            outdated = np.ones(len(normals), dtype=bool)
+            self._reference_normals = normals
+        else:
+            outdated = np.vecdot(normals, self._reference_normals) < \
+                np.cos(self._lazy_tolerance)
+            self._reference_normals[outdated] = normals[outdated]
+        self.refreshed_elements = int(np.count_nonzero(outdated))
+
+        orientations = np.matmul(
+            self._owner_rotations[outdated], normals[outdated][:, :, np.newaxis])[:, :, 0]
+
+        # Map the nodes of the outdated tetrahedra to the rows of the calculated orientations
+        outdated_nodes = outdated[self._owner_slots]
+        rows = (np.cumsum(outdated) - 1)[self._owner_slots[outdated_nodes]]
+
+        m = self._node_dipole_moments[outdated_nodes, np.newaxis] * \
+            orientations[rows]
+        torques = np.cross(m, self._b_field)
+        return self._owned_nodes[outdated_nodes], torques
 
     def onAnimateBeginEvent(self, _):
         """Function that is automatically called at the beginning of the Sofa animation step.
         """
 
         # first of all, update material values
-        self._material_loader.update_elastic_object()
+        if self._material_loader.update_elastic_object():
+            remanence = self._material_loader.get_remanence().T
+            if remanence != self._remanence:
+                self._update_dipole_moments(remanence)
         # TODO: for LINK, also update magnetic field etc; similar class maybe?
+        if self._field_table is not None:
+            self._update_b_field()
 
         # Get the current positions of all nodes
         cur_positions = np.array(self._elastic_object.mech_obj.position.value)
-        force_defined_at = [False] * self._num_nodes
-
-        for index, tetrahedron in enumerate(self._tetrahedra):
-            # Calculate the normal of the tetrahedrons face formed by the first 3 nodes
-            normal = self._normal(cur_positions, tetrahedron)[0]
-
-            # Calculate the orientation of the magnetic dipole moment
-            orientation = self._rotations[index].apply(normal)
-
-            for node in tetrahedron:
-                if not force_defined_at[node]:
-                    dipole_moment = Config.get_remanence().T * self._volume / MU0
 
-                    m = dipole_moment * orientation
-                    torque = np.cross(m, Config.get_b_field())
-                    self._elastic_object.vertex_forces[node].forces = [torque]
+        if self._lazy_tolerance is None:
+            nodes, torques = self.calculate_torques(cur_positions)
+            self.refreshed_elements = len(self._owner_tetrahedra)
+        else:
+            nodes, torques = self.calculate_outdated_torques(cur_positions)
 
-                    force_defined_at[node] = True
+        if len(nodes) > 0:
+            self._elastic_object.vertex_forces.set_forces(nodes, torques)
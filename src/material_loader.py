@@ -147,10 +147,14 @@ class MaterialLoader:
             self.update_elastic_object()
         return Tesla(self._material_values['remanence'])
 
-    def update_elastic_object(self) -> None:
-        """Updates the elastic object if changes occurred."""
+    def update_elastic_object(self) -> bool:
+        """Updates the elastic object if changes occurred.
+
+        Returns:
+            bool: True if changes occurred and the elastic object was updated.
+        """
         if not self._dirty:
-            return
+            return False
 
         self._eo.diagonal_mass.setDataValues(
             massDensity=self._material_values['density'])
@@ -163,6 +167,7 @@ class MaterialLoader:
         self._eo.remanence = Tesla.from_T(self._material_values['remanence'])
 
         self._dirty = False
+        return True
 
     # TODO: maybe useful for lib to directly set json format?
     # unused
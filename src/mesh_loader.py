@@ -20,12 +20,21 @@
 # Contact information: finn.s.schubert@gmail.com                                       #
 # ____________________________________________________________________________________ #
 
-"""This module provides a class to load meshes into the Sofa Scene."""
+"""This module provides a class to load meshes into the Sofa Scene 
+and readers that load the meshes into NumPy arrays without SOFA."""
 
+import hashlib
+import os
+import re
+import shutil
 from pathlib import Path
 from os.path import getsize
-from typing import Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from enum import Enum
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.spatial import cKDTree
 import Sofa.Core
 
 
@@ -46,6 +55,938 @@ endings = [('.obj', '.stl', '.vtk', '.off', '.msh'),  # SURFACE
            ('.msh', '.off', '.vtk')]  # VOLUMETRIC
 
 
+CACHE_DIRECTORY = ".mesh_cache"
+# Increase when the readers change, so outdated cache entries are not used
+_CACHE_VERSION = b"1"
+
+
+class MeshData(NamedTuple):
+    """The arrays of a mesh. Polygons are split into triangles."""
+    positions: np.ndarray
+    """The positions of the nodes with shape (N, 3)."""
+    triangles: np.ndarray
+    """The node indices of the triangles with shape (T, 3)."""
+    tetrahedra: np.ndarray
+    """The node indices of the tetrahedra with shape (K, 4)."""
+
+
+def _mesh_data(positions: np.ndarray, triangles: Optional[np.ndarray] = None,
+               tetrahedra: Optional[np.ndarray] = None) -> MeshData:
+    """Creates the mesh data with consistent data types.
+
+    Args:
+        positions (np.ndarray): The positions of the nodes.
+        triangles (Optional[np.ndarray], optional): The triangles. Defaults to no triangles.
+        tetrahedra (Optional[np.ndarray], optional): The tetrahedra. Defaults to no tetrahedra.
+
+    Raises:
+        ValueError: If an element refers to a node that does not exist.
+
+    Returns:
+        MeshData: The mesh data.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    triangles = np.zeros((0, 3), dtype=np.int64) if triangles is None else \
+        np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    tetrahedra = np.zeros((0, 4), dtype=np.int64) if tetrahedra is None else \
+        np.asarray(tetrahedra, dtype=np.int64).reshape(-1, 4)
+    for elements in (triangles, tetrahedra):
+        if elements.size and (elements.min() < 0 or elements.max() >= len(positions)):
+            raise ValueError("Mesh contains elements with unknown nodes.")
+    return MeshData(positions, triangles, tetrahedra)
+
+
+def _fan(polygons: np.ndarray) -> np.ndarray:
+    """Splits polygons with the same number of nodes into triangles around their first node.
+
+    Args:
+        polygons (np.ndarray): The node indices of the polygons with shape (P, k).
+
+    Returns:
+        np.ndarray: The triangles with shape (P * (k - 2), 3).
+    """
+    count = polygons.shape[1]
+    if count < 3:
+        return np.zeros((0, 3), dtype=np.int64)
+    second = np.arange(1, count - 1)
+    triangles = np.empty((len(polygons), count - 2, 3), dtype=np.int64)
+    triangles[:, :, 0] = polygons[:, :1]
+    triangles[:, :, 1] = polygons[:, second]
+    triangles[:, :, 2] = polygons[:, second + 1]
+    return triangles.reshape(-1, 3)
+
+
+def _parse_rows(lines: List[str], dtype: type = np.int64) -> Dict[int, tuple]:
+    """Parses lines with different numbers of values. 
+    The lines with the same number of values are parsed as one block.
+
+    Args:
+        lines (List[str]): The lines.
+        dtype (type, optional): The data type of the values. Defaults to np.int64.
+
+    Raises:
+        ValueError: If a line contains an invalid value.
+
+    Returns:
+        Dict[int, tuple]: For each number of values, the indices of the lines 
+        and the values with one row per line.
+    """
+    lengths = np.fromiter((len(line.split()) for line in lines), dtype=np.int64, count=len(lines))
+    groups = {}
+    for length in np.unique(lengths):
+        indices = np.flatnonzero(lengths == length)
+        block = " ".join(lines[i] for i in indices)
+        values = np.fromstring(block, dtype=dtype, sep=" ")
+        if values.size != length * len(indices):
+            raise ValueError("Mesh contains invalid values.")
+        groups[int(length)] = (indices, values.reshape(len(indices), length))
+    return groups
+
+
+def _lines(text: str) -> List[str]:
+    """Splits text into its non-empty lines.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        List[str]: The stripped, non-empty lines.
+    """
+    return [line for line in (line.strip() for line in text.splitlines()) if line]
+
+
+# Number of nodes of the Gmsh element types
+_GMSH_ELEMENT_NODES = {1: 2, 2: 3, 3: 4, 4: 4, 5: 8, 6: 6, 7: 5, 8: 3, 9: 6, 10: 9, 11: 10,
+                       12: 27, 13: 18, 14: 14, 15: 1, 16: 8, 17: 20, 18: 15, 19: 13}
+_GMSH_TRIANGLE = 2
+_GMSH_TETRAHEDRON = 4
+
+
+def _gmsh_elements(tags: np.ndarray, elements: Dict[int, List[np.ndarray]]) -> tuple:
+    """Maps the node tags of Gmsh triangles and tetrahedra to node indices.
+
+    Args:
+        tags (np.ndarray): The node tag of each node.
+        elements (Dict[int, List[np.ndarray]]): The node tags of the elements of each type.
+
+    Raises:
+        ValueError: If an element refers to a node that does not exist.
+
+    Returns:
+        tuple: The triangles and the tetrahedra.
+    """
+    lookup = np.full(int(tags.max(initial=0)) + 1, -1, dtype=np.int64)
+    lookup[tags] = np.arange(len(tags))
+
+    def indices(element_type: int, width: int) -> np.ndarray:
+        blocks = elements.get(element_type, [])
+        if not blocks:
+            return np.zeros((0, width), dtype=np.int64)
+        node_tags = np.concatenate(blocks)
+        if node_tags.max() >= len(lookup):
+            raise ValueError("Mesh contains elements with unknown nodes.")
+        return lookup[node_tags]
+
+    return indices(_GMSH_TRIANGLE, 3), indices(_GMSH_TETRAHEDRON, 4)
+
+
+def _read_gmsh_4(nodes: str, elements: str, minor_version: int = 1) -> MeshData:
+    """Reads the sections of an ASCII Gmsh 4 file. Each block of nodes and elements 
+    is parsed at once. Version 4.0 lists the tag of each node with its coordinates 
+    and has shorter section headers than version 4.1.
+
+    Args:
+        nodes (str): The content of the $Nodes section.
+        elements (str): The content of the $Elements section.
+        minor_version (int, optional): The minor version of the format, 0 or 1. Defaults to 1.
+
+    Raises:
+        ValueError: If a section is incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    values = np.fromstring(nodes, sep=" ")
+    block_count, node_count = int(values[0]), int(values[1])
+    tags = np.empty(node_count, dtype=np.int64)
+    positions = np.empty((node_count, 3))
+    # Version 4.1 adds the range of tags to the headers of the sections
+    header = 4 if minor_version >= 1 else 2
+    i, n = header, 0
+    for _ in range(block_count):
+        # The entity tag and dimension are swapped in version 4.0
+        dimension = int(values[i if minor_version >= 1 else i + 1])
+        parametric, size = int(values[i + 2]), int(values[i + 3])
+        i += 4
+        width = 3 + (dimension if parametric else 0)
+        if i + size * (width + 1) > len(values) or n + size > node_count:
+            raise ValueError("Nodes section of the mesh is incomplete.")
+        if minor_version >= 1:
+            tags[n:n + size] = values[i:i + size]
+            i += size
+            positions[n:n + size] = values[i:i + size * width].reshape(size, width)[:, :3]
+        else:
+            rows = values[i:i + size * (width + 1)].reshape(size, width + 1)
+            tags[n:n + size] = rows[:, 0]
+            positions[n:n + size] = rows[:, 1:4]
+            i += size
+        i += size * width
+        n += size
+
+    values = np.fromstring(elements, dtype=np.int64, sep=" ")
+    block_count = int(values[0])
+    blocks: Dict[int, List[np.ndarray]] = {}
+    i = header
+    for _ in range(block_count):
+        element_type, size = int(values[i + 2]), int(values[i + 3])
+        i += 4
+        width = _GMSH_ELEMENT_NODES.get(element_type)
+        if width is None:
+            raise ValueError(f"Gmsh element type {element_type} is not supported.")
+        if i + size * (width + 1) > len(values):
+            raise ValueError("Elements section of the mesh is incomplete.")
+        block = values[i:i + size * (width + 1)].reshape(size, width + 1)
+        blocks.setdefault(element_type, []).append(block[:, 1:])
+        i += size * (width + 1)
+
+    return _mesh_data(positions[:n], *_gmsh_elements(tags[:n], blocks))
+
+
+def _read_gmsh_legacy(nodes: str, elements: str,
+                      header_lengths: Callable[[np.ndarray], np.ndarray]) -> MeshData:
+    """Reads the sections of an ASCII Gmsh 1 or 2 file. 
+    The nodes are parsed at once, the elements once per line length.
+
+    Args:
+        nodes (str): The content of the node section.
+        elements (str): The content of the element section.
+        header_lengths (Callable[[np.ndarray], np.ndarray]): Returns the number of values 
+            before the nodes of each element in a block of elements.
+
+    Raises:
+        ValueError: If a section is incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    values = np.fromstring(nodes, sep=" ")
+    node_count = int(values[0])
+    if len(values) < 1 + 4 * node_count:
+        raise ValueError("Nodes section of the mesh is incomplete.")
+    rows = values[1:1 + 4 * node_count].reshape(node_count, 4)
+    tags = rows[:, 0].astype(np.int64)
+
+    blocks: Dict[int, List[np.ndarray]] = {}
+    for length, (_, elements_block) in _parse_rows(_lines(elements)[1:]).items():
+        lengths = header_lengths(elements_block)
+        for element_type in (_GMSH_TRIANGLE, _GMSH_TETRAHEDRON):
+            width = _GMSH_ELEMENT_NODES[element_type]
+            selected = (elements_block[:, 1] == element_type) & (lengths + width == length)
+            if np.any(selected):
+                blocks.setdefault(element_type, []).append(
+                    elements_block[selected, -width:])
+
+    return _mesh_data(rows[:, 1:], *_gmsh_elements(tags, blocks))
+
+
+def _read_gmsh(data: bytes) -> MeshData:
+    """Reads an ASCII Gmsh file of version 1, 2, 4.0 or 4.1.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Raises:
+        ValueError: If the file is binary or incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    text = data.decode("latin-1")
+    sections = {name.lower(): content for name, content in re.findall(
+        r"^\$(\w+)[^\n]*\n(.*?)^\$End\1", text, re.S | re.M | re.I)}
+
+    if "meshformat" in sections:
+        version, file_type = sections["meshformat"].split()[:2]
+        if int(file_type) != 0:
+            raise ValueError("Binary Gmsh files are not supported.")
+        if "nodes" not in sections or "elements" not in sections:
+            raise ValueError("Mesh has no nodes or elements section.")
+        major, _, minor = version.partition(".")
+        if int(major) >= 4:
+            return _read_gmsh_4(sections["nodes"], sections["elements"], int(minor[:1] or 0))
+        # tag, type, number of tags, tags, nodes
+        return _read_gmsh_legacy(sections["nodes"], sections["elements"],
+                                 lambda rows: 3 + rows[:, 2])
+
+    if "nod" not in sections or "elm" not in sections:
+        raise ValueError("Mesh has no nodes or elements section.")
+    # tag, type, physical region, elementary region, number of nodes, nodes
+    return _read_gmsh_legacy(sections["nod"], sections["elm"],
+                             lambda rows: np.full(len(rows), 5))
+
+
+_STL_RECORD = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)),
+                        ("attribute", "<u2")])
+
+
+def _read_stl(data: bytes) -> MeshData:
+    """Reads an ASCII or binary STL file. Equal vertices of adjacent triangles 
+    are merged into one node, the nodes are ordered by their first appearance.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Raises:
+        ValueError: If the file is incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    # Binary files may also start with "solid", so the size decides
+    count = int.from_bytes(data[80:84], "little") if len(data) >= 84 else -1
+    if len(data) == 84 + _STL_RECORD.itemsize * count:
+        records = np.frombuffer(data, dtype=_STL_RECORD, count=count, offset=84)
+        vertices = records["vertices"].reshape(-1, 3).astype(np.float64)
+    elif data.lstrip().startswith(b"solid"):
+        coordinates = re.findall(rb"vertex\s+(\S+\s+\S+\s+\S+)", data)
+        vertices = np.fromstring(b" ".join(coordinates).decode("latin-1"), sep=" ")
+        if vertices.size != 3 * len(coordinates):
+            raise ValueError("Mesh contains invalid values.")
+        vertices = vertices.reshape(-1, 3)
+    else:
+        raise ValueError("File is no valid STL file.")
+    if len(vertices) % 3 != 0:
+        raise ValueError("Mesh contains incomplete triangles.")
+
+    unique, first, inverse = np.unique(
+        vertices, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return _mesh_data(unique[order], rank[inverse.reshape(-1)].reshape(-1, 3))
+
+
+def _polygons(groups: Dict[int, tuple], start: int = 0) -> np.ndarray:
+    """Splits rows of polygons, which start with their number of nodes, into triangles.
+
+    Args:
+        groups (Dict[int, tuple]): The rows grouped by their length, see `_parse_rows`.
+        start (int, optional): The column of the number of nodes. Defaults to 0.
+
+    Returns:
+        np.ndarray: The triangles.
+    """
+    triangles = []
+    for _, rows in groups.values():
+        for count in np.unique(rows[:, start]):
+            selected = rows[rows[:, start] == count]
+            triangles.append(_fan(selected[:, start + 1:start + 1 + count]))
+    return np.concatenate(triangles) if triangles else np.zeros((0, 3), dtype=np.int64)
+
+
+def _read_off(data: bytes) -> MeshData:
+    """Reads an ASCII OFF file.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Raises:
+        ValueError: If the file is incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    text = re.sub(r"#[^\n]*", "", data.decode("latin-1"))
+    lines = _lines(text)
+    if not lines or not lines[0].split()[0].endswith("OFF"):
+        raise ValueError("File is no valid OFF file.")
+    # The counts may follow the keyword on the same line
+    header = lines[0].split()[1:] or lines[1].split()
+    first = 1 if len(lines[0].split()) > 1 else 2
+    vertex_count, face_count = int(header[0]), int(header[1])
+    if len(lines) < first + vertex_count + face_count:
+        raise ValueError("Mesh is incomplete.")
+
+    positions = np.empty((vertex_count, 3))
+    for indices, rows in _parse_rows(lines[first:first + vertex_count], np.float64).values():
+        positions[indices] = rows[:, :3]
+    faces = _parse_rows(lines[first + vertex_count:first + vertex_count + face_count])
+    return _mesh_data(positions, _polygons(faces))
+
+
+# VTK cell types
+_VTK_TRIANGLE = 5
+_VTK_POLYGON = 7
+_VTK_QUAD = 9
+_VTK_TETRAHEDRON = 10
+
+
+def _read_vtk(data: bytes) -> MeshData:
+    """Reads an ASCII legacy VTK file with polygonal data or an unstructured grid.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Raises:
+        ValueError: If the file is binary or incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    text = data.decode("latin-1")
+    if re.search(r"^BINARY\s*$", text, re.M):
+        raise ValueError("Binary VTK files are not supported.")
+
+    def section(keyword: str, dtype: type, width: int = 1) -> Optional[np.ndarray]:
+        match = re.search(rf"^{keyword}\s+(\d+)[^\n]*\n", text, re.M)
+        if match is None:
+            return None
+        count = width * int(match.group(1))
+        values = np.fromstring(text[match.end():], dtype=dtype, sep=" ", count=count)
+        if len(values) != count:
+            raise ValueError(f"Section {keyword} of the mesh is incomplete.")
+        return values
+
+    points = section("POINTS", np.float64, 3)
+    if points is None:
+        raise ValueError("Mesh has no points.")
+
+    cell_keyword = "CELLS" if re.search(r"^CELLS\s", text, re.M) else "POLYGONS"
+    match = re.search(rf"^{cell_keyword}\s+(\d+)\s+(\d+)[^\n]*\n", text, re.M)
+    if match is None:
+        return _mesh_data(points)
+    cell_count = int(match.group(1))
+    if re.match(r"\s*OFFSETS", text[match.end():]):
+        # Version 5 lists the offsets of the cells and their nodes separately
+        rest = text[match.end():]
+        offsets = np.fromstring(rest[rest.index("\n") + 1:], dtype=np.int64, sep=" ",
+                                count=cell_count)
+        connectivity_match = re.search(r"^CONNECTIVITY[^\n]*\n", rest, re.M)
+        if connectivity_match is None or len(offsets) != cell_count:
+            raise ValueError(f"Section {cell_keyword} of the mesh is incomplete.")
+        connectivity = np.fromstring(rest[connectivity_match.end():], dtype=np.int64,
+                                     sep=" ", count=int(match.group(2)))
+        sizes, starts = np.diff(offsets), offsets[:-1]
+    else:
+        values = np.fromstring(text[match.end():], dtype=np.int64, sep=" ",
+                               count=int(match.group(2)))
+        if len(values) != int(match.group(2)):
+            raise ValueError(f"Section {cell_keyword} of the mesh is incomplete.")
+        # Each cell starts with its number of nodes
+        size = int(values[0]) if cell_count else 0
+        if len(values) == cell_count * (size + 1) and np.all(values[::size + 1] == size):
+            sizes = np.full(cell_count, size)
+            starts = np.arange(cell_count) * (size + 1) + 1
+        else:
+            sizes = np.empty(cell_count, dtype=np.int64)
+            starts = np.empty(cell_count, dtype=np.int64)
+            flat = values.tolist()
+            position = 0
+            for i in range(cell_count):
+                sizes[i] = flat[position]
+                starts[i] = position + 1
+                position += flat[position] + 1
+        connectivity = values
+
+    types = section("CELL_TYPES", np.int64)
+    if types is None:
+        types = np.full(len(sizes), _VTK_POLYGON)
+
+    triangles, tetrahedra = [], []
+    for cell_type, size in set(zip(types.tolist(), sizes.tolist())):
+        selected = (types == cell_type) & (sizes == size)
+        cells = connectivity[starts[selected, None] + np.arange(size)]
+        if cell_type == _VTK_TETRAHEDRON and size == 4:
+            tetrahedra.append(cells)
+        elif cell_type in (_VTK_TRIANGLE, _VTK_QUAD, _VTK_POLYGON):
+            triangles.append(_fan(cells))
+    return _mesh_data(points,
+                      np.concatenate(triangles) if triangles else None,
+                      np.concatenate(tetrahedra) if tetrahedra else None)
+
+
+def _read_obj(data: bytes) -> MeshData:
+    """Reads the vertices and faces of a Wavefront OBJ file.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Raises:
+        ValueError: If the file is incomplete.
+
+    Returns:
+        MeshData: The mesh.
+    """
+    text = data.decode("latin-1")
+    vertices = re.findall(r"^v\s+(\S+\s+\S+\s+\S+)", text, re.M)
+    positions = np.fromstring(" ".join(vertices), sep=" ")
+    if positions.size != 3 * len(vertices):
+        raise ValueError("Mesh contains invalid values.")
+
+    # Only the vertex indices of "vertex/texture/normal" are used
+    faces = [re.sub(r"/\S*", "", face)
+             for face in re.findall(r"^f\s+([^\n]+)", text, re.M)]
+    triangles = []
+    for _, rows in _parse_rows(faces).values():
+        # Negative indices count from the end
+        rows = np.where(rows < 0, rows + len(vertices), rows - 1)
+        triangles.append(_fan(rows))
+    return _mesh_data(positions, np.concatenate(triangles) if triangles else None)
+
+
+ending_to_reader: Dict[str, Callable[[bytes], MeshData]] = {
+    ".msh":      _read_gmsh,
+    ".off":      _read_off,
+    ".vtk":      _read_vtk,
+    ".obj":      _read_obj,
+    ".stl":      _read_stl,
+}
+
+
+def _digest(data: bytes) -> str:
+    """Computes the key of the cache entries of a file.
+
+    Args:
+        data (bytes): The content of the file.
+
+    Returns:
+        str: The hexadecimal key.
+    """
+    return hashlib.sha256(_CACHE_VERSION + data).hexdigest()[:32]
+
+
+def _cache_directory(path: Path) -> Path:
+    """Gets the cache directory of a mesh file. Files in a cache directory share it.
+
+    Args:
+        path (Path): The path to the mesh file.
+
+    Returns:
+        Path: The path to the cache directory.
+    """
+    if path.parent.name == CACHE_DIRECTORY:
+        return path.parent
+    return path.parent / CACHE_DIRECTORY
+
+
+def _remove_outdated(directory: Path, prefix: str, keep: str) -> None:
+    """Removes the cache entries of outdated file contents.
+
+    Args:
+        directory (Path): The cache directory.
+        prefix (str): The prefix of the names of the entries of a file.
+        keep (str): The name of the current entry.
+    """
+    for outdated in directory.iterdir():
+        # Entries that are written by other processes are kept
+        if outdated.name.startswith(prefix) and not outdated.name.startswith(keep) \
+                and ".tmp" not in outdated.name:
+            if outdated.is_dir():
+                shutil.rmtree(outdated, ignore_errors=True)
+            else:
+                outdated.unlink(missing_ok=True)
+
+
+def read_mesh(path: Path, use_cache: bool = True) -> MeshData:
+    """Reads a mesh file into NumPy arrays without SOFA.
+
+    The arrays are cached as .npy files in a hidden directory next to the mesh file, 
+    keyed by a hash of the content of the file. Later reads of the same content 
+    only hash the file and map the cached arrays into memory.
+
+    Args:
+        path (Path): The path to the mesh file.
+        use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If the path is no file.
+        ValueError: If the file format is unknown or the file is no valid mesh.
+
+    Returns:
+        MeshData: The mesh. Cached arrays are read-only.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"Path {path} does not refer to a valid file")
+    if path.suffix not in ending_to_reader:
+        raise ValueError(f"Path {path} refers to a file of format {path.suffix}, which is unkown.")
+
+    data = path.read_bytes()
+    if not use_cache:
+        return ending_to_reader[path.suffix](data)
+
+    entry = _cache_directory(path) / f"{path.name}-{_digest(data)}"
+    if entry.is_dir():
+        try:
+            return MeshData(*(np.load(entry / f"{field}.npy", mmap_mode="r")
+                              for field in MeshData._fields))
+        except (OSError, ValueError):
+            # Incomplete entry, it is replaced below
+            pass
+
+    mesh = ending_to_reader[path.suffix](data)
+    try:
+        _write_cache(entry, mesh)
+    except OSError:
+        # The cache is optional, e.g. in read-only directories
+        pass
+    return mesh
+
+
+def _write_cache(entry: Path, mesh: MeshData) -> None:
+    """Writes the arrays of a mesh into a cache entry and removes the 
+    outdated entries of the same file.
+
+    Args:
+        entry (Path): The directory of the entry.
+        mesh (MeshData): The mesh.
+    """
+    temporary = entry.with_name(f"{entry.name}.tmp{os.getpid()}")
+    temporary.mkdir(parents=True, exist_ok=True)
+    for field, array in zip(MeshData._fields, mesh):
+        np.save(temporary / f"{field}.npy", array)
+
+    source = entry.name.rsplit("-", 1)[0]
+    _remove_outdated(entry.parent, f"{source}-", entry.name)
+    try:
+        os.replace(temporary, entry)
+    except OSError:
+        # Written by another process in the meantime
+        shutil.rmtree(temporary, ignore_errors=True)
+
+
+def node_bandwidth(mesh: MeshData) -> int:
+    """Computes the largest difference between the indices of two nodes sharing an element.
+    The bandwidth of the stiffness matrix in blocks equals this value.
+
+    Args:
+        mesh (MeshData): The mesh.
+
+    Returns:
+        int: The bandwidth.
+    """
+    elements = mesh.tetrahedra if len(mesh.tetrahedra) else mesh.triangles
+    if not len(elements):
+        return 0
+    return int(np.max(elements.max(axis=1) - elements.min(axis=1)))
+
+
+def reorder_nodes(mesh: MeshData) -> Tuple[MeshData, np.ndarray]:
+    """Renumbers the nodes with the reverse Cuthill-McKee algorithm to reduce the bandwidth.
+    The triangles and the tetrahedra are remapped to the new numbering.
+
+    Args:
+        mesh (MeshData): The mesh.
+
+    Returns:
+        Tuple[MeshData, np.ndarray]: The reordered mesh and the permutation, 
+        i.e. the old index of each new node.
+    """
+    count = len(mesh.positions)
+    elements = mesh.tetrahedra if len(mesh.tetrahedra) else mesh.triangles
+    width = elements.shape[1]
+    rows = np.repeat(elements, width, axis=1).ravel()
+    columns = np.tile(elements, (1, width)).ravel()
+    graph = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, columns)),
+                       shape=(count, count))
+    order = reverse_cuthill_mckee(graph, symmetric_mode=True).astype(np.int64)
+
+    inverse = np.empty(count, dtype=np.int64)
+    inverse[order] = np.arange(count)
+    return MeshData(mesh.positions[order], inverse[mesh.triangles],
+                    inverse[mesh.tetrahedra]), order
+
+
+def write_gmsh(path: Path, mesh: MeshData) -> None:
+    """Writes a mesh as an ASCII Gmsh 2.2 file, which all loaders of SOFA can read.
+
+    Args:
+        path (Path): The path to the file.
+        mesh (MeshData): The mesh.
+    """
+    positions = np.column_stack(
+        (np.arange(1, len(mesh.positions) + 1), mesh.positions))
+    elements = []
+    for element_type, nodes in ((_GMSH_TRIANGLE, mesh.triangles),
+                                (_GMSH_TETRAHEDRON, mesh.tetrahedra)):
+        # Two tags: the physical and the elementary entity
+        header = np.tile([element_type, 2, 0, 1], (len(nodes), 1))
+        elements.append(np.column_stack((header, nodes + 1)))
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"$MeshFormat\n2.2 0 8\n$EndMeshFormat\n$Nodes\n{len(positions)}\n")
+        np.savetxt(file, positions, fmt=["%d", "%.17g", "%.17g", "%.17g"])
+        file.write(f"$EndNodes\n$Elements\n{sum(map(len, elements))}\n")
+        number = 1
+        for block in elements:
+            np.savetxt(file, np.column_stack(
+                (np.arange(number, number + len(block)), block)), fmt="%d")
+            number += len(block)
+        file.write("$EndElements\n")
+
+
+def surface_node_indices(positions: np.ndarray, vertices: np.ndarray) -> Optional[np.ndarray]:
+    """Finds the nodes of the volumetric mesh the vertices of a surface mesh lie on.
+    Surface meshes exported with the volumetric mesh lie on its first nodes in the same order, 
+    which changes when the volumetric mesh is reordered by `reorder_nodes`.
+    The positions are compared instead of the order, as the readers of SOFA 
+    and of this module may order the vertices differently.
+
+    Args:
+        positions (np.ndarray): The positions of the nodes of the volumetric mesh with shape (N, 3).
+        vertices (np.ndarray): The positions of the vertices of the surface mesh with shape (S, 3).
+
+    Raises:
+        ValueError: If a vertex of the surface mesh lies on no node of the volumetric mesh.
+
+    Returns:
+        Optional[np.ndarray]: The index of the node of each vertex with shape (S,), 
+        None if the vertices lie on the first nodes in the same order.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    positions = np.asarray(positions, dtype=float)
+    # Surface formats like STL store single precision positions
+    extent = np.ptp(positions, axis=0).max() if len(positions) else 0.
+    tolerance = 1e-5 * extent
+    count = len(vertices)
+    if count <= len(positions) and np.allclose(vertices, positions[:count],
+                                               rtol=0, atol=tolerance):
+        return None
+
+    distances, indices = cKDTree(positions).query(vertices, distance_upper_bound=tolerance)
+    if np.any(np.isinf(distances)):
+        raise ValueError("The surface mesh does not lie on the nodes of the volumetric mesh")
+    return indices.astype(np.int64)
+
+
+def boundary_faces(mesh: MeshData) -> np.ndarray:
+    """Extracts the boundary of a tetrahedral mesh, i.e. the faces belonging to exactly 
+    one tetrahedron. The faces are oriented with their normals pointing outwards.
+
+    Args:
+        mesh (MeshData): The mesh.
+
+    Returns:
+        np.ndarray: The node indices of the faces with shape (F, 3), 
+        in the order of their tetrahedra.
+    """
+    # The faces of each tetrahedron and the node opposite to them
+    faces = mesh.tetrahedra[:, [[1, 2, 3], [0, 3, 2], [0, 1, 3], [0, 2, 1]]].reshape(-1, 3)
+    opposite = mesh.tetrahedra.reshape(-1)
+
+    _, first, counts = np.unique(np.sort(faces, axis=1), axis=0,
+                                 return_index=True, return_counts=True)
+    boundary = np.sort(first[counts == 1])
+    faces, opposite = faces[boundary], opposite[boundary]
+
+    corners = mesh.positions[faces]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    inwards = np.einsum("ij,ij->i", normals,
+                        mesh.positions[opposite] - corners[:, 0]) > 0
+    faces[inwards] = faces[inwards][:, [0, 2, 1]]
+    return faces
+
+
+def vertex_normals(mesh: MeshData) -> np.ndarray:
+    """Computes the normals of the nodes as the area weighted mean of the normals of their triangles.
+
+    Args:
+        mesh (MeshData): The mesh.
+
+    Returns:
+        np.ndarray: The unit normals with shape (N, 3). Nodes without triangles have zero normals.
+    """
+    corners = mesh.positions[mesh.triangles]
+    face_normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    normals = np.zeros((len(mesh.positions), 3))
+    for corner in range(3):
+        np.add.at(normals, mesh.triangles[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=normals, where=lengths > 0)
+
+
+def _read_derived(path: Path, names: Tuple[str, ...],
+                  derive: Callable[[MeshData], Tuple[np.ndarray, ...]],
+                  use_cache: bool) -> Tuple[np.ndarray, ...]:
+    """Reads arrays derived from a mesh, which are cached next to the arrays of `read_mesh`.
+
+    Args:
+        path (Path): The path to the mesh file.
+        names (Tuple[str, ...]): The unique names of the derived arrays.
+        derive (Callable[[MeshData], Tuple[np.ndarray, ...]]): Derives the arrays from the mesh.
+        use_cache (bool): Whether to use and create the cache.
+
+    Returns:
+        Tuple[np.ndarray, ...]: The positions of the nodes followed by the derived arrays.
+    """
+    path = Path(path)
+    entry = None
+    if use_cache and path.is_file():
+        entry = _cache_directory(path) / f"{path.name}-{_digest(path.read_bytes())}"
+        try:
+            return tuple(np.load(entry / f"{name}.npy", mmap_mode="r")
+                         for name in ("positions", *names))
+        except (OSError, ValueError):
+            # Not cached yet
+            pass
+
+    mesh = read_mesh(path, use_cache)
+    arrays = derive(mesh)
+    if entry is not None and entry.is_dir():
+        for name, array in zip(names, arrays):
+            temporary = entry / f"{name}.npy.tmp{os.getpid()}"
+            try:
+                with open(temporary, "wb") as file:
+                    np.save(file, array)
+                os.replace(temporary, entry / f"{name}.npy")
+            except OSError:
+                # The cache is optional, e.g. in read-only directories
+                temporary.unlink(missing_ok=True)
+    return (mesh.positions, *arrays)
+
+
+def _volume_boundary(mesh: MeshData) -> MeshData:
+    """Gets the boundary of a volumetric mesh as surface mesh.
+
+    Args:
+        mesh (MeshData): The volumetric mesh.
+
+    Raises:
+        ValueError: If the mesh contains no tetrahedra.
+
+    Returns:
+        MeshData: The surface with all nodes of the volumetric mesh and without tetrahedra.
+    """
+    if not len(mesh.tetrahedra):
+        raise ValueError("Mesh contains no tetrahedra.")
+    return MeshData(mesh.positions, boundary_faces(mesh), np.zeros((0, 4), dtype=np.int64))
+
+
+def read_surface(path: Path, use_cache: bool = True) -> MeshData:
+    """Reads the boundary of a volumetric mesh as surface mesh, see `boundary_faces`.
+    The surface keeps all nodes of the volumetric mesh, so it can be mapped one-to-one onto them.
+    The faces are cached next to the arrays of `read_mesh`.
+
+    Args:
+        path (Path): The path to the volumetric mesh file.
+        use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If the path is no file.
+        ValueError: If the file format is unknown or the file is no valid volumetric mesh.
+
+    Returns:
+        MeshData: The surface mesh without tetrahedra.
+    """
+    positions, faces = _read_derived(
+        path, ("boundary",), lambda mesh: (_volume_boundary(mesh).triangles,), use_cache)
+    return MeshData(positions, faces, np.zeros((0, 4), dtype=np.int64))
+
+
+def decimate_surface(surface: MeshData, target_triangles: int) -> Tuple[np.ndarray, MeshData]:
+    """Decimates a surface mesh by vertex clustering until it has at most the target number 
+    of triangles. The nodes are clustered in a uniform grid, whose resolution is searched. 
+    Each cluster is represented by its node closest to the mean of the cluster, so the nodes 
+    of the decimated surface are a subset of the original nodes. If no grid meets the target,
+    the coarsest grid that keeps any triangles is used.
+
+    Args:
+        surface (MeshData): The surface mesh.
+        target_triangles (int): The maximum number of triangles.
+
+    Raises:
+        ValueError: If the target is less than 1.
+
+    Returns:
+        Tuple[np.ndarray, MeshData]: The indices of the kept nodes in the original mesh 
+        and the decimated surface without tetrahedra.
+    """
+    if target_triangles < 1:
+        raise ValueError("The target number of triangles must be positive.")
+    used = np.unique(surface.triangles)
+    triangles = np.searchsorted(used, surface.triangles)
+    points = np.asarray(surface.positions)[used]
+    lower = points.min(axis=0)
+    extent = max(float(np.ptp(points, axis=0).max()), np.finfo(float).tiny)
+
+    def cluster(resolution: int) -> np.ndarray:
+        cells = np.minimum(((points - lower) / extent * resolution).astype(np.int64),
+                           resolution - 1)
+        _, clusters = np.unique(cells, axis=0, return_inverse=True)
+        clusters = clusters.reshape(-1)
+        count = clusters.max() + 1
+        means = np.stack([np.bincount(clusters, points[:, axis], count)
+                          for axis in range(3)], axis=1) / np.bincount(clusters)[:, None]
+        distances = np.linalg.norm(points - means[clusters], axis=1)
+        # The closest node comes first in each cluster
+        order = np.lexsort((distances, clusters))
+        first = order[np.r_[True, clusters[order][1:] != clusters[order][:-1]]]
+        representatives = first[clusters]
+
+        clustered = representatives[triangles]
+        clustered = clustered[(clustered[:, 0] != clustered[:, 1]) &
+                              (clustered[:, 1] != clustered[:, 2]) &
+                              (clustered[:, 0] != clustered[:, 2])]
+        _, unique = np.unique(np.sort(clustered, axis=1), axis=0, return_index=True)
+        return clustered[np.sort(unique)]
+
+    decimated = triangles
+    if len(triangles) > target_triangles:
+        # Double the resolution until the target is exceeded, then bisect
+        low, high = 1, 2
+        while len(cluster(high)) <= target_triangles and high < 1 << 16:
+            low, high = high, high * 2
+        decimated = cluster(low)
+        while high - low > 1:
+            middle = (low + high) // 2
+            candidate = cluster(middle)
+            if len(candidate) <= target_triangles:
+                low, decimated = middle, candidate
+            else:
+                high = middle
+        # Too coarse grids merge the surface into a few nodes without triangles
+        while not len(decimated):
+            low += 1
+            decimated = cluster(low)
+
+    kept = np.unique(decimated)
+    indices = used[kept]
+    return indices, MeshData(np.asarray(surface.positions)[indices],
+                             np.searchsorted(kept, decimated), np.zeros((0, 4), dtype=np.int64))
+
+
+def read_level_of_detail(path: Path, target_triangles: int,
+                         use_cache: bool = True) -> Tuple[np.ndarray, MeshData]:
+    """Reads the boundary of a volumetric mesh decimated to at most the target number 
+    of triangles, see `decimate_surface`. The result is cached next to the arrays of `read_mesh`.
+
+    Args:
+        path (Path): The path to the volumetric mesh file.
+        target_triangles (int): The maximum number of triangles.
+        use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+    Raises:
+        FileNotFoundError: If the path is no file.
+        ValueError: If the file is no valid volumetric mesh or the target is less than 1.
+
+    Returns:
+        Tuple[np.ndarray, MeshData]: The indices of the kept nodes in the volumetric mesh 
+        and the decimated surface without tetrahedra.
+    """
+    if target_triangles < 1:
+        raise ValueError("The target number of triangles must be positive.")
+
+    def derive(mesh: MeshData) -> Tuple[np.ndarray, np.ndarray]:
+        indices, decimated = decimate_surface(_volume_boundary(mesh), target_triangles)
+        return indices, decimated.triangles
+
+    positions, indices, triangles = _read_derived(
+        path, (f"lod{target_triangles}_indices", f"lod{target_triangles}_triangles"),
+        derive, use_cache)
+    return indices, MeshData(np.asarray(positions)[indices], triangles,
+                             np.zeros((0, 4), dtype=np.int64))
+
+
 class MeshLoader():
     """Loads meshes into the Sofa Scene."""
 
@@ -57,6 +998,7 @@ class MeshLoader():
             scaling_factor (float, optional): The scaling factor of the model. Defaults to 1..
         """
         self._path: list = [None, None]
+        self._surface_from_volume = False
         self._name = name
         self._scaling = scaling_factor
 
@@ -106,6 +1048,50 @@ class MeshLoader():
             raise ValueError(f"File {path} empty! Not a valid mesh")
 
         self._path[mode.value] = path
+        if mode == Mode.SURFACE:
+            self._surface_from_volume = False
+
+    def derive_surface(self) -> None:
+        """Uses the boundary of the volumetric mesh as surface mesh instead of a surface mesh file, 
+        see `read_surface`. The derived surface has no SOFA loader and is only available with `read`.
+
+        Raises:
+            FileNotFoundError: If no volumetric mesh is loaded.
+        """
+        if self._path[Mode.VOLUMETRIC.value] is None:
+            raise FileNotFoundError(
+                "Please call load_file with a volumetric mesh before deriving the surface")
+        self._path[Mode.SURFACE.value] = None
+        self._surface_from_volume = True
+
+    @property
+    def surface_from_volume(self) -> bool:
+        """Whether the surface mesh is derived from the volumetric mesh."""
+        return self._surface_from_volume
+
+    def surface_nodes(self, use_cache: bool = True) -> Optional[np.ndarray]:
+        """Finds the nodes of the volumetric mesh the vertices of the surface mesh lie on, 
+        see `surface_node_indices`.
+
+        Args:
+            use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If a path is not set.
+            ValueError: If a vertex of the surface mesh lies on no node of the volumetric mesh.
+
+        Returns:
+            Optional[np.ndarray]: The index of the node of each vertex, None if the vertices 
+            lie on the first nodes in the same order or if the surface is derived.
+        """
+        if self._surface_from_volume:
+            return None
+        if None in self._path:
+            raise FileNotFoundError(
+                "Please call load_file before querying mesh_generation")
+        return surface_node_indices(
+            read_mesh(self._path[Mode.VOLUMETRIC.value], use_cache).positions,
+            read_mesh(self._path[Mode.SURFACE.value], use_cache).positions)
 
     def load_mesh_into(self, node: Sofa.Core.Node, mode: Mode) -> Sofa.Core.Object:
         """Loads mesh into node.
@@ -116,6 +1102,7 @@ class MeshLoader():
 
         Raises:
             FileNotFoundError: If path is not set.
+            ValueError: If the surface is derived from the volumetric mesh.
 
         Returns:
             Sofa.Core.Object: The loaded mesh SOFA object.
@@ -123,6 +1110,8 @@ class MeshLoader():
 
         path: Optional[Path] = self._path[mode.value]
 
+        if mode == Mode.SURFACE and self._surface_from_volume:
+            raise ValueError("The derived surface has no loader, please use read instead")
         if path is None:
             raise FileNotFoundError(
                 "Please call load_file before querying mesh_generation")
@@ -135,6 +1124,56 @@ class MeshLoader():
         )
         return mesh
 
+    def read(self, mode: Mode, use_cache: bool = True) -> MeshData:
+        """Reads the mesh into NumPy arrays without SOFA, see `read_mesh` and `read_surface`.
+
+        Args:
+            mode (Mode): The type of the mesh.
+            use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If path is not set.
+
+        Returns:
+            MeshData: The mesh with positions scaled by the scaling factor.
+        """
+        if mode == Mode.SURFACE and self._surface_from_volume:
+            mesh = read_surface(self._path[Mode.VOLUMETRIC.value], use_cache)
+        else:
+            path: Optional[Path] = self._path[mode.value]
+            if path is None:
+                raise FileNotFoundError(
+                    "Please call load_file before querying mesh_generation")
+            mesh = read_mesh(path, use_cache)
+        if self._scaling == 1:
+            return mesh
+        return mesh._replace(positions=mesh.positions * self._scaling)
+
+    def read_level_of_detail(self, target_triangles: int,
+                             use_cache: bool = True) -> Tuple[np.ndarray, MeshData]:
+        """Reads the decimated boundary of the volumetric mesh, see `read_level_of_detail`.
+
+        Args:
+            target_triangles (int): The maximum number of triangles.
+            use_cache (bool, optional): Whether to use and create the cache. Defaults to True.
+
+        Raises:
+            FileNotFoundError: If the volumetric path is not set.
+
+        Returns:
+            Tuple[np.ndarray, MeshData]: The indices of the kept nodes in the volumetric mesh 
+            and the decimated surface with positions scaled by the scaling factor.
+        """
+        path: Optional[Path] = self._path[Mode.VOLUMETRIC.value]
+        if path is None:
+            raise FileNotFoundError(
+                "Please call load_file before querying mesh_generation")
+
+        indices, mesh = read_level_of_detail(path, target_triangles, use_cache)
+        if self._scaling == 1:
+            return indices, mesh
+        return indices, mesh._replace(positions=mesh.positions * self._scaling)
+
     def reference(self, mode: Mode) -> str:
         """References the loader in other SOFA objects.
 
@@ -0,0 +1,257 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module provides a persistent index of the models in a directory,
+so model libraries can be browsed without loading every mesh.
+
+Classes:
+    ModelIndex: Stores the metadata of the models of a directory in a JSON file.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .config import Config
+from .mesh_loader import Mode, boundary_faces, endings, read_mesh
+
+
+INDEX_FILE = ".model_index.json"
+# Increase when the entries change, so outdated indices are rebuilt
+_INDEX_VERSION = 1
+
+
+def _file_digest(path: Path) -> str:
+    """Computes the SHA-256 hash of a file.
+
+    Args:
+        path (Path): The path to the file.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelIndex():
+    """Index of the models in a directory.
+
+    A model consists of the mesh files sharing a file stem. The index stores the 
+    number of nodes, tetrahedra and surface triangles, the bounding box in mesh units, 
+    the default scale and the state of the files of every model in a JSON file.
+    On a refresh, only the models whose files changed are read again. A file counts as 
+    changed if its modification time or size changed and its hash differs.
+    """
+
+    def __init__(self, models_path: Path, index_path: Optional[Path] = None) -> None:
+        """Initializes the index and loads the index file if it exists.
+
+        Args:
+            models_path (Path): The directory containing the model files.
+            index_path (Optional[Path], optional): The path to the index file. 
+                Defaults to a hidden file in the model directory.
+        """
+        self._models_path = Path(models_path)
+        self._index_path = Path(index_path) if index_path is not None \
+            else self._models_path / INDEX_FILE
+        self._entries: Dict[str, dict] = self._load()
+
+    @property
+    def index_path(self) -> Path:
+        """The path to the index file."""
+        return self._index_path
+
+    def _load(self) -> Dict[str, dict]:
+        """Loads the entries of the index file.
+
+        Returns:
+            Dict[str, dict]: The entries, empty if the file is missing, invalid or outdated.
+        """
+        try:
+            with open(self._index_path, encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+            return {}
+        return index.get("models", {})
+
+    def _save(self) -> None:
+        """Replaces the index file atomically. Fails silently in read-only directories."""
+        temporary_path = self._index_path.with_name(
+            f"{self._index_path.name}.tmp{os.getpid()}")
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                json.dump({"version": _INDEX_VERSION, "models": self._entries},
+                          file, indent=1)
+            os.replace(temporary_path, self._index_path)
+        except OSError:
+            temporary_path.unlink(missing_ok=True)
+
+    def names(self) -> List[str]:
+        """Lists the models in the directory.
+
+        Returns:
+            List[str]: The sorted names of the models.
+        """
+        if not self._models_path.is_dir():
+            return []
+        suffixes = set(endings[Mode.SURFACE.value]) | set(endings[Mode.VOLUMETRIC.value])
+        # Hidden entries like .gitkeep, the mesh cache and the index are no models
+        return sorted({path.stem for path in self._models_path.iterdir()
+                       if not path.name.startswith(".") and path.suffix in suffixes})
+
+    def refresh(self, names: Optional[Iterable[str]] = None) -> Dict[str, dict]:
+        """Updates the entries of changed models and removes the entries of deleted ones.
+        The index file is only written if an entry changed.
+
+        Args:
+            names (Optional[Iterable[str]], optional): The models to refresh. 
+                Defaults to all models in the directory.
+
+        Returns:
+            Dict[str, dict]: The entries of all indexed models by name.
+        """
+        existing = self.names()
+        changed = False
+        if names is None:
+            names = existing
+            for name in set(self._entries) - set(existing):
+                del self._entries[name]
+                changed = True
+
+        for name in names:
+            if name not in existing:
+                changed |= self._entries.pop(name, None) is not None
+                continue
+            entry = self._update_entry(name, self._entries.get(name))
+            if entry is not self._entries.get(name):
+                self._entries[name] = entry
+                changed = True
+
+        if changed:
+            self._save()
+        return dict(self._entries)
+
+    def get(self, name: str) -> dict:
+        """Gets the up-to-date entry of a model.
+
+        Args:
+            name (str): The name of the model.
+
+        Raises:
+            KeyError: If the directory contains no model with this name.
+
+        Returns:
+            dict: The entry with the keys `nodes`, `tetrahedra`, `triangles`, `bounding_box`, 
+                `scale` and `files`. The counts and the bounding box are None if 
+                the meshes could not be read.
+        """
+        self.refresh([name])
+        return self._entries[name]
+
+    def _update_entry(self, name: str, entry: Optional[dict]) -> Optional[dict]:
+        """Creates the entry of a model or returns the given entry if no file changed.
+
+        Args:
+            name (str): The name of the model.
+            entry (Optional[dict]): The current entry of the model.
+
+        Returns:
+            Optional[dict]: The given entry if it is up-to-date, a new entry otherwise.
+        """
+        paths = sorted(path for path in self._models_path.glob(f"{name}.*")
+                       if path.stem == name)
+        stored = entry["files"] if entry is not None else {}
+        files = {}
+        modified = set(stored) != {path.name for path in paths}
+        content_changed = modified
+        for path in paths:
+            stat = path.stat()
+            state = stored.get(path.name)
+            if state is not None and state["mtime_ns"] == stat.st_mtime_ns \
+                    and state["size"] == stat.st_size:
+                files[path.name] = state
+                continue
+            files[path.name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                                "sha256": _file_digest(path)}
+            modified = True
+            content_changed |= state is None or state["sha256"] != files[path.name]["sha256"]
+
+        if not modified:
+            return entry
+        if not content_changed:
+            # Only touched, the metadata is still valid
+            return {**entry, "files": files}
+        return {**self._read_metadata(name), "scale": Config.get_default_scale(name),
+                "files": files}
+
+    def _read_metadata(self, name: str) -> dict:
+        """Reads the meshes of a model and extracts its metadata.
+
+        Args:
+            name (str): The name of the model.
+
+        Returns:
+            dict: The counts and the bounding box of the model.
+        """
+        metadata = {"nodes": None, "tetrahedra": None,
+                    "triangles": None, "bounding_box": None}
+
+        def find(suffixes: Iterable[str]) -> Optional[Path]:
+            return next((self._models_path / f"{name}{suffix}" for suffix in suffixes
+                         if (self._models_path / f"{name}{suffix}").is_file()), None)
+
+        volumetric_path = find(endings[Mode.VOLUMETRIC.value])
+        surface_path = find(suffix for suffix in endings[Mode.SURFACE.value]
+                            if suffix not in endings[Mode.VOLUMETRIC.value])
+        positions = None
+        try:
+            if volumetric_path is not None:
+                volume = read_mesh(volumetric_path, use_cache=False)
+                # Without a surface mesh file, the surface is derived from the volume
+                metadata.update(nodes=len(volume.positions),
+                                tetrahedra=len(volume.tetrahedra),
+                                triangles=len(boundary_faces(volume)) if len(volume.tetrahedra)
+                                else len(volume.triangles))
+                positions = volume.positions
+            if surface_path is not None:
+                surface = read_mesh(surface_path, use_cache=False)
+                metadata["triangles"] = len(surface.triangles)
+                if volumetric_path is None:
+                    positions = surface.positions
+        except ValueError:
+            # Invalid meshes are listed without metadata
+            return {key: None for key in metadata}
+
+        if positions is not None and len(positions):
+            metadata["bounding_box"] = [np.min(positions, axis=0).tolist(),
+                                        np.max(positions, axis=0).tolist()]
+        return metadata
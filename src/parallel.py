@@ -0,0 +1,113 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the ChunkedExecutor class, which runs array computations 
+in chunks on a persistent thread pool."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ChunkedExecutor:
+    """This class splits array computations into chunks and runs them on a persistent thread pool.
+    NumPy releases the GIL for most operations on large arrays, so the chunks run in parallel.
+    The chunks are sized to fit into the per core cache.
+    """
+
+    # Working set of one chunk in bytes, about the size of a per core L2 cache
+    CHUNK_BYTES = 1024 * 1024
+    # Chunks below this number of rows cost more in scheduling than they save
+    MIN_CHUNK_ROWS = 2048
+
+    _shared: Optional["ChunkedExecutor"] = None
+
+    def __init__(self, workers: int = 1) -> None:
+        """Initializes the executor. The thread pool is only created if more than one worker is used.
+
+        Args:
+            workers (int, optional): The number of threads. Defaults to 1.
+
+        Raises:
+            ValueError: If workers is smaller than 1.
+        """
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1.")
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="msr_worker") if workers > 1 else None
+
+    @classmethod
+    def shared(cls, workers: int) -> "ChunkedExecutor":
+        """Returns the executor shared by all controllers of the process.
+        The executor is replaced if the number of workers changed or it was shut down.
+
+        Args:
+            workers (int): The number of threads.
+
+        Returns:
+            ChunkedExecutor: The shared executor.
+        """
+        if cls._shared is None or cls._shared.workers != workers \
+                or (workers > 1 and cls._shared._pool is None):
+            if cls._shared is not None:
+                cls._shared.shutdown()
+            cls._shared = cls(workers)
+        return cls._shared
+
+    def chunk_rows(self, row_bytes: int) -> int:
+        """Calculates the number of rows of a chunk.
+
+        Args:
+            row_bytes (int): The number of bytes one row of the computation works on.
+
+        Returns:
+            int: The number of rows per chunk.
+        """
+        return max(self.MIN_CHUNK_ROWS, self.CHUNK_BYTES // max(1, row_bytes))
+
+    def map(self, func: Callable[[int, int], T], length: int, row_bytes: int) -> List[T]:
+        """Calls the function once per chunk with the start and stop index of the chunk.
+        The chunks are processed on the thread pool, 
+        a single chunk and executors with one worker run on the calling thread.
+
+        Args:
+            func (Callable[[int, int], T]): The function that processes the rows [start, stop).
+            length (int): The number of rows.
+            row_bytes (int): The number of bytes one row of the computation works on.
+
+        Returns:
+            List[T]: The results of the chunks in order.
+        """
+        rows = self.chunk_rows(row_bytes)
+        if self._pool is None or length <= rows:
+            return [func(0, length)]
+        futures = [self._pool.submit(func, start, min(start + rows, length))
+                   for start in range(0, length, rows)]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """Shuts down the thread pool after all submitted chunks are processed."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
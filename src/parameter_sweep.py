@@ -0,0 +1,269 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module runs sweeps over simulation settings on a pool of headless worker processes.
+
+A sweep is described by the settings shared by all runs (see `src.headless.apply_settings`), 
+a list of variations and a grid of values, e.g.:
+```
+{
+    "base": {"model": "beam", "poisson_ratio": 0.47, "youngs_modulus": 1e8,
+             "density": 1100, "remanence": 0.35},
+    "variations": [{"magnetic_dir": [0, 0, 1]}, {"magnetic_dir": [0, 1, 0]}],
+    "grid": {"magnetic_force": [0.01, 0.02, 0.05]}
+}
+```
+runs every variation with every combination of the grid values, here 6 runs.
+Run `python -m src.parameter_sweep --help` for the command line options.
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing as mp
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+def expand_grid(base: Dict[str, Any], grid: Optional[Dict[str, List[Any]]] = None,
+                variations: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Creates the settings of all runs of a sweep.
+
+    Args:
+        base (Dict[str, Any]): The settings shared by all runs.
+        grid (Optional[Dict[str, List[Any]]], optional): The values of each swept setting. 
+            Every combination of values is run. Defaults to None.
+        variations (Optional[List[Dict[str, Any]]], optional): Settings that are changed together. 
+            Every variation is combined with every grid point. Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: The settings of each run.
+    """
+    grid = grid or {}
+    variations = variations or [{}]
+    keys = list(grid)
+    runs = []
+    for variation in variations:
+        for values in itertools.product(*(grid[key] for key in keys)):
+            runs.append({**base, **variation, **dict(zip(keys, values))})
+    return runs
+
+
+# The error of the worker initialization, which fails all runs of the worker
+_init_error: Optional[str] = None
+
+
+def _init_worker() -> None:
+    """Imports SOFA and loads the plugins once per worker process, 
+    so they are reused by all runs of the worker.
+    A failure is kept for the runs of the worker, as the pool would otherwise 
+    replace the failed worker over and over again.
+    """
+    global _init_error
+    try:
+        # Imported here, so only the workers load SOFA
+        import Sofa.Core
+        from src import Config
+
+        Config.set_headless(True)
+        Config.set_default_plugin_list()
+        plugins = [plugin for plugin in Config.get_plugin_list()
+                   if not plugin.startswith("Sofa.GL.")]
+        Sofa.Core.Node("plugins").addObject("RequiredPlugin", pluginName=plugins)
+    except Exception as error:  # Reported by every run of the worker
+        _init_error = f"Worker initialization failed with {type(error).__name__}: {error}"
+
+
+def _run(job: tuple) -> Dict[str, Any]:
+    """Runs a single simulation of the sweep in a worker process.
+
+    Args:
+        job (tuple): The settings, the maximum number of steps, the stop velocity 
+            and the window and tolerances of the steady state.
+
+    Returns:
+        Dict[str, Any]: The results of the run, or the error message if it failed.
+    """
+    if _init_error is not None:
+        return {"error": _init_error}
+
+    # Imported here, so only the workers load SOFA
+    import Sofa.Simulation
+    from src import ConvergenceMonitor, SimulationAnalyser, headless
+
+    settings, steps, stop_velocity, steady = job
+    root = None
+    try:
+        headless.apply_settings(settings)
+        root = headless.build()
+        stop_criterion = None if stop_velocity is None else headless.velocity_below(
+            stop_velocity)
+        monitor = None
+        if steady is not None:
+            monitor = ConvergenceMonitor(SimulationAnalyser(root), *steady)
+        return headless.run(root, steps, stop_criterion, monitor=monitor)
+    except Exception as error:  # The sweep continues with the next run
+        return {"error": f"{type(error).__name__}: {error}"}
+    finally:
+        # Releases the scene of a failed run too, as the worker runs many simulations
+        if root is not None:
+            Sofa.Simulation.unload(root)
+
+
+def consolidate(runs: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Consolidates the results of all runs into arrays with one row per run.
+    The final positions of all runs are concatenated, as the runs can use models 
+    with different numbers of nodes. The positions of run i are 
+    `positions[position_offsets[i]:position_offsets[i + 1]]`.
+
+    Args:
+        runs (List[Dict[str, Any]]): The settings of each run.
+        results (List[Dict[str, Any]]): The results of each run.
+
+    Returns:
+        Dict[str, np.ndarray]: The consolidated results:
+            - settings: The settings of each run as JSON.
+            - errors: The error message of each run, empty if it succeeded.
+            - steps, stopped: The number of steps and whether the stop criterion was met.
+            - steady_state_step: The first step of the steady state, -1 if it was not reached.
+            - max_deformation, min_deformation: The extrema of the deformation of all nodes per axis.
+            - max_stress: The maximum von Mises stress in Pa.
+            - positions, position_offsets: The final positions of all runs.
+    """
+    count = len(runs)
+    consolidated = {
+        "settings": np.array([json.dumps(run) for run in runs]),
+        "errors": np.array([result.get("error", "") for result in results]),
+        "steps": np.zeros(count, dtype=int),
+        "stopped": np.zeros(count, dtype=bool),
+        "steady_state_step": np.full(count, -1),
+        "max_deformation": np.full((count, 3), np.nan),
+        "min_deformation": np.full((count, 3), np.nan),
+        "max_stress": np.full(count, np.nan),
+    }
+    positions = []
+    offsets = np.zeros(count + 1, dtype=int)
+    for i, result in enumerate(results):
+        offsets[i + 1] = offsets[i]
+        if "error" in result:
+            continue
+        consolidated["steps"][i] = result["steps"]
+        consolidated["stopped"][i] = result["stopped"]
+        consolidated["steady_state_step"][i] = result["steady_state_step"]
+        consolidated["max_deformation"][i] = result["max_deformation"].max(axis=0)
+        consolidated["min_deformation"][i] = result["min_deformation"].min(axis=0)
+        consolidated["max_stress"][i] = result["max_stress"]
+        positions.append(result["positions"])
+        offsets[i + 1] += len(result["positions"])
+
+    consolidated["positions"] = np.concatenate(positions) if positions else np.zeros((0, 3))
+    consolidated["position_offsets"] = offsets
+    return consolidated
+
+
+def run_sweep(runs: List[Dict[str, Any]], steps: int, processes: Optional[int] = None,
+              stop_velocity: Optional[float] = None, steady_window: int = 20,
+              steady_energy: Optional[float] = None,
+              steady_displacement: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """Runs all simulations of a sweep on a process pool.
+    Each worker process imports SOFA and loads the plugins once and then runs many simulations.
+
+    Args:
+        runs (List[Dict[str, Any]]): The settings of each run.
+        steps (int): The maximum number of steps of each run.
+        processes (Optional[int], optional): The number of worker processes. 
+            Defaults to the number of cores, but not more than the number of runs.
+        stop_velocity (Optional[float], optional): Stops a run once no node moves faster 
+            than this speed in m/s. Defaults to None.
+        steady_window (int, optional): The number of consecutive steps below the steady state 
+            tolerances. Defaults to 20.
+        steady_energy (Optional[float], optional): Stops a run once the kinetic energy stays 
+            below this tolerance in J. Defaults to None.
+        steady_displacement (Optional[float], optional): Stops a run once no node moves further 
+            than this tolerance in m per step. Defaults to None.
+
+    Raises:
+        ValueError: If there are no runs.
+
+    Returns:
+        Dict[str, np.ndarray]: The consolidated results, see `consolidate`.
+    """
+    if len(runs) == 0:
+        raise ValueError("Sweep must contain at least one run.")
+    if processes is None:
+        processes = min(os.cpu_count() or 1, len(runs))
+    steady = None
+    if steady_energy is not None or steady_displacement is not None:
+        steady = (steady_window, steady_energy, steady_displacement)
+
+    # Spawn, as SOFA is not fork safe and forking is not supported on Windows
+    context = mp.get_context("spawn")
+    with context.Pool(processes, initializer=_init_worker) as pool:
+        results = pool.map(
+            _run, [(run, steps, stop_velocity, steady) for run in runs], chunksize=1)
+    return consolidate(runs, results)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs a sweep from the command line and writes the consolidated results to a .npz file.
+
+    Args:
+        argv (Optional[List[str]], optional): The command line arguments. 
+            Defaults to the arguments of the process.
+    """
+    parser = argparse.ArgumentParser(
+        description="Runs a sweep over simulation settings without the SOFA GUI.")
+    parser.add_argument("sweep", type=Path,
+                        help="JSON file with the base settings, variations and grid of the sweep")
+    parser.add_argument("-o", "--output", type=Path, default=Path("sweep.npz"),
+                        help="the .npz file the consolidated results are written to")
+    parser.add_argument("-n", "--steps", type=int, default=1000,
+                        help="the maximum number of steps of each run")
+    parser.add_argument("-j", "--processes", type=int, default=None,
+                        help="the number of worker processes, defaults to the number of cores")
+    parser.add_argument("--stop-velocity", type=float, default=None,
+                        help="stop a run once no node is faster than this speed in m/s")
+    parser.add_argument("--steady-energy", type=float, default=None,
+                        help="stop a run once the kinetic energy stays below this tolerance in J")
+    parser.add_argument("--steady-displacement", type=float, default=None,
+                        help="stop a run once no node moves further than this tolerance in m per step")
+    parser.add_argument("--steady-window", type=int, default=20,
+                        help="the number of consecutive steps below the steady state tolerances")
+    args = parser.parse_args(argv)
+
+    with open(args.sweep, encoding="utf-8") as file:
+        sweep = json.load(file)
+    runs = expand_grid(sweep.get("base", {}), sweep.get("grid"), sweep.get("variations"))
+
+    results = run_sweep(runs, args.steps, args.processes, args.stop_velocity,
+                        args.steady_window, args.steady_energy, args.steady_displacement)
+    np.savez(args.output, **results)
+
+    failed = np.count_nonzero(results["errors"])
+    print(f"Ran {len(runs)} simulations ({failed} failed), results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
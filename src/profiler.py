@@ -0,0 +1,214 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the Profiler, which records the wall time of the simulation callbacks,
+and the ProfilerController, which records the wall time of whole animation steps."""
+
+import csv
+import json
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+import Sofa
+
+
+class Profiler:
+    """This class records wall times per step into preallocated ring buffers, 
+    one for each measured callback, and summarizes them.
+    Only the latest `capacity` steps of each callback are kept.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """Initializes the profiler.
+
+        Args:
+            capacity (int, optional): The number of steps kept per callback. Defaults to 4096.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        self._capacity = capacity
+        self._buffers: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+
+    def _buffer(self, name: str) -> np.ndarray:
+        """Returns the ring buffer of the callback, which is created on first use.
+
+        Args:
+            name (str): The name of the callback.
+
+        Returns:
+            np.ndarray: The ring buffer.
+        """
+        if name not in self._buffers:
+            self._buffers[name] = np.empty(self._capacity)
+            self._counts[name] = 0
+        return self._buffers[name]
+
+    def record(self, name: str, duration: float) -> None:
+        """Records the wall time of one call.
+
+        Args:
+            name (str): The name of the callback.
+            duration (float): The wall time in s.
+        """
+        buffer = self._buffer(name)
+        count = self._counts[name]
+        buffer[count % self._capacity] = duration
+        self._counts[name] = count + 1
+
+    def instrument(self, obj: Any, method_name: str = "onAnimateBeginEvent") -> None:
+        """Replaces the method of the object with a wrapper that records its wall time.
+        The recordings are named `<class name>.<method name>`.
+
+        Args:
+            obj (Any): The object, e.g. a controller.
+            method_name (str, optional): The name of the method. Defaults to "onAnimateBeginEvent".
+        """
+        method = getattr(obj, method_name)
+        name = f"{type(obj).__name__}.{method_name}"
+        buffer = self._buffer(name)
+        counts = self._counts
+        capacity = self._capacity
+        clock = time.perf_counter
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            result = method(*args, **kwargs)
+            count = counts[name]
+            buffer[count % capacity] = clock() - start
+            counts[name] = count + 1
+            return result
+
+        setattr(obj, method_name, timed)
+
+    def get_names(self) -> List[str]:
+        """Returns the names of all measured callbacks.
+
+        Returns:
+            List[str]: The names in the order they were first measured.
+        """
+        return list(self._buffers)
+
+    def get_samples(self, name: str) -> np.ndarray:
+        """Returns the kept wall times of the callback in chronological order.
+
+        Args:
+            name (str): The name of the callback.
+
+        Raises:
+            KeyError: If the callback was never measured.
+
+        Returns:
+            np.ndarray: The wall times in s.
+        """
+        count = self._counts[name]
+        buffer = self._buffers[name]
+        if count <= self._capacity:
+            return buffer[:count].copy()
+        start = count % self._capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Summarizes the kept wall times of each callback.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The number of recorded calls 
+            and the mean, median, 95th percentile and maximum in ms, mapped to the callback names.
+            Callbacks without recordings are left out.
+        """
+        summary = {}
+        for name in self._buffers:
+            samples = self.get_samples(name) * 1e3
+            if len(samples) == 0:
+                continue
+            p50, p95 = np.percentile(samples, [50, 95])
+            summary[name] = {
+                "count": self._counts[name],
+                "mean_ms": float(samples.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "max_ms": float(samples.max()),
+            }
+        return summary
+
+    def export(self, path: Path) -> None:
+        """Writes the summary to a JSON or CSV file, depending on the file extension.
+
+        Args:
+            path (Path): The path of the .json or .csv file.
+
+        Raises:
+            ValueError: If the file extension is neither .json nor .csv.
+        """
+        path = Path(path)
+        summary = self.summary()
+        if path.suffix == ".json":
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(summary, file, indent=4)
+        elif path.suffix == ".csv":
+            fields = ["count", "mean_ms", "p50_ms", "p95_ms", "max_ms"]
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["name"] + fields)
+                for name, values in summary.items():
+                    writer.writerow([name] + [values[field] for field in fields])
+        else:
+            raise ValueError("Profile must be exported to a .json or .csv file.")
+
+
+class ProfilerController(Sofa.Core.Controller):
+    """Controller that records the wall time from the beginning to the end of each animation step.
+    It should be the first object of the root node, so that it begins the measurement 
+    before all other controllers are called.
+    """
+
+    NAME = "animate"
+
+    def __init__(self, profiler: Profiler) -> None:
+        """Initializes the controller.
+
+        Args:
+            profiler (Profiler): The profiler the steps are recorded in.
+        """
+        super().__init__(name="ProfilerController")
+        self.profiler = profiler
+        self._start = None
+
+    def onAnimateBeginEvent(self, _) -> None:
+        """Method that is automatically called at the beginning of the Sofa animation step.
+        """
+        self._start = time.perf_counter()
+
+    def onAnimateEndEvent(self, _) -> None:
+        """Method that is automatically called at the end of the Sofa animation step.
+        """
+        if self._start is not None:
+            self.profiler.record(self.NAME, time.perf_counter() - self._start)
+            self._start = None
@@ -28,17 +28,51 @@ import Sofa.Core
 from . import Config
 
 
+SAP_ELEMENT_THRESHOLD = 20000
+"""Number of collision elements, above which the automatic broad phase no longer tests 
+all pairs of collision models on a single thread."""
+
+_broad_phase_components = {
+    Config.BroadPhase.BRUTE_FORCE: "BruteForceBroadPhase",
+    Config.BroadPhase.PARALLEL_BRUTE_FORCE: "ParallelBruteForceBroadPhase",
+    Config.BroadPhase.INCREMENTAL_SAP: "IncrSAP",
+}
+
+
+def select_broad_phase(total_collision_elements: int, worker_count: int = 1) -> Config.BroadPhase:
+    """Selects the broad phase for a scene by the total number of collision elements of all objects.
+    Scenes with few collision elements test all pairs of collision models, larger scenes 
+    split the tests on several threads if possible and sweep and prune over the elements otherwise.
+
+    Args:
+        total_collision_elements (int): The number of triangles of all collision surfaces 
+            of the scene, see `sofa_instantiator.count_collision_elements`.
+        worker_count (int, optional): The number of threads. Defaults to 1.
+
+    Returns:
+        Config.BroadPhase: The broad phase, never AUTO.
+    """
+    if total_collision_elements <= SAP_ELEMENT_THRESHOLD:
+        return Config.BroadPhase.BRUTE_FORCE
+    if worker_count > 1:
+        return Config.BroadPhase.PARALLEL_BRUTE_FORCE
+    return Config.BroadPhase.INCREMENTAL_SAP
+
+
 class SceneBuilder():
     """This class is responsible for building the scene for the simulation."""
 
     def __init__(self, root: Sofa.Core.Node, gravity_vec: np.ndarray = Config.get_gravity_vec(),
-                 dt: float = 0.005) -> None:
+                 dt: float = 0.005, total_collision_elements: int = 0) -> None:
         """Initializes the SceneBuilder object.
 
         Args:
             root (Sofa.Core.Node): The root node of the scene.
             gravity_vec (np.ndarray, optional): The gravity vector. Defaults to Config.get_gravity_vec().
             dt (float, optional): The time difference between each simulation step. Defaults to 0.005.
+            total_collision_elements (int, optional): The number of triangles of all collision 
+                surfaces of the scene, which selects the automatic broad phase, 
+                see `select_broad_phase`. Defaults to 0.
 
         Raises:
             ValueError: If dt is not positive.
@@ -62,6 +96,11 @@ class SceneBuilder():
         self.root.gravity = [0]*3
         if Config.get_use_gravity():
             self.root.gravity = gravity_vec.tolist()
+
+        self.broad_phase = Config.get_broad_phase()
+        if self.broad_phase == Config.BroadPhase.AUTO:
+            self.broad_phase = select_broad_phase(total_collision_elements,
+                                                  Config.get_worker_count())
         self._build()
 
     def _build(self) -> Sofa.Core.Node:
@@ -71,11 +110,12 @@ class SceneBuilder():
             Sofa.Core.Node: The root node of the scene.
         """
         self._load_plugins()
-        if Config.get_show_force():
+        show_force = Config.get_show_force() and not Config.get_headless()
+        if show_force:
             self._render_force()
         self._setup_root_simulation()
 
-        if Config.get_show_force():
+        if show_force:
             for direction in [Config.get_initial_dipole_moment(), Config.get_magnetic_dir()]:
                 self._build_reference_direction(direction)
 
@@ -107,20 +147,36 @@ class SceneBuilder():
         ref.addObject('VisualStyle', displayFlags="showForceFields")
 
     def _load_plugins(self):
-        """Loads the required SOFA plugins for the simulation."""
-        self.root.addObject(
-            "RequiredPlugin", pluginName=Config.get_plugin_list())
+        """Loads the required SOFA plugins for the simulation.
+        Headless scenes skip the OpenGL plugins,
+        the parallel broad phase needs the MultiThreading plugin."""
+        plugins = Config.get_plugin_list()
+        if Config.get_headless():
+            plugins = [plugin for plugin in plugins
+                       if not plugin.startswith("Sofa.GL.")]
+        if (Config.get_scene_profile() == Config.SceneProfile.CONTACT
+                and self.broad_phase == Config.BroadPhase.PARALLEL_BRUTE_FORCE):
+            plugins = plugins + ["MultiThreading"]
+        self.root.addObject("RequiredPlugin", pluginName=plugins)
 
     def _setup_root_simulation(self):
-        """Sets up basic simulation parameters for the root node."""
-        self.root.addObject('CompositingVisualLoop')
+        """Sets up basic simulation parameters for the root node.
+        Free scenes skip the collision pipeline and the constraint solver."""
+        if not Config.get_headless():
+            self.root.addObject('CompositingVisualLoop')
+        if Config.get_scene_profile() == Config.SceneProfile.FREE:
+            self.root.addObject('DefaultAnimationLoop')
+            return
+
         self.root.addObject('FreeMotionAnimationLoop')
         self.root.addObject('GenericConstraintSolver',
                             maxIterations=1000, tolerance=1e-6)
 
         self.root.addObject('CollisionPipeline', name="CollisionPipeline")
-        self.root.addObject('BruteForceBroadPhase', name="BroadPhase")
-        self.root.addObject('BVHNarrowPhase', name="NarrowPhase")
+        self.root.addObject(_broad_phase_components[self.broad_phase], name="BroadPhase")
+        # IncrSAP also finds the pairs of elements
+        if self.broad_phase != Config.BroadPhase.INCREMENTAL_SAP:
+            self.root.addObject('BVHNarrowPhase', name="NarrowPhase")
         self.root.addObject('CollisionResponse',
                             name="CollisionResponse", response="FrictionContactConstraint")
         self.root.addObject('MinProximityIntersection', useLineLine=True, usePointPoint=True,
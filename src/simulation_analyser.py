@@ -22,24 +22,27 @@
 
 """This module contains all classes needed for the analysis of the simulation."""
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 import Sofa
 
-from src import AnalysisParameters
+from src import AnalysisParameters, ChunkedExecutor
 
 
 class SimulationAnalyser:
     """This class is used to analyse the simulation results."""
 
-    def __init__(self, root: Sofa.Core.Node) -> None:
+    def __init__(self, root: Sofa.Core.Node, executor: Optional[ChunkedExecutor] = None) -> None:
         """Initializes the SimulationAnalyser with the given root node.
 
         Args:
             root (Sofa.Core.Node): The root node of the simulation to analyse.
+            executor (Optional[ChunkedExecutor], optional): The executor that splits the deformation 
+                update into chunks. If None, it runs on the calling thread. Defaults to None.
         """
         self.root = root
+        self.executor = executor if executor is not None else ChunkedExecutor()
         self.elastic_object = self.root.getChild('object')
         self.mech_obj = self.elastic_object.getObject('dofs')
 
@@ -51,6 +54,32 @@ class SimulationAnalyser:
         self.minimum_deformation_array = np.ones((
             len(self.initial_positions), 3)) * np.inf
 
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the analyser that is needed to continue a simulation.
+
+        Returns:
+            Dict[str, np.ndarray]: The maximum and minimum deformation of each node.
+        """
+        return {
+            "maximum_deformation": self.maximum_deformation_array.copy(),
+            "minimum_deformation": self.minimum_deformation_array.copy(),
+        }
+
+    def set_state(self, state: Dict[str, np.ndarray]) -> None:
+        """Restores the state of the analyser.
+
+        Args:
+            state (Dict[str, np.ndarray]): The state returned by `get_state`.
+
+        Raises:
+            ValueError: If the state belongs to a model with a different number of nodes.
+        """
+        shape = self.maximum_deformation_array.shape
+        if state["maximum_deformation"].shape != shape or state["minimum_deformation"].shape != shape:
+            raise ValueError("State does not match the number of nodes of the model.")
+        self.maximum_deformation_array = np.array(state["maximum_deformation"], dtype=float)
+        self.minimum_deformation_array = np.array(state["minimum_deformation"], dtype=float)
+
     def calculate_nearest_node(self, point: np.ndarray) -> int:
         """Calculates the nearest node in the model to the given point.
         This function uses the state of the model when the analyser was initialized.
@@ -73,11 +102,17 @@ class SimulationAnalyser:
         """Updates the maximum and minimum deformation of the model
         with the current state of the model.
         """
-        current_positions = self.mech_obj.position.value
-        self.maximum_deformation_array = np.maximum(
-            self.maximum_deformation_array, current_positions - self.initial_positions)
-        self.minimum_deformation_array = np.minimum(
-            self.minimum_deformation_array, current_positions - self.initial_positions)
+        current_positions = np.asarray(self.mech_obj.position.value)
+
+        def update_chunk(start: int, stop: int) -> None:
+            deformation = current_positions[start:stop] - \
+                self.initial_positions[start:stop]
+            np.maximum(self.maximum_deformation_array[start:stop], deformation,
+                       out=self.maximum_deformation_array[start:stop])
+            np.minimum(self.minimum_deformation_array[start:stop], deformation,
+                       out=self.minimum_deformation_array[start:stop])
+
+        self.executor.map(update_chunk, len(self.initial_positions), 96)
 
     def calculate_deformation(self, points: List[int] = None) -> Tuple[np.ndarray, np.ndarray]:
         """Calculates the maximum and minimum deformation of the model
@@ -179,20 +214,134 @@ class SimulationAnalyser:
         return self.calculate_deformation(points)[0][1], self.calculate_deformation(points)[1][1]
 
 
+class ConvergenceMonitor:
+    """This class detects when the simulation reaches a steady state. 
+    The state is steady once the kinetic energy and the largest displacement of a node 
+    in a step stay below their tolerances for a window of consecutive steps."""
+
+    def __init__(self, analyser: SimulationAnalyser, window: int = 20,
+                 energy_tolerance: Optional[float] = None,
+                 displacement_tolerance: Optional[float] = None,
+                 masses: Optional[np.ndarray] = None) -> None:
+        """Initializes the ConvergenceMonitor with the current state of the model.
+
+        Args:
+            analyser (SimulationAnalyser): The analyser of the model.
+            window (int, optional): The number of consecutive steps below the tolerances. Defaults to 20.
+            energy_tolerance (Optional[float], optional): The tolerance of the kinetic energy in J. 
+                If None, the energy is not checked. Defaults to None.
+            displacement_tolerance (Optional[float], optional): The tolerance of the largest 
+                displacement of a node in a step in m. If None, the displacement is not checked. 
+                Defaults to None.
+            masses (Optional[np.ndarray], optional): The mass of each node in kg. 
+                Defaults to the masses of the model.
+
+        Raises:
+            ValueError: If the window is smaller than one step.
+            ValueError: If no tolerance is given or a tolerance is negative.
+        """
+        if window < 1:
+            raise ValueError("Window must contain at least one step.")
+        if energy_tolerance is None and displacement_tolerance is None:
+            raise ValueError("At least one tolerance must be given.")
+        if min(energy_tolerance or 0, displacement_tolerance or 0) < 0:
+            raise ValueError("Tolerances must not be negative.")
+
+        self.analyser = analyser
+        self.window = window
+        self.energy_tolerance = energy_tolerance
+        self.displacement_tolerance = displacement_tolerance
+        if energy_tolerance is not None and masses is None:
+            masses = analyser.elastic_object.getObject('Mass').vertexMass.value
+        self._masses = None if masses is None else np.array(masses, dtype=float)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restarts the detection from the current state of the model."""
+        self._previous_positions = np.array(self.analyser.mech_obj.position.value)
+        self._energies = np.full(self.window, np.inf)
+        self._displacements = np.full(self.window, np.inf)
+        self.step = 0
+        self.steady_state_step: Optional[int] = None
+
+    def get_kinetic_energy(self) -> float:
+        """Returns the kinetic energy of the last update.
+
+        Returns:
+            float: The kinetic energy in J, inf if it is not checked.
+        """
+        return float(self._energies[(self.step - 1) % self.window])
+
+    def get_max_displacement(self) -> float:
+        """Returns the largest displacement of a node in the step of the last update.
+
+        Returns:
+            float: The displacement in m, inf if it is not checked.
+        """
+        return float(self._displacements[(self.step - 1) % self.window])
+
+    def update(self) -> bool:
+        """Updates the window with the current state of the model. 
+        Has to be called once after each step.
+
+        Returns:
+            bool: True, if all steps in the window are below the tolerances.
+        """
+        slot = self.step % self.window
+        self.step += 1
+
+        if self.energy_tolerance is not None:
+            velocities = np.asarray(self.analyser.mech_obj.velocity.value)
+            self._energies[slot] = 0.5 * \
+                np.dot(self._masses, np.vecdot(velocities, velocities))
+        if self.displacement_tolerance is not None:
+            positions = np.asarray(self.analyser.mech_obj.position.value)
+            delta = positions - self._previous_positions
+            self._displacements[slot] = np.sqrt(np.max(np.vecdot(delta, delta)))
+            np.copyto(self._previous_positions, positions)
+
+        steady = self.is_steady()
+        if steady and self.steady_state_step is None:
+            self.steady_state_step = self.step - self.window + 1
+        return steady
+
+    def is_steady(self) -> bool:
+        """Checks whether all steps in the window are below the tolerances.
+
+        Returns:
+            bool: True, if the state is steady.
+        """
+        if self.step < self.window:
+            return False
+        return ((self.energy_tolerance is None or self._energies.max() < self.energy_tolerance)
+                and (self.displacement_tolerance is None
+                     or self._displacements.max() < self.displacement_tolerance))
+
+
 class SimulationAnalysisController(Sofa.Core.Controller):
     """This class is used to perform analysis during the simulation"""
 
-    def __init__(self, root: Sofa.Core.Node, analysis_parameters: AnalysisParameters) -> None:
+    def __init__(self, root: Sofa.Core.Node, analysis_parameters: AnalysisParameters,
+                 executor: Optional[ChunkedExecutor] = None) -> None:
         """Initializes the SimulationAnalysisController 
         with the given root node and analysis parameters.
 
         Args:
             root (Sofa.Core.Node): The root node of the simulation.
             analysis_parameters (AnalysisParameters): The analysis parameters.
+            executor (Optional[ChunkedExecutor], optional): The executor of the analyser. Defaults to None.
         """
         super().__init__(root, name="AnalysisController")
         self.root = root
-        self.analyser = SimulationAnalyser(root)
+        self.analyser = SimulationAnalyser(root, executor)
+        self.set_analysis_parameters(analysis_parameters)
+
+    def set_analysis_parameters(self, analysis_parameters: AnalysisParameters) -> None:
+        """Sets the analysis parameters, also during the simulation.
+
+        Args:
+            analysis_parameters (AnalysisParameters): The analysis parameters.
+        """
         self.callpoint = analysis_parameters.callpoint
 
         # Max deformation
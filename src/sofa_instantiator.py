@@ -22,15 +22,18 @@
 
 """This script instantiates the Sofa simulation."""
 
+import time
 from pathlib import Path
 from multiprocessing.connection import Connection
+from typing import Iterable, Optional
 
 import Sofa
-import Sofa.Gui
 import Sofa.Simulation
 from src import (Config, SceneBuilder, ElasticObject, MagneticController, StressAnalyzer,
-                 MaterialLoader, MeshLoader, SimulationAnalysisController)
-from src.mesh_loader import Mode
+                 MaterialLoader, MeshLoader, SimulationAnalysisController, FieldMap,
+                 ChunkedExecutor, Profiler, ProfilerController, LiveUpdateController,
+                 StrainMonitor)
+from src.mesh_loader import Mode, read_level_of_detail, read_surface
 
 
 def main(conn: Connection) -> None:
@@ -40,7 +43,8 @@ def main(conn: Connection) -> None:
 
     Args:
         conn (Connection): Connection to the main process, 
-            that should contain the result of `Config.to_list()`
+            that should contain the result of `Config.to_list()`. 
+            Later configurations sent to it are applied to the running simulation.
     """
     Config.from_list(conn.recv())
     debug = False
@@ -62,42 +66,108 @@ def main(conn: Connection) -> None:
 
     Config.set_default_plugin_list()
 
+    # Imported here, so headless runs do not depend on the GUI
+    import Sofa.Gui
+
+    start = time.perf_counter()
     root = Sofa.Core.Node("root")
-    createScene(root)
+    createScene(root, conn)
     Sofa.Simulation.init(root)
 
     Sofa.Gui.GUIManager.Init("myscene", "qglviewer")
     Sofa.Gui.GUIManager.createGUI(root, __file__)
     Sofa.Gui.GUIManager.SetDimension(1080, 1080)
+
+    analysis_parameters = Config.get_analysis_parameters()
+    if analysis_parameters is not None:
+        # The wall clock is shared with the GUI process, which measures from the Apply click
+        analysis_parameters.callpoint.send((
+            "startup_time",
+            [time.time(), time.perf_counter() - start]
+        ))
     Sofa.Gui.GUIManager.MainLoop(root, __file__)
     Sofa.Gui.GUIManager.closeGUI()
 
+    if Config.get_profile_path() is not None:
+        root.getObject("ProfilerController").profiler.export(
+            Config.get_profile_path())
+
+
+def standby(conn: Connection) -> None:
+    """Prepares a simulation process before its configuration is known. 
+    Imports the SOFA GUI and loads the default plugins, then waits for the configuration 
+    and runs `main`, which no longer has to do this work.
+
+    Args:
+        conn (Connection): Connection to the main process, see `main`.
+    """
+    # Loaded once here, so main only finds them in the module cache
+    import Sofa.Gui
+
+    Config.set_default_plugin_list()
+    Sofa.Core.Node("plugins").addObject(
+        "RequiredPlugin", pluginName=Config.get_plugin_list())
+    main(conn)
+
+
+def count_collision_elements(volume_paths: Iterable[Path]) -> int:
+    """Counts the triangles of all collision surfaces of a scene. 
+    The collision surface of a model is the boundary of its volumetric mesh or of its level of detail.
+
+    Args:
+        volume_paths (Iterable[Path]): The paths of the volumetric meshes of all models 
+            in the scene, once per copy of a model.
+
+    Returns:
+        int: The total number of triangles.
+    """
+    collision_triangles, _ = Config.get_level_of_detail()
+    total = 0
+    for volume_path in volume_paths:
+        if collision_triangles is None:
+            total += len(read_surface(volume_path).triangles)
+        else:
+            total += len(read_level_of_detail(volume_path, collision_triangles)[1].triangles)
+    return total
+
 
 # DO NOT REFACTOR TO SNAKE CASE; WILL CRASH SOFA
-def createScene(root: Sofa.Core.Node) -> Sofa.Core.Node:
+def createScene(root: Sofa.Core.Node, conn: Optional[Connection] = None) -> Sofa.Core.Node:
     """Creates the scene for the Sofa simulation with the given argument as the root node
     using the settings specified in the configuration class.
 
     Args:
         root (Sofa.Core.Node): The root node of the simulation.
-
+        conn (Optional[Connection], optional): Connection to the GUI, 
+            which sends configuration changes during the simulation. Defaults to None.
 
     Returns:
         Sofa.Core.Node: The root node of the simulation.
     """
-    SceneBuilder(root)
-
     # can be overwritten / removed as soon as linked to GUI
     mesh_loader = MeshLoader(scaling_factor=Config.get_scale())
     name = Config.get_name()
-    mesh_loader.load_file(
-        path=Path(__file__).parents[1] / f"lib/models/{name}.msh",
-        mode=Mode.VOLUMETRIC,
-    )
-    mesh_loader.load_file(
-        path=Path(__file__).parents[1] / f"lib/models/{name}.stl",
-        mode=Mode.SURFACE,
-    )
+    volume_path = Path(__file__).parents[1] / f"lib/models/{name}.msh"
+    mesh_loader.load_file(path=volume_path, mode=Mode.VOLUMETRIC)
+
+    total_collision_elements = 0
+    if (Config.get_scene_profile() == Config.SceneProfile.CONTACT
+            and Config.get_broad_phase() == Config.BroadPhase.AUTO):
+        # The elastic object is the only collision model of the scene
+        total_collision_elements = count_collision_elements([volume_path])
+    SceneBuilder(root, total_collision_elements=total_collision_elements)
+
+    # The profiler has to be the first controller to measure the whole step
+    profiler = None
+    if Config.get_profile_path() is not None:
+        profiler = Profiler()
+        root.addObject(ProfilerController(profiler))
+
+    surface_path = Path(__file__).parents[1] / f"lib/models/{name}.stl"
+    if Config.get_surface_from_volume() or not surface_path.is_file():
+        mesh_loader.derive_surface()
+    else:
+        mesh_loader.load_file(path=surface_path, mode=Mode.SURFACE)
 
     elastic_object = ElasticObject(root,
                                    mesh_loader=mesh_loader,
@@ -113,16 +183,37 @@ def createScene(root: Sofa.Core.Node) -> Sofa.Core.Node:
     mat_loader.set_poissons_ratio(Config.get_poisson_ratio())
     mat_loader.set_remanence(Config.get_remanence())
 
-    magnetic_controller = MagneticController(elastic_object, mat_loader)
+    field_map_path = Config.get_field_map_path()
+    field_map = None if field_map_path is None else FieldMap.load(field_map_path)
+
+    executor = ChunkedExecutor.shared(Config.get_worker_count())
+
+    magnetic_controller = MagneticController(
+        elastic_object, mat_loader, per_element_dipoles=Config.get_per_element_dipoles(),
+        lazy_tolerance=Config.get_lazy_torque_tolerance(),
+        field_map=field_map, executor=executor)
+    magnetic_controller.set_field_schedule(
+        Config.get_field_schedule(), root.dt.value)
+    if profiler is not None:
+        profiler.instrument(magnetic_controller)
     root.addObject(magnetic_controller)
+    if Config.get_strain_mode() == Config.StrainMode.SMALL:
+        strain_monitor = StrainMonitor(elastic_object)
+        if profiler is not None:
+            profiler.instrument(strain_monitor)
+        root.addObject(strain_monitor)
+    analysis_controller = None
     analysis_parameter = Config.get_analysis_parameters()
     if analysis_parameter is not None:
         analysis_controller = SimulationAnalysisController(
-            root, analysis_parameter)
+            root, analysis_parameter, executor)
+        stress_analyzer = StressAnalyzer(
+            elastic_object, analysis_parameter, executor)
+        if profiler is not None:
+            profiler.instrument(analysis_controller)
+            profiler.instrument(stress_analyzer)
         root.addObject(analysis_controller)
-        root.addObject(
-            StressAnalyzer(elastic_object, analysis_parameter)
-        )
+        root.addObject(stress_analyzer)
         analysis_parameter.callpoint.send((
             "stress_reset",
             []
@@ -132,4 +223,8 @@ def createScene(root: Sofa.Core.Node) -> Sofa.Core.Node:
             []
         ))
 
+    if conn is not None:
+        root.addObject(LiveUpdateController(
+            root, conn, magnetic_controller, mat_loader, analysis_controller))
+
     return root
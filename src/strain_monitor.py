@@ -0,0 +1,137 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the StrainMonitor, which checks that the rotations of the elements 
+stay small enough for the linear small strain elements."""
+
+from typing import Any
+import warnings
+
+import numpy as np
+import Sofa
+
+from src import ElasticObject
+
+
+SMALL_ROTATION_TOLERANCE = 0.1
+"""Rotation of an element in rad, above which the small strain elements are no longer accurate."""
+
+
+class StrainMonitor(Sofa.Core.Controller):
+    """Controller that warns once the elements rotate further than the small strain 
+    elements can represent. Linear elements treat a rotation as a strain, 
+    so rotated parts of the model gain artificial stress and volume.
+    Is a subclass of Sofa.Core.Controller.
+    """
+
+    def __init__(self, elastic_object: ElasticObject, tolerance: float = SMALL_ROTATION_TOLERANCE,
+                 interval: int = 10) -> None:
+        """Initializes the StrainMonitor.
+
+        Args:
+            elastic_object (ElasticObject): The ElasticObject whose elements are checked.
+            tolerance (float, optional): The largest valid rotation of an element in rad. 
+                Defaults to SMALL_ROTATION_TOLERANCE.
+            interval (int, optional): The number of steps between two checks. Defaults to 10.
+
+        Raises:
+            ValueError: If tolerance is not positive.
+            ValueError: If interval is smaller than 1.
+        """
+        super().__init__()
+
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive.")
+        if interval < 1:
+            raise ValueError("Interval must be at least 1.")
+
+        self._elastic_object = elastic_object
+        self._tolerance = tolerance
+        self._interval = interval
+        self._steps = 0
+        self._warned = False
+        self.max_rotation = 0.
+
+        self._tetrahedra = np.array(elastic_object.mesh.tetrahedra.value)
+        rest_positions = np.array(elastic_object.mesh.position.value)
+        # The inverse of the rest edges maps the current edges to the deformation gradients
+        self._inverse_rest_edges = np.linalg.inv(self._edges(rest_positions))
+
+    def _edges(self, positions: np.ndarray) -> np.ndarray:
+        """Returns the edges of all elements from their first node.
+
+        Args:
+            positions (np.ndarray): The positions of the nodes of shape (N, 3).
+
+        Returns:
+            np.ndarray: The edges as columns of shape (T, 3, 3).
+        """
+        nodes = positions[self._tetrahedra]
+        return np.transpose(nodes[:, 1:] - nodes[:, :1], (0, 2, 1))
+
+    def calculate_rotations(self, positions: np.ndarray) -> np.ndarray:
+        """Calculates the rotation angles of all elements, 
+        i.e. of the rotation of the polar decomposition of their deformation gradient.
+
+        Args:
+            positions (np.ndarray): The current positions of the nodes of shape (N, 3).
+
+        Returns:
+            np.ndarray: The rotation angles in rad of shape (T,).
+        """
+        deformation_gradients = self._edges(positions) @ self._inverse_rest_edges
+        u, _, vh = np.linalg.svd(deformation_gradients)
+        # Flipped elements have no proper rotation, the smallest singular direction is mirrored
+        u[np.linalg.det(u @ vh) < 0, :, 2] *= -1
+        rotations = u @ vh
+        cosines = (np.trace(rotations, axis1=1, axis2=2) - 1) / 2
+        return np.arccos(np.clip(cosines, -1, 1))
+
+    def check(self) -> bool:
+        """Checks the rotations of the current positions and warns, 
+        when the largest rotation exceeds the tolerance for the first time. 
+        It warns again after the rotations returned below the tolerance.
+
+        Returns:
+            bool: True, if the largest rotation is within the tolerance.
+        """
+        positions = np.array(self._elastic_object.mech_obj.position.value)
+        self.max_rotation = float(self.calculate_rotations(positions).max())
+        valid = self.max_rotation <= self._tolerance
+        if not valid and not self._warned:
+            warnings.warn(
+                f"Elements rotated by {np.degrees(self.max_rotation):.1f}°, which exceeds the "
+                f"{np.degrees(self._tolerance):.1f}° the small strain mode is valid for. "
+                "Use the large strain mode for this deflection.", RuntimeWarning)
+        self._warned = not valid
+        return valid
+
+    # override -> no snake case
+    def onAnimateBeginEvent(self, _: Any) -> None:
+        """Overrides the onAnimateBeginEvent method executed before each animation step.
+
+        Args:
+            _ (Any): the (unused) event
+        """
+        self._steps += 1
+        if self._steps % self._interval == 0:
+            self.check()
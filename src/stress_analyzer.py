@@ -21,13 +21,13 @@
 # ____________________________________________________________________________________ #
 
 """Implementation of the Stress Analyzer, a class responsible for the von Mises stress analysis. It updates the associated GUI component as well."""
-from typing import Any
+from typing import Any, Optional
 
 
 import Sofa
 import numpy as np
 
-from src import AnalysisParameters, ElasticObject
+from src import AnalysisParameters, ElasticObject, ChunkedExecutor
 
 
 class StressAnalyzer(Sofa.Core.Controller):
@@ -36,12 +36,15 @@ class StressAnalyzer(Sofa.Core.Controller):
     Is a subclass of Sofa.Core.Controller.
     """
 
-    def __init__(self, elastic_object: ElasticObject, parameters: AnalysisParameters) -> None:
+    def __init__(self, elastic_object: ElasticObject, parameters: AnalysisParameters,
+                 executor: Optional[ChunkedExecutor] = None) -> None:
         """Builds the Stress Analyzer.
 
         Args:
             elastic_object (ElasticObject): The ElasticObject which needs to be analyzed.
             parameters (AnalysisParameters): The parameters of the stress analysis.
+            executor (Optional[ChunkedExecutor], optional): The executor that splits the search 
+                for the extrema into chunks. If None, it runs on the calling thread. Defaults to None.
 
         Raises:
             ValueError: If elastic_object or parameters are None.
@@ -59,6 +62,7 @@ class StressAnalyzer(Sofa.Core.Controller):
         self.min_stress = np.inf
 
         self._callpoint = parameters.callpoint
+        self._executor = executor if executor is not None else ChunkedExecutor()
 
     # override -> no snake case
     def onAnimateBeginEvent(self, _: Any) -> None:
@@ -73,8 +77,12 @@ class StressAnalyzer(Sofa.Core.Controller):
         stress_values = self._elastic_object.FEM_force_field.vonMisesPerNode.value
         stress_values = np.array(stress_values)
 
-        cur_max = stress_values.max()
-        cur_min = stress_values.min()
+        extrema = self._executor.map(
+            lambda start, stop: (stress_values[start:stop].max(),
+                                 stress_values[start:stop].min()),
+            len(stress_values), stress_values.itemsize)
+        cur_max = max(chunk_max for chunk_max, _ in extrema)
+        cur_min = min(chunk_min for _, chunk_min in extrema)
 
         if cur_max > self.max_stress:
             self.max_stress = cur_max
@@ -0,0 +1,188 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+"""This module contains the TrajectoryRecorder, which streams the positions of the nodes 
+into a memory-mapped .npy file."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+import Sofa
+
+
+class TrajectoryRecorder(Sofa.Core.Controller):
+    """Controller that records the positions of the nodes at the end of every n-th step.
+    The frames are collected in a buffer of fixed size, which is written to a preallocated 
+    .npy file whenever it is full. Only the written chunk of the file is mapped into memory, 
+    so the memory used does not grow with the length of the run.
+
+    After each write, a JSON file next to the .npy file (e.g. trajectory.npy.json) is updated 
+    with the number of written frames, so the file can be read with `load` while the simulation 
+    is still running.
+    """
+
+    BUFFER_BYTES = 8 * 2**20
+
+    def __init__(self, root: Sofa.Core.Node, path: Path, frames: int, every: int = 1,
+                 nodes: Optional[Sequence[int]] = None, dtype: np.dtype = np.float64) -> None:
+        """Initializes the recorder and preallocates the .npy file.
+
+        Args:
+            root (Sofa.Core.Node): The root node of the simulation.
+            path (Path): The path of the .npy file.
+            frames (int): The maximum number of recorded frames. Later frames are dropped.
+            every (int, optional): Records every n-th step. Defaults to 1.
+            nodes (Optional[Sequence[int]], optional): The indices of the recorded nodes. 
+                If None, all nodes are recorded. Defaults to None.
+            dtype (np.dtype, optional): The data type of the file. Defaults to np.float64.
+
+        Raises:
+            ValueError: If frames or every is not positive.
+            ValueError: If a node is not part of the model.
+        """
+        super().__init__(name="TrajectoryRecorder")
+        if frames < 1:
+            raise ValueError("Number of frames must be positive.")
+        if every < 1:
+            raise ValueError("Recording interval must be positive.")
+
+        self.mech_obj = root.getChild('object').getObject('dofs')
+        node_count = len(self.mech_obj.position.value)
+        if nodes is not None:
+            nodes = np.array(nodes, dtype=int)
+            if len(nodes) == 0 or nodes.min() < 0 or nodes.max() >= node_count:
+                raise ValueError("Nodes must be part of the model.")
+        self._nodes = nodes
+
+        self.path = Path(path)
+        self.frames = frames
+        self.every = every
+        self._dt = float(root.dt.value)
+        self._shape = (frames, node_count if nodes is None else len(nodes), 3)
+        self._dtype = np.dtype(dtype)
+
+        data = np.lib.format.open_memmap(self.path, mode="w+", dtype=self._dtype, shape=self._shape)
+        self._data_offset = data.offset
+        del data
+
+        frame_bytes = self._shape[1] * 3 * self._dtype.itemsize
+        self._buffer = np.empty(
+            (max(1, min(frames, self.BUFFER_BYTES // frame_bytes)),) + self._shape[1:], self._dtype)
+        self._buffered = 0
+        self._step = 0
+        self.frames_written = 0
+        self._write_metadata(complete=False)
+
+    @staticmethod
+    def metadata_path(path: Path) -> Path:
+        """Returns the path of the JSON file with the metadata of a trajectory.
+        The suffix is appended instead of replaced, so a run config with the same stem, 
+        e.g. run.json next to run.npy, is not overwritten.
+
+        Args:
+            path (Path): The path of the .npy file.
+
+        Returns:
+            Path: The path of the JSON file.
+        """
+        path = Path(path)
+        return path.with_name(path.name + ".json")
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Maps the written frames of a trajectory into memory, also while it is still recorded.
+
+        Args:
+            path (Path): The path of the .npy file.
+
+        Raises:
+            FileNotFoundError: If the trajectory or its metadata does not exist.
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, Any]]: The read-only positions with the shape 
+            (frames, nodes, 3) and the metadata: frames_written, every, dt, nodes and complete.
+        """
+        metadata_path = cls.metadata_path(path)
+        if not Path(path).is_file() or not metadata_path.is_file():
+            raise FileNotFoundError(f"Trajectory {path} does not exist.")
+        with open(metadata_path, encoding="utf-8") as file:
+            metadata = json.load(file)
+        return np.load(path, mmap_mode="r")[:metadata["frames_written"]], metadata
+
+    def _write_metadata(self, complete: bool) -> None:
+        """Replaces the metadata file atomically, so readers never see a partial file.
+
+        Args:
+            complete (bool): Whether the recording is finished.
+        """
+        metadata = {
+            "frames_written": self.frames_written,
+            "every": self.every,
+            "dt": self._dt,
+            "nodes": None if self._nodes is None else self._nodes.tolist(),
+            "complete": complete,
+        }
+        metadata_path = self.metadata_path(self.path)
+        temporary_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(metadata, file)
+        os.replace(temporary_path, metadata_path)
+
+    def flush(self) -> None:
+        """Writes the buffered frames to the file."""
+        if self._buffered == 0:
+            return
+        chunk = np.memmap(self.path, dtype=self._dtype, mode="r+",
+                          offset=self._data_offset +
+                          self.frames_written * self._buffer[0].nbytes,
+                          shape=(self._buffered,) + self._shape[1:])
+        chunk[:] = self._buffer[:self._buffered]
+        chunk.flush()
+        del chunk
+        self.frames_written += self._buffered
+        self._buffered = 0
+        self._write_metadata(complete=False)
+
+    def close(self) -> None:
+        """Writes the remaining frames and marks the recording as complete."""
+        self.flush()
+        self._write_metadata(complete=True)
+
+    def onAnimateEndEvent(self, _) -> None:
+        """Method that is automatically called at the end of the Sofa animation step.
+        """
+        self._step += 1
+        if self._step % self.every != 0 or self.frames_written + self._buffered >= self.frames:
+            return
+
+        positions = np.asarray(self.mech_obj.position.value)
+        if self._nodes is None:
+            self._buffer[self._buffered] = positions
+        else:
+            self._buffer[self._buffered] = positions[self._nodes]
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self.flush()
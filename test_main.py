@@ -47,6 +47,18 @@ suite.addTests([
     analysis_parameters_test_suite(),
     stress_test_suite(),
     stress_widget_suite(),
+    elastic_object_test_suite(),
+    field_map_test_suite(),
+    field_schedule_test_suite(),
+    parallel_test_suite(),
+    profiler_test_suite(),
+    headless_test_suite(),
+    parameter_sweep_test_suite(),
+    checkpoint_test_suite(),
+    trajectory_recorder_test_suite(),
+    live_update_test_suite(),
+    model_index_test_suite(),
+    strain_monitor_test_suite(),
 ])
 
 runner = unittest.TextTestRunner()
@@ -33,3 +33,15 @@ from .analysis_parameters_test import suite as analysis_parameters_test_suite
 from .json_material_manager_test import suite as json_material_manager_test_suite
 from .constraints_test import suite as constraints_test_suite
 from .stress_analyzer_test import suite as stress_test_suite
+from .elastic_object_test import suite as elastic_object_test_suite
+from .field_map_test import suite as field_map_test_suite
+from .field_schedule_test import suite as field_schedule_test_suite
+from .parallel_test import suite as parallel_test_suite
+from .profiler_test import suite as profiler_test_suite
+from .headless_test import suite as headless_test_suite
+from .parameter_sweep_test import suite as parameter_sweep_test_suite
+from .checkpoint_test import suite as checkpoint_test_suite
+from .trajectory_recorder_test import suite as trajectory_recorder_test_suite
+from .live_update_test import suite as live_update_test_suite
+from .model_index_test import suite as model_index_test_suite
+from .strain_monitor_test import suite as strain_monitor_test_suite
@@ -21,3 +21,4 @@
 # ____________________________________________________________________________________ #
 
 from .dummy_node import DummyNode
+from .dummy_data import DummyData
@@ -0,0 +1,165 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, Mock
+import numpy as np
+
+import Sofa.Simulation
+
+from src import Config, MagneticController, SimulationAnalyser, SimulationAnalysisController
+from src import headless
+from src.checkpoint import restore_checkpoint, save_checkpoint
+from tests.assets.dummy_data import DummyData
+
+
+class TestCheckpoint(unittest.TestCase):
+    def make_root(self, positions: np.ndarray) -> MagicMock:
+        root = MagicMock()
+        dofs = root.getChild.return_value.getObject.return_value
+        dofs.position = DummyData(positions)
+        dofs.velocity = DummyData(np.zeros_like(positions))
+        root.time = DummyData(0.0)
+        root.objects = []
+        return root
+
+    def setUp(self):
+        self.positions = np.random.rand(10, 3)
+        self.root = self.make_root(self.positions)
+        self.analyser = SimulationAnalyser(self.root)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "checkpoint.npz"
+
+    def test_round_trip(self):
+        dofs = self.root.getChild('object').getObject('dofs')
+        dofs.position.value = self.positions + 0.1
+        dofs.velocity.value = np.ones((10, 3))
+        self.root.time.value = 0.5
+        self.analyser.update_deformation()
+        controller = Mock(spec=MagneticController)
+        controller.get_state.return_value = {"step": np.array(7)}
+        self.root.objects = [controller]
+        save_checkpoint(self.path, self.root, self.analyser)
+
+        root = self.make_root(self.positions)
+        restored_controller = Mock(spec=MagneticController)
+        analysis_controller = Mock(spec=SimulationAnalysisController)
+        analysis_controller.analyser = SimulationAnalyser(root)
+        root.objects = [restored_controller, analysis_controller]
+        restore_checkpoint(self.path, root)
+
+        restored_dofs = root.getChild('object').getObject('dofs')
+        np.testing.assert_array_equal(restored_dofs.position.value, self.positions + 0.1)
+        np.testing.assert_array_equal(restored_dofs.velocity.value, np.ones((10, 3)))
+        self.assertEqual(root.time.value, 0.5)
+        self.assertEqual(int(restored_controller.set_state.call_args.args[0]["step"]), 7)
+        np.testing.assert_allclose(
+            analysis_controller.analyser.maximum_deformation_array, 0.1)
+        np.testing.assert_allclose(
+            analysis_controller.analyser.minimum_deformation_array, 0.1)
+        # The initial positions stay those of the undeformed mesh
+        np.testing.assert_array_equal(
+            analysis_controller.analyser.initial_positions, self.positions)
+
+    def test_without_controllers(self):
+        save_checkpoint(self.path, self.root)
+        with np.load(self.path) as checkpoint:
+            self.assertSetEqual(set(checkpoint.files), {"time", "positions", "velocities"})
+
+        # Objects without a state in the checkpoint keep their state
+        restore_checkpoint(self.path, self.root, self.analyser)
+        np.testing.assert_array_equal(self.analyser.maximum_deformation_array, -np.inf)
+
+    def test_exceptional(self):
+        with self.assertRaises(FileNotFoundError):
+            restore_checkpoint(self.path, self.root)
+
+        save_checkpoint(self.path, self.root, self.analyser)
+        with self.assertRaises(ValueError):
+            restore_checkpoint(self.path, self.make_root(np.random.rand(11, 3)))
+
+        analyser = SimulationAnalyser(self.make_root(np.random.rand(11, 3)))
+        with self.assertRaises(ValueError):
+            analyser.set_state(self.analyser.get_state())
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+class TestWarmStart(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        headless.apply_settings({
+            "model": "beam",
+            "poisson_ratio": 0.47,
+            "youngs_modulus": 1e8,
+            "density": 1100,
+            "remanence": 0.35,
+        })
+        cls.root = headless.build()
+
+    def test_restore(self):
+        Sofa.Simulation.reset(self.root)
+        analyser = SimulationAnalyser(self.root)
+        results = headless.run(self.root, 10, analyser=analyser)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "checkpoint.npz"
+            save_checkpoint(path, self.root, analyser)
+
+            Sofa.Simulation.reset(self.root)
+            restored = SimulationAnalyser(self.root)
+            restore_checkpoint(path, self.root, restored)
+
+        dofs = self.root.getChild('object').getObject('dofs')
+        np.testing.assert_array_equal(dofs.position.value, results["positions"])
+        np.testing.assert_array_equal(dofs.velocity.value, results["velocities"])
+        np.testing.assert_array_equal(
+            restored.maximum_deformation_array, results["max_deformation"])
+
+        # The restored run continues from the deformed state
+        continued = headless.run(self.root, 1, analyser=restored)
+        self.assertTrue(np.all(continued["max_deformation"] >= results["max_deformation"]))
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.reset()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestCheckpoint,
+        TestWarmStart,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -22,10 +22,12 @@
 
 from random import uniform, choices, choice, randint
 import string
+from pathlib import Path
 import unittest
 import unittest.mock
 import numpy as np
 from src.config import Config
+from src.field_schedule import FieldSchedule
 from src.units import YoungsModulus, Density, Tesla
 
 
@@ -55,6 +57,16 @@ class TestConfig(unittest.TestCase):
         self.assertAlmostEqual(Config.get_scale(), ref_scale,
                                msg="Model scale is not correct")
 
+    def test_default_scale(self):
+        self.assertEqual(Config.get_default_scale("butterfly"), 0.0002898551)
+        self.assertEqual(Config.get_default_scale("custom"), 0.01)
+
+        Config.set_model("butterfly")
+        self.assertEqual(Config.get_scale(), 0.0002898551)
+        Config.set_model("butterfly", custom_model=True)
+        self.assertEqual(Config.get_name(), "../imported_models/butterfly")
+        self.assertEqual(Config.get_scale(), 0.0002898551)
+
     def test_model_exceptional(self):
         err_scale = uniform(-100, 0)
 
@@ -305,6 +317,142 @@ class TestConfig(unittest.TestCase):
             msg="different params than set found after get"
         )
 
+    def test_field_map(self):
+        self.assertIsNone(Config.get_field_map_path(),
+                          "initially should be None")
+        Config.set_field_map(Path("coil.npz"))
+        self.assertEqual(Config.get_field_map_path(), "coil.npz",
+                         msg="different path than set found after get")
+        Config.set_field_map()
+        self.assertIsNone(Config.get_field_map_path(),
+                          "should be None after reset")
+
+    def test_field_schedule(self):
+        self.assertIsNone(Config.get_field_schedule(),
+                          "initially should be None")
+        schedule = FieldSchedule.rotating(0.01, 1)
+        Config.set_field_schedule(schedule)
+        self.assertEqual(Config.get_field_schedule(), schedule,
+                         msg="different schedule than set found after get")
+        Config.set_field_schedule()
+        self.assertIsNone(Config.get_field_schedule(),
+                          "should be None after reset")
+
+    def test_worker_count(self):
+        self.assertEqual(Config.get_worker_count(), 1,
+                         msg="initially should be 1")
+        Config.set_worker_count(8)
+        self.assertEqual(Config.get_worker_count(), 8,
+                         msg="different count than set found after get")
+
+        with self.assertRaises(ValueError):
+            Config.set_worker_count(0)
+
+    def test_profile_path(self):
+        self.assertIsNone(Config.get_profile_path(),
+                          "initially should be None")
+        Config.set_profile_path(Path("profile.csv"))
+        self.assertEqual(Config.get_profile_path(), "profile.csv",
+                         msg="different path than set found after get")
+        Config.set_profile_path()
+        self.assertIsNone(Config.get_profile_path(),
+                          "should be None after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_profile_path("profile.txt")
+
+    def test_headless(self):
+        self.assertFalse(Config.get_headless(), "initially should be False")
+        Config.set_headless(True)
+        self.assertTrue(Config.get_headless(), "should be True after set")
+        Config.reset()
+        self.assertFalse(Config.get_headless(), "should be False after reset")
+
+    def test_surface_from_volume(self):
+        self.assertFalse(Config.get_surface_from_volume(), "initially should be False")
+        Config.set_surface_from_volume(True)
+        self.assertTrue(Config.get_surface_from_volume(), "should be True after set")
+        Config.reset()
+        self.assertFalse(Config.get_surface_from_volume(), "should be False after reset")
+
+    def test_level_of_detail(self):
+        self.assertEqual(Config.get_level_of_detail(), (None, None), "initially should be None")
+        Config.set_level_of_detail(500, 2000)
+        self.assertEqual(Config.get_level_of_detail(), (500, 2000),
+                         msg="different numbers than set found after get")
+        Config.reset()
+        self.assertEqual(Config.get_level_of_detail(), (None, None), "should be None after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_level_of_detail(0)
+        with self.assertRaises(ValueError):
+            Config.set_level_of_detail(visual_triangles=-1)
+
+    def test_scene_profile(self):
+        self.assertEqual(Config.get_scene_profile(), Config.SceneProfile.CONTACT,
+                         "initially should be CONTACT")
+        Config.set_scene_profile(Config.SceneProfile.FREE)
+        self.assertEqual(Config.get_scene_profile(), Config.SceneProfile.FREE,
+                         msg="different profile than set found after get")
+        Config.reset()
+        self.assertEqual(Config.get_scene_profile(), Config.SceneProfile.CONTACT,
+                         "should be CONTACT after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_scene_profile("free")
+
+    def test_broad_phase(self):
+        self.assertEqual(Config.get_broad_phase(), Config.BroadPhase.AUTO,
+                         "initially should be AUTO")
+        Config.set_broad_phase(Config.BroadPhase.INCREMENTAL_SAP)
+        self.assertEqual(Config.get_broad_phase(), Config.BroadPhase.INCREMENTAL_SAP,
+                         msg="different broad phase than set found after get")
+        Config.reset()
+        self.assertEqual(Config.get_broad_phase(), Config.BroadPhase.AUTO,
+                         "should be AUTO after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_broad_phase("IncrSAP")
+
+    def test_solver_profile(self):
+        self.assertEqual(Config.get_solver_profile(), Config.SolverProfile.AUTO,
+                         "initially should be AUTO")
+        Config.set_solver_profile(Config.SolverProfile.ITERATIVE)
+        self.assertEqual(Config.get_solver_profile(), Config.SolverProfile.ITERATIVE,
+                         msg="different solver profile than set found after get")
+        Config.reset()
+        self.assertEqual(Config.get_solver_profile(), Config.SolverProfile.AUTO,
+                         "should be AUTO after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_solver_profile("SparseLDLSolver")
+
+    def test_strain_mode(self):
+        self.assertEqual(Config.get_strain_mode(), Config.StrainMode.LARGE,
+                         "initially should be LARGE")
+        Config.set_strain_mode(Config.StrainMode.SMALL)
+        self.assertEqual(Config.get_strain_mode(), Config.StrainMode.SMALL,
+                         msg="different strain mode than set found after get")
+        Config.reset()
+        self.assertEqual(Config.get_strain_mode(), Config.StrainMode.LARGE,
+                         "should be LARGE after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_strain_mode("small")
+
+    def test_lazy_torque_tolerance(self):
+        self.assertIsNone(Config.get_lazy_torque_tolerance(),
+                          "initially should be None")
+        Config.set_lazy_torque_tolerance(0.01)
+        self.assertEqual(Config.get_lazy_torque_tolerance(), 0.01,
+                         msg="different tolerance than set found after get")
+        Config.set_lazy_torque_tolerance()
+        self.assertIsNone(Config.get_lazy_torque_tolerance(),
+                          "should be None after reset")
+
+        with self.assertRaises(ValueError):
+            Config.set_lazy_torque_tolerance(-0.01)
+
     def test_stress_kwargs(self) -> None:
         ref_dict_0 = {
             'computeVonMisesStress': 0,
@@ -344,9 +492,48 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(ref_dict_0, Config.get_stress_kwargs(),
                          msg="vals should hold value 0 after hard reset")
 
+    def test_per_element_dipoles(self):
+        self.assertFalse(Config.get_per_element_dipoles(), "initially should be False")
+        Config.set_per_element_dipoles(True)
+        self.assertTrue(Config.get_per_element_dipoles(),
+                        msg="different value than set found after get")
+        Config.reset()
+        self.assertFalse(Config.get_per_element_dipoles(), "should be False after reset")
+
+    def test_scene_changed(self) -> None:
+        scene_settings = Config.get_scene_settings()
+        self.assertFalse(Config.scene_changed(scene_settings))
+
+        # Settings of a running simulation
+        Config.set_material_parameters(0.3, YoungsModulus.from_Pa(5e6), Density.from_kgpm3(900),
+                                       Tesla.from_T(0.2))
+        Config.set_external_forces(False, np.array([0, 0, -9.81]), Tesla.from_T(0.5),
+                                   np.array([0, 1, 0]), Config.get_initial_dipole_moment())
+        self.assertFalse(Config.scene_changed(scene_settings))
+
+        Config.set_constraints(np.array([0, 0, 0]), np.array([1, 1, 2]))
+        self.assertTrue(Config.scene_changed(scene_settings))
+
+        Config.from_list(Config.to_list())
+        scene_settings = Config.get_scene_settings()
+        Config.set_model("beam", 0.02)
+        self.assertTrue(Config.scene_changed(scene_settings))
+
+        scene_settings = Config.get_scene_settings()
+        Config.set_per_element_dipoles(True)
+        self.assertTrue(Config.scene_changed(scene_settings))
+
     def test_reconstrutability(self) -> None:
         # Initialize random values
         ref_show_force = choice([True, False])
+        ref_headless = choice([True, False])
+        ref_surface_from_volume = choice([True, False])
+        ref_level_of_detail = (randint(1, 1000), choice([None, randint(1, 1000)]))
+        ref_scene_profile = choice(list(Config.SceneProfile))
+        ref_broad_phase = choice(list(Config.BroadPhase))
+        ref_solver_profile = choice(list(Config.SolverProfile))
+        ref_strain_mode = choice(list(Config.StrainMode))
+        ref_per_element_dipoles = choice([True, False])
 
         ref_name = ''.join(
             choices(string.ascii_uppercase + string.digits, k=6))
@@ -380,9 +567,25 @@ class TestConfig(unittest.TestCase):
 
         ref_anal_params = unittest.mock.MagicMock()
 
+        ref_lazy_torque_tolerance = uniform(0, 1)
+        ref_worker_count = randint(1, 32)
+        ref_profile_path = ''.join(
+            choices(string.ascii_uppercase + string.digits, k=10)) + ".json"
+        ref_field_map_path = ''.join(
+            choices(string.ascii_uppercase + string.digits, k=10)) + ".npz"
+        ref_field_schedule = FieldSchedule.rotating(uniform(0, 1), uniform(1, 10))
+
         # Set values
         Config.set_show_force(ref_show_force)
+        Config.set_headless(ref_headless)
         Config.set_model(ref_name, ref_scale)
+        Config.set_surface_from_volume(ref_surface_from_volume)
+        Config.set_level_of_detail(*ref_level_of_detail)
+        Config.set_scene_profile(ref_scene_profile)
+        Config.set_broad_phase(ref_broad_phase)
+        Config.set_solver_profile(ref_solver_profile)
+        Config.set_strain_mode(ref_strain_mode)
+        Config.set_per_element_dipoles(ref_per_element_dipoles)
         Config.set_external_forces(
             ref_use_gravity,
             ref_gravity_vec,
@@ -400,6 +603,11 @@ class TestConfig(unittest.TestCase):
         Config.set_constraints(ref_a, ref_b)
         Config.set_stress_kwargs(ref_show_stress)
         Config.set_analysis_parameters(ref_anal_params)
+        Config.set_lazy_torque_tolerance(ref_lazy_torque_tolerance)
+        Config.set_worker_count(ref_worker_count)
+        Config.set_profile_path(ref_profile_path)
+        Config.set_field_map(ref_field_map_path)
+        Config.set_field_schedule(ref_field_schedule)
 
         # Reset and reconstruct
         config_list = Config.to_list()
@@ -409,11 +617,27 @@ class TestConfig(unittest.TestCase):
         # Check values
         self.assertEqual(Config.get_show_force(),
                          ref_show_force, msg="show_force has wrong value")
+        self.assertEqual(Config.get_headless(),
+                         ref_headless, msg="headless has wrong value")
 
         self.assertEqual(Config.get_name(),
                          ref_name, msg="name has wrong value")
         self.assertAlmostEqual(Config.get_scale(),
                                ref_scale, msg="scale has wrong value")
+        self.assertEqual(Config.get_surface_from_volume(), ref_surface_from_volume,
+                         msg="surface_from_volume has wrong value")
+        self.assertEqual(Config.get_level_of_detail(), ref_level_of_detail,
+                         msg="level_of_detail has wrong value")
+        self.assertEqual(Config.get_scene_profile(), ref_scene_profile,
+                         msg="scene_profile has wrong value")
+        self.assertEqual(Config.get_broad_phase(), ref_broad_phase,
+                         msg="broad_phase has wrong value")
+        self.assertEqual(Config.get_solver_profile(), ref_solver_profile,
+                         msg="solver_profile has wrong value")
+        self.assertEqual(Config.get_strain_mode(), ref_strain_mode,
+                         msg="strain_mode has wrong value")
+        self.assertEqual(Config.get_per_element_dipoles(), ref_per_element_dipoles,
+                         msg="per_element_dipoles has wrong value")
 
         self.assertEqual(Config.get_use_gravity(),
                          ref_use_gravity, msg="use_gravity has wrong value")
@@ -456,6 +680,17 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(Config.get_analysis_parameters(),
                          ref_anal_params, msg="analysis_parameters has wrong value")
 
+        self.assertEqual(Config.get_lazy_torque_tolerance(),
+                         ref_lazy_torque_tolerance, msg="lazy_torque_tolerance has wrong value")
+        self.assertEqual(Config.get_worker_count(),
+                         ref_worker_count, msg="worker_count has wrong value")
+        self.assertEqual(Config.get_profile_path(),
+                         ref_profile_path, msg="profile_path has wrong value")
+        self.assertEqual(Config.get_field_map_path(),
+                         ref_field_map_path, msg="field_map_path has wrong value")
+        self.assertEqual(Config.get_field_schedule(),
+                         ref_field_schedule, msg="field_schedule has wrong value")
+
     def tearDown(self) -> None:
         """Resets config after each test."""
         Config.reset()
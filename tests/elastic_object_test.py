@@ -0,0 +1,104 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import unittest
+import unittest.mock
+import numpy as np
+
+from src import Config
+from src.elastic_object import ITERATIVE_NODE_THRESHOLD, VertexForces, select_solver_profile
+from .assets import DummyData
+
+
+class TestVertexForces(unittest.TestCase):
+    def setUp(self):
+        self.node_count = 20
+        self.force_field = unittest.mock.Mock()
+        self.force_field.forces = DummyData(np.zeros((self.node_count, 3)))
+        self.uut = VertexForces(self.force_field, self.node_count)
+
+    def test_len(self):
+        self.assertEqual(len(self.uut), self.node_count)
+
+    def test_single_node(self):
+        index = np.random.randint(self.node_count)
+        force = np.random.rand(3)
+
+        self.uut[index].forces = [force]
+
+        np.testing.assert_array_equal(self.uut[index].forces, [force])
+        np.testing.assert_array_equal(
+            self.force_field.forces.value[index], force)
+        untouched = np.delete(self.force_field.forces.value, index, axis=0)
+        np.testing.assert_array_equal(untouched, 0)
+
+    def test_negative_index(self):
+        force = np.random.rand(3)
+
+        self.uut[-1].forces = [force]
+
+        np.testing.assert_array_equal(
+            self.force_field.forces.value[self.node_count - 1], force)
+
+    def test_set_forces_single_write(self):
+        nodes = np.random.choice(self.node_count, 5, replace=False)
+        forces = np.random.rand(5, 3)
+
+        self.uut.set_forces(nodes, forces)
+
+        self.assertEqual(self.force_field.forces.writes, 1)
+        np.testing.assert_array_equal(
+            self.force_field.forces.value[nodes], forces)
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            _ = self.uut[self.node_count]
+        with self.assertRaises(IndexError):
+            _ = self.uut[-self.node_count - 1]
+
+
+class TestSolverProfile(unittest.TestCase):
+    def test_select(self):
+        self.assertEqual(select_solver_profile(306), Config.SolverProfile.DIRECT)
+        self.assertEqual(select_solver_profile(ITERATIVE_NODE_THRESHOLD),
+                         Config.SolverProfile.DIRECT)
+        self.assertEqual(select_solver_profile(ITERATIVE_NODE_THRESHOLD + 1),
+                         Config.SolverProfile.ITERATIVE)
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestVertexForces,
+        TestSolverProfile,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -0,0 +1,149 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import unittest
+import tempfile
+from pathlib import Path
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from src import FieldMap
+
+
+class TestFieldMap(unittest.TestCase):
+    def setUp(self):
+        self.origin = np.array([-1., 0., 2.])
+        self.spacing = np.array([0.5, 0.25, 1.])
+        self.field = np.random.rand(5, 6, 4, 3)
+        self.uut = FieldMap(self.field, self.origin, self.spacing)
+        self.upper = self.origin + (np.array([5, 6, 4]) - 1) * self.spacing
+
+    def _grid_points(self) -> np.ndarray:
+        indices = np.stack(np.meshgrid(
+            *[np.arange(n) for n in self.field.shape[:3]], indexing='ij'), axis=-1)
+        return self.origin + indices.reshape(-1, 3) * self.spacing
+
+    def test_grid_points(self):
+        values = self.uut.evaluate(self._grid_points())
+        np.testing.assert_allclose(values, self.field.reshape(-1, 3))
+
+    def test_interpolation(self):
+        axes = [self.origin[i] + np.arange(n) * self.spacing[i]
+                for i, n in enumerate(self.field.shape[:3])]
+        reference = RegularGridInterpolator(axes, self.field)
+        points = self.origin + np.random.rand(100, 3) * (self.upper - self.origin)
+
+        np.testing.assert_allclose(self.uut.evaluate(points), reference(points))
+
+    def test_linear_field(self):
+        gradient = np.random.rand(3, 3)
+        field = self._grid_points() @ gradient
+        uut = FieldMap(field.reshape(self.field.shape), self.origin, self.spacing)
+        points = self.origin + np.random.rand(100, 3) * (self.upper - self.origin)
+
+        np.testing.assert_allclose(uut.evaluate(points), points @ gradient)
+
+    def test_clamping(self):
+        points = np.array([
+            self.origin - 10,
+            self.upper + 10,
+            [self.upper[0] + 1, self.origin[1], self.origin[2] - 1],
+        ])
+        np.testing.assert_allclose(self.uut.evaluate(points), [
+            self.field[0, 0, 0],
+            self.field[-1, -1, -1],
+            self.field[-1, 0, 0],
+        ])
+
+    def test_cached_cells(self):
+        points = self.origin + np.random.rand(50, 3) * (self.upper - self.origin)
+        self.uut.evaluate(points)
+        coefficients = self.uut._coefficients.copy()
+
+        # Moving a point to another cell only changes its coefficients
+        points[0] = self.origin
+        points[1] = self.upper
+        values = self.uut.evaluate(points)
+
+        np.testing.assert_array_equal(
+            self.uut._coefficients[:, 2:], coefficients[:, 2:])
+        np.testing.assert_allclose(values[0], self.field[0, 0, 0])
+        np.testing.assert_allclose(values[1], self.field[-1, -1, -1])
+        np.testing.assert_allclose(
+            values, FieldMap(self.field, self.origin, self.spacing).evaluate(points))
+
+    def test_changed_point_count(self):
+        self.uut.evaluate(np.random.rand(10, 3))
+        values = self.uut.evaluate(np.array([self.origin]))
+        np.testing.assert_allclose(values, [self.field[0, 0, 0]])
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            npz_path = Path(directory) / "field.npz"
+            np.savez(npz_path, field=self.field,
+                     origin=self.origin, spacing=self.spacing)
+            uut = FieldMap.load(npz_path)
+            np.testing.assert_array_equal(uut.get_field(), self.field)
+            np.testing.assert_array_equal(uut.get_origin(), self.origin)
+            np.testing.assert_array_equal(uut.get_spacing(), self.spacing)
+
+            npy_path = Path(directory) / "field.npy"
+            np.save(npy_path, self.field)
+            uut = FieldMap.load(npy_path, origin=self.origin, spacing=0.5)
+            np.testing.assert_array_equal(uut.get_spacing(), [0.5, 0.5, 0.5])
+
+            with self.assertRaises(ValueError):
+                FieldMap.load(npy_path)
+            txt_path = Path(directory) / "field.txt"
+            np.savetxt(txt_path, self.field.reshape(-1, 3))
+            with self.assertRaises(ValueError):
+                FieldMap.load(txt_path)
+            with self.assertRaises(FileNotFoundError):
+                FieldMap.load(Path(directory) / "missing.npz")
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            FieldMap(np.zeros((5, 6, 3)), self.origin, self.spacing)
+        with self.assertRaises(ValueError):
+            FieldMap(np.zeros((5, 1, 4, 3)), self.origin, self.spacing)
+        with self.assertRaises(ValueError):
+            FieldMap(self.field, np.zeros(2), self.spacing)
+        with self.assertRaises(ValueError):
+            FieldMap(self.field, self.origin, [0.5, 0, 1])
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestFieldMap,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -0,0 +1,162 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import unittest
+import warnings
+import tempfile
+from pathlib import Path
+import numpy as np
+
+from src import FieldSchedule
+
+
+class TestFieldSchedule(unittest.TestCase):
+    def test_rotating(self):
+        uut = FieldSchedule.rotating(0.5, 2, axis=[0, 0, 2], start_dir=[1, 0, 1])
+        self.assertTrue(uut.is_periodic())
+
+        table = uut.compile(0.005)
+        self.assertEqual(table.shape, (100, 3))
+        np.testing.assert_allclose(np.linalg.norm(table, axis=1), 0.5)
+        np.testing.assert_allclose(table[:, 2], 0, atol=1e-12)
+        np.testing.assert_allclose(table[0], [0.5, 0, 0])
+        # A quarter rotation turns counterclockwise around the axis
+        np.testing.assert_allclose(table[25], [0, 0.5, 0], atol=1e-12)
+
+        reverse = FieldSchedule.rotating(0.5, -2).compile(0.005)
+        np.testing.assert_allclose(reverse[25], [0, -0.5, 0], atol=1e-12)
+
+    def test_rotating_exceptional(self):
+        with self.assertRaises(ValueError):
+            FieldSchedule.rotating(0.5, 0)
+        with self.assertRaises(ValueError):
+            FieldSchedule.rotating(0.5, 1, axis=[0, 0, 1], start_dir=[0, 0, 3])
+
+    def test_sinusoidal(self):
+        amplitude = np.array([0, 0.1, 0])
+        offset = np.array([0.2, 0, 0])
+        uut = FieldSchedule.sinusoidal(amplitude, 10, offset, np.pi / 2)
+        self.assertTrue(uut.is_periodic())
+
+        table = uut.compile(0.001)
+        self.assertEqual(table.shape, (100, 3))
+        times = np.arange(100) * 0.001
+        np.testing.assert_allclose(
+            table, offset + np.cos(2 * np.pi * 10 * times)[:, np.newaxis] * amplitude, atol=1e-12)
+
+        with self.assertRaises(ValueError):
+            FieldSchedule.sinusoidal(amplitude, -1)
+        with self.assertRaises(ValueError):
+            FieldSchedule.sinusoidal(np.zeros(2), 1)
+
+    def test_period_rounding(self):
+        # The period of 0.0105 s is shrunk to 2 steps with dt = 0.005
+        with self.assertWarns(RuntimeWarning):
+            table = FieldSchedule.rotating(1, 1 / 0.0105).compile(0.005)
+        self.assertEqual(len(table), 2)
+        np.testing.assert_allclose(table, [[1, 0, 0], [-1, 0, 0]], atol=1e-12)
+
+        # A rounding within the tolerance is accepted silently
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            table = FieldSchedule.rotating(1, 1 / 0.1004).compile(0.001)
+        self.assertEqual(len(table), 100)
+
+    def test_period_too_short(self):
+        with self.assertRaises(ValueError):
+            FieldSchedule.rotating(1, 150).compile(0.005)
+        with self.assertRaises(ValueError):
+            FieldSchedule.sinusoidal(np.array([0, 0, 1]), 150).compile(0.005)
+        # Two steps per period are the shortest period that can be resolved
+        self.assertEqual(len(FieldSchedule.rotating(1, 100).compile(0.005)), 2)
+
+    def test_keyframes(self):
+        uut = FieldSchedule.keyframes(
+            [0.01, 0.02], [[0, 0, 0], [0, 0, 1]])
+        self.assertFalse(uut.is_periodic())
+
+        table = uut.compile(0.005)
+        np.testing.assert_allclose(table[:, 2], [0, 0, 0, 0.5, 1])
+        np.testing.assert_allclose(table[:, :2], 0)
+
+        # A single keyframe at the start compiles into one held step
+        table = FieldSchedule.keyframes([0], [[0, 0, 1]]).compile(0.005)
+        np.testing.assert_allclose(table, [[0, 0, 1]])
+
+    def test_keyframes_exceptional(self):
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([], np.zeros((0, 3)))
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([0, 1], np.zeros((3, 3)))
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([1, 1], np.zeros((2, 3)))
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([0], np.zeros((1, 3))).compile(0)
+        # Negative times would compile into an empty table
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([-1, -0.5], np.zeros((2, 3)))
+        with self.assertRaises(ValueError):
+            FieldSchedule.keyframes([-0.5, 1], np.zeros((2, 3)))
+
+    def test_equality(self):
+        self.assertEqual(FieldSchedule.rotating(0.5, 2), FieldSchedule.rotating(0.5, 2))
+        self.assertNotEqual(FieldSchedule.rotating(0.5, 2), FieldSchedule.rotating(0.5, 3))
+        self.assertNotEqual(FieldSchedule.rotating(0.5, 2),
+                            FieldSchedule.rotating(0.5, 2, axis=[1, 0, 0], start_dir=[0, 1, 0]))
+        self.assertEqual(FieldSchedule.keyframes([0, 1], [[0, 0, 0], [0, 0, 1]]),
+                         FieldSchedule.keyframes([0, 1], [[0, 0, 0], [0, 0, 1]]))
+        self.assertNotEqual(FieldSchedule.rotating(0.5, 2), None)
+
+    def test_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "schedule.csv"
+            path.write_text("t,bx,by,bz\n0,0,0,0\n0.01,0.1,0,0\n", encoding="utf-8")
+            table = FieldSchedule.from_csv(path).compile(0.005)
+            np.testing.assert_allclose(table[:, 0], [0, 0.05, 0.1])
+
+            path.write_text("0,0,0,1\n", encoding="utf-8")
+            table = FieldSchedule.from_csv(path).compile(0.005)
+            np.testing.assert_allclose(table, [[0, 0, 1]])
+
+            path.write_text("0,0,1\n", encoding="utf-8")
+            with self.assertRaises(ValueError):
+                FieldSchedule.from_csv(path)
+            with self.assertRaises(FileNotFoundError):
+                FieldSchedule.from_csv(Path(directory) / "missing.csv")
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestFieldSchedule,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -0,0 +1,256 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import io
+import json
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+import numpy as np
+
+import Sofa
+import Sofa.Simulation
+
+from src import Config, ConvergenceMonitor, FieldSchedule, SimulationAnalyser, TrajectoryRecorder
+from src import headless
+
+
+class TestHeadlessSettings(unittest.TestCase):
+    def setUp(self):
+        self.settings = {
+            "model": "beam",
+            "poisson_ratio": 0.47,
+            "youngs_modulus": 1e8,
+            "density": 1100,
+            "remanence": 0.35,
+        }
+
+    def test_defaults(self):
+        headless.apply_settings(self.settings)
+
+        self.assertTrue(Config.get_headless())
+        self.assertFalse(Config.get_show_force())
+        self.assertEqual(Config.get_name(), "beam")
+        self.assertAlmostEqual(Config.get_scale(), 0.01)
+        self.assertTrue(Config.get_use_gravity())
+        np.testing.assert_array_equal(Config.get_gravity_vec(), [0, -9.81, 0])
+        np.testing.assert_allclose(Config.get_b_field(), [0.01, 0, 0])
+        self.assertAlmostEqual(Config.get_youngs_modulus().Pa, 1e8)
+        self.assertAlmostEqual(Config.get_density().kgpm3, 1100)
+        self.assertAlmostEqual(Config.get_remanence().T, 0.35)
+        self.assertTrue(Config.get_use_constraints())
+        self.assertFalse(Config.get_show_stress())
+        self.assertIsNone(Config.get_field_schedule())
+
+    def test_settings(self):
+        self.settings.update({
+            "scale": 0.02,
+            "gravity": None,
+            "magnetic_force": 0.5,
+            "magnetic_dir": [0, 0, 2],
+            "constraints": [[0, 0, 0], [1, 1, 1]],
+            "stress": True,
+            "field_schedule": {"type": "rotating", "magnitude": 0.5, "frequency": 2},
+            "collision_triangles": 500,
+            "scene_profile": "free",
+            "broad_phase": "incremental_sap",
+            "solver_profile": "async",
+            "strain_mode": "small",
+            "per_element_dipoles": True,
+            "lazy_torque_tolerance": 0.01,
+            "worker_count": 4,
+            "profile": "profile.json",
+        })
+        headless.apply_settings(self.settings)
+
+        self.assertAlmostEqual(Config.get_scale(), 0.02)
+        self.assertFalse(Config.get_use_gravity())
+        np.testing.assert_allclose(Config.get_b_field(), [0, 0, 0.5])
+        np.testing.assert_array_equal(Config.get_constraints()[1], [1, 1, 1])
+        self.assertTrue(Config.get_show_stress())
+        self.assertEqual(Config.get_field_schedule().kind,
+                         FieldSchedule.Kind.ROTATING)
+        self.assertEqual(Config.get_level_of_detail(), (500, None))
+        self.assertEqual(Config.get_scene_profile(), Config.SceneProfile.FREE)
+        self.assertEqual(Config.get_broad_phase(), Config.BroadPhase.INCREMENTAL_SAP)
+        self.assertEqual(Config.get_solver_profile(), Config.SolverProfile.ASYNC)
+        self.assertEqual(Config.get_strain_mode(), Config.StrainMode.SMALL)
+        self.assertTrue(Config.get_per_element_dipoles())
+        self.assertEqual(Config.get_lazy_torque_tolerance(), 0.01)
+        self.assertEqual(Config.get_worker_count(), 4)
+        self.assertEqual(Config.get_profile_path(), "profile.json")
+
+    def test_exceptional(self):
+        del self.settings["density"]
+        with self.assertRaises(ValueError):
+            headless.apply_settings(self.settings)
+
+        self.settings["density"] = 1100
+        self.settings["field_schedule"] = {"type": "square"}
+        with self.assertRaises(ValueError):
+            headless.apply_settings(self.settings)
+
+        del self.settings["field_schedule"]
+        self.settings["scene_profile"] = "rigid"
+        with self.assertRaises(ValueError):
+            headless.apply_settings(self.settings)
+
+        del self.settings["scene_profile"]
+        self.settings["broad_phase"] = "octree"
+        with self.assertRaises(ValueError):
+            headless.apply_settings(self.settings)
+
+    def test_invalid_enum_setting(self):
+        # The error names the invalid setting and the allowed values
+        for key, value in [("solver_profile", "cholesky"), ("strain_mode", 2),
+                           ("scene_profile", None), ("broad_phase", ["auto"])]:
+            settings = {**self.settings, key: value}
+            with self.assertRaises(ValueError) as context:
+                headless.apply_settings(settings)
+            self.assertIn(f"Invalid {key}: {value!r}", str(context.exception))
+        with self.assertRaisesRegex(ValueError, "small, large, polar, svd"):
+            headless.apply_settings({**self.settings, "strain_mode": "finite"})
+
+        # The names are case insensitive
+        headless.apply_settings({**self.settings, "strain_mode": "Small"})
+        self.assertEqual(Config.get_strain_mode(), Config.StrainMode.SMALL)
+
+    def test_main_invalid_arguments(self):
+        # The arguments are checked before the settings are loaded
+        for arguments in [["-n", "0"], ["--steps", "-5"], ["--trajectory-every", "0"]]:
+            with self.assertRaises(SystemExit), \
+                    unittest.mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+                headless.main(["missing.json", *arguments])
+            self.assertIn("must be at least 1", stderr.getvalue())
+
+    def test_load_settings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "settings.json"
+            path.write_text(json.dumps(self.settings), encoding="utf-8")
+            self.assertDictEqual(headless.load_settings(path), self.settings)
+            with self.assertRaises(FileNotFoundError):
+                headless.load_settings(Path(directory) / "missing.json")
+
+    def tearDown(self):
+        Config.reset()
+
+
+class TestHeadlessRun(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        headless.apply_settings({
+            "model": "beam",
+            "poisson_ratio": 0.47,
+            "youngs_modulus": 1e8,
+            "density": 1100,
+            "remanence": 0.35,
+            "stress": True,
+        })
+        cls.root = headless.build()
+
+    def setUp(self):
+        Sofa.Simulation.reset(self.root)
+
+    def test_no_visuals(self):
+        elastic_object = self.root.getChild('object')
+        self.assertIsNone(elastic_object.getChild('VisualModel'))
+        self.assertIsNone(self.root.getChild('reference'))
+        self.assertEqual(len(self.root.bbox.value), 2)
+
+    def test_run(self):
+        results = headless.run(self.root, 5)
+
+        self.assertEqual(results["steps"], 5)
+        self.assertFalse(results["stopped"])
+        self.assertAlmostEqual(float(results["time"]), 5 * self.root.dt.value)
+        self.assertEqual(results["positions"].shape, (306, 3))
+        self.assertEqual(results["velocities"].shape, (306, 3))
+        self.assertTrue(np.all(results["max_deformation"]
+                        >= results["min_deformation"]))
+        self.assertTrue(np.isfinite(results["max_stress"]))
+
+    def test_stop_criterion(self):
+        results = headless.run(self.root, 100, lambda _: True)
+        self.assertEqual(results["steps"], 1)
+        self.assertTrue(results["stopped"])
+
+    def test_steady_state(self):
+        monitor = ConvergenceMonitor(SimulationAnalyser(self.root), window=5,
+                                     displacement_tolerance=np.inf)
+        results = headless.run(self.root, 100, monitor=monitor)
+
+        self.assertEqual(results["steps"], 5)
+        self.assertTrue(results["stopped"])
+        self.assertEqual(results["steady_state_step"], 1)
+
+        results = headless.run(self.root, 2)
+        self.assertEqual(results["steady_state_step"], -1)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            settings_path = Path(directory) / "settings.json"
+            settings_path.write_text(json.dumps({
+                "model": "beam",
+                "poisson_ratio": 0.47,
+                "youngs_modulus": 1e8,
+                "density": 1100,
+                "remanence": 0.35,
+            }), encoding="utf-8")
+            output = Path(directory) / "results.npz"
+
+            trajectory_path = Path(directory) / "trajectory.npy"
+
+            headless.main([str(settings_path), "-n", "3", "-o", str(output),
+                           "--trajectory", str(trajectory_path), "--trajectory-nodes", "0", "5"])
+
+            with np.load(output) as results:
+                self.assertEqual(results["steps"], 3)
+                self.assertTrue(np.isnan(results["max_stress"]))
+                trajectory, metadata = TrajectoryRecorder.load(trajectory_path)
+                self.assertEqual(trajectory.shape, (3, 2, 3))
+                np.testing.assert_array_equal(trajectory[-1], results["positions"][[0, 5]])
+                self.assertTrue(metadata["complete"])
+                del trajectory
+
+    @classmethod
+    def tearDownClass(cls):
+        Config.reset()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestHeadlessSettings,
+        TestHeadlessRun,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -0,0 +1,146 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import multiprocessing as mp
+import unittest
+import unittest.mock
+import numpy as np
+
+from src import (AnalysisParameters, Config, FieldSchedule, LiveUpdateController,
+                 MagneticController, MaterialLoader, SimulationAnalysisController)
+from src.units import Density, Tesla, YoungsModulus
+from tests.assets.dummy_data import DummyData
+
+
+class TestLiveUpdate(unittest.TestCase):
+    def setUp(self):
+        self.root = unittest.mock.MagicMock()
+        self.root.dt = DummyData(0.01)
+        # The scene is built with the default configuration
+        self.root.gravity = DummyData([0, 0, 0])
+        self.magnetic_controller = unittest.mock.Mock(spec=MagneticController)
+        self.material_loader = unittest.mock.Mock(spec=MaterialLoader)
+        self.analysis_controller = unittest.mock.Mock(spec=SimulationAnalysisController)
+        self.gui_conn, conn = mp.Pipe()
+        self.uut = LiveUpdateController(self.root, conn, self.magnetic_controller,
+                                        self.material_loader, self.analysis_controller)
+
+    def test_no_message(self):
+        self.uut.onAnimateEndEvent(None)
+        self.magnetic_controller.set_b_field.assert_not_called()
+        self.material_loader.set_density.assert_not_called()
+
+    def test_update(self):
+        Config.set_material_parameters(0.3, YoungsModulus.from_Pa(5e6), Density.from_kgpm3(900),
+                                       Tesla.from_T(0.2))
+        Config.set_external_forces(True, np.array([0, -9.81, 0]), Tesla.from_T(0.5),
+                                   np.array([0, 0, 1]), np.array([1, 0, 0]))
+        parameters = AnalysisParameters(self.gui_conn)
+        parameters.enable_max_deformation_analysis(AnalysisParameters.SelectionMode.ALL, None)
+        Config.set_analysis_parameters(parameters)
+        self.gui_conn.send(("config", Config.to_list()))
+        Config.reset()
+
+        self.uut.onAnimateEndEvent(None)
+
+        self.material_loader.set_density.assert_called_once()
+        self.assertAlmostEqual(
+            self.material_loader.set_density.call_args.args[0].kgpm3, 900)
+        self.assertAlmostEqual(
+            self.material_loader.set_remanence.call_args.args[0].T, 0.2)
+        np.testing.assert_allclose(
+            self.magnetic_controller.set_b_field.call_args.args[0], [0, 0, 0.5])
+        np.testing.assert_array_equal(self.root.gravity.value, [0, -9.81, 0])
+        self.assertTrue(self.analysis_controller.set_analysis_parameters.call_args.args[0]
+                        .max_deformation_analysis)
+
+    def test_latest_config(self):
+        for strength in [0.1, 0.2, 0.3]:
+            Config.set_external_forces(True, np.array([0, -9.81, 0]), Tesla.from_T(strength),
+                                       np.array([1, 0, 0]), np.array([1, 0, 0]))
+            self.gui_conn.send(("config", Config.to_list()))
+
+        self.uut.onAnimateEndEvent(None)
+
+        # Only the latest configuration is applied
+        self.magnetic_controller.set_b_field.assert_called_once()
+        np.testing.assert_allclose(
+            self.magnetic_controller.set_b_field.call_args.args[0], [0.3, 0, 0])
+
+    def test_unchanged_config(self):
+        Config.set_field_schedule(FieldSchedule.rotating(0.5, 2))
+        uut = LiveUpdateController(self.root, self.uut.conn, self.magnetic_controller,
+                                   self.material_loader, self.analysis_controller)
+        self.gui_conn.send(("config", Config.to_list()))
+
+        uut.onAnimateEndEvent(None)
+
+        # Nothing changed, the field schedule keeps its phase
+        self.magnetic_controller.set_field_schedule.assert_not_called()
+        self.magnetic_controller.set_b_field.assert_not_called()
+        self.material_loader.set_density.assert_not_called()
+        self.analysis_controller.set_analysis_parameters.assert_not_called()
+
+    def test_changed_settings(self):
+        Config.set_field_schedule(FieldSchedule.rotating(0.5, 2))
+        uut = LiveUpdateController(self.root, self.uut.conn, self.magnetic_controller,
+                                   self.material_loader, self.analysis_controller)
+        Config.set_external_forces(True, np.array([0, -9.81, 0]), Tesla.from_T(0.5),
+                                   np.array([0, 0, 1]), np.array([1, 0, 0]))
+        self.gui_conn.send(("config", Config.to_list()))
+        uut.onAnimateEndEvent(None)
+
+        # Only the gravity and the magnetic field changed
+        self.magnetic_controller.set_field_schedule.assert_not_called()
+        self.material_loader.set_density.assert_not_called()
+        self.magnetic_controller.set_b_field.assert_called_once()
+        np.testing.assert_array_equal(self.root.gravity.value, [0, -9.81, 0])
+
+        Config.set_field_schedule(FieldSchedule.rotating(0.5, 4))
+        self.gui_conn.send(("config", Config.to_list()))
+        uut.onAnimateEndEvent(None)
+
+        self.magnetic_controller.set_field_schedule.assert_called_once()
+        self.assertEqual(self.magnetic_controller.set_field_schedule.call_args.args[0],
+                         FieldSchedule.rotating(0.5, 4))
+        self.magnetic_controller.set_b_field.assert_called_once()
+
+    def tearDown(self):
+        Config.reset()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestLiveUpdate,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -21,10 +21,16 @@
 # ____________________________________________________________________________________ #
 
 import unittest
+import unittest.mock
 import numpy as np
 from scipy.spatial.transform import Rotation
 
-from src import MagneticController
+from src import (MagneticController, MaterialLoader, Config, FieldMap, FieldSchedule,
+                 ChunkedExecutor)
+from src.elastic_object import VertexForces
+from src.magnetic_controller import MU0
+from src.units import Density, Tesla
+from .assets import DummyData
 
 
 class TestAngles(unittest.TestCase):
@@ -148,6 +154,406 @@ class TestRotation(unittest.TestCase):
             )
 
 
+    def test_batch(self):
+        rand_base_vectors = (np.random.rand(50, 3) - 0.5) * 20
+        rand_destinations = (np.random.rand(50, 3) - 0.5) * 20
+        # Include the special cases of parallel and antiparallel vectors
+        rand_destinations[0] = rand_base_vectors[0]
+        rand_destinations[1] = rand_base_vectors[1] * -1
+
+        rot_under_test = MagneticController.calculate_rotation(
+            rand_base_vectors, rand_destinations)
+        self.assertEqual(len(rot_under_test), 50)
+
+        for i, (base, destination) in enumerate(zip(rand_base_vectors, rand_destinations)):
+            single = MagneticController.calculate_rotation(base, destination)
+            np.testing.assert_allclose(
+                rot_under_test[i].as_matrix(), single.as_matrix(), atol=1e-12)
+            result_under_test = rot_under_test[i].apply(base)
+            np.testing.assert_allclose(
+                result_under_test / np.linalg.norm(result_under_test),
+                destination / np.linalg.norm(destination), atol=1e-5)
+
+    def test_batch_broadcast(self):
+        rand_base_vectors = (np.random.rand(10, 3) - 0.5) * 20
+        destination = (np.random.rand(3) - 0.5) * 20
+
+        rot_under_test = MagneticController.calculate_rotation(
+            rand_base_vectors, destination)
+
+        for i, base in enumerate(rand_base_vectors):
+            single = MagneticController.calculate_rotation(base, destination)
+            np.testing.assert_allclose(
+                rot_under_test[i].as_matrix(), single.as_matrix(), atol=1e-12)
+
+class TestTorques(unittest.TestCase):
+    def setUp(self):
+        Config.set_test_env()
+
+        # Cube split into five tetrahedra
+        self.positions = np.array([
+            [0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0],
+            [0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1],
+        ], dtype=float)
+        self.tetrahedra = np.array([
+            [0, 1, 2, 4],
+            [1, 3, 2, 7],
+            [1, 2, 4, 7],
+            [1, 4, 5, 7],
+            [2, 4, 7, 6],
+        ])
+
+        self.eo = unittest.mock.MagicMock()
+        self.eo.mesh.tetrahedra.value = self.tetrahedra
+        self.eo.mesh.position.value = self.positions
+        self.force_field = unittest.mock.Mock()
+        self.force_field.forces = DummyData(np.zeros((8, 3)))
+        self.eo.vertex_forces = VertexForces(self.force_field, 8)
+        self.material_loader = MaterialLoader(self.eo)
+        self.material_loader.set_remanence(Config.get_remanence())
+        self.uut = MagneticController(self.eo, self.material_loader)
+
+    def _reference_torques(self, cur_positions: np.ndarray) -> dict:
+        torques = {}
+        for index, tetrahedron in enumerate(self.tetrahedra):
+            initial_normal = MagneticController._normal(
+                self.positions, tetrahedron)[0]
+            rotation = MagneticController.calculate_rotation(
+                initial_normal, Config.get_initial_dipole_moment())
+            normal = MagneticController._normal(cur_positions, tetrahedron)[0]
+            orientation = rotation.apply(normal)
+            for node in tetrahedron:
+                if node not in torques:
+                    dipole_moment = Config.get_remanence().T * self.uut._volume / MU0
+                    torques[node] = np.cross(
+                        dipole_moment * orientation, Config.get_b_field())
+        return torques
+
+    def test_normals(self):
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        normals, vecs1, vecs2 = MagneticController._normals(
+            cur_positions, self.tetrahedra)
+
+        for i, tetrahedron in enumerate(self.tetrahedra):
+            normal, vec1, vec2 = MagneticController._normal(
+                cur_positions, tetrahedron)
+            np.testing.assert_array_equal(normals[i], normal)
+            np.testing.assert_array_equal(vecs1[i], vec1)
+            np.testing.assert_array_equal(vecs2[i], vec2)
+
+    def test_volume(self):
+        self.assertAlmostEqual(self.uut._volume, 1)
+
+    def test_node_owners(self):
+        for node, owner in enumerate(self.uut._node_owners):
+            first_owner = next(i for i, tetrahedron in enumerate(self.tetrahedra)
+                               if node in tetrahedron)
+            self.assertEqual(owner, first_owner)
+
+    def test_rotation_matrices(self):
+        for index, tetrahedron in enumerate(self.tetrahedra):
+            normal = MagneticController._normal(self.positions, tetrahedron)[0]
+            rotation = MagneticController.calculate_rotation(
+                normal, Config.get_initial_dipole_moment())
+            np.testing.assert_array_equal(
+                self.uut._element_rotations[index], rotation.as_matrix())
+
+    def test_single_tetrahedron(self):
+        self.tetrahedra = self.tetrahedra[:1]
+        self.eo.mesh.tetrahedra.value = self.tetrahedra
+        # The reference torques use the volume of the controller under test
+        self.uut = uut = MagneticController(self.eo, self.material_loader)
+        self.assertEqual(uut._element_rotations.shape, (1, 3, 3))
+
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        nodes, torques = uut.calculate_torques(cur_positions)
+        reference = self._reference_torques(cur_positions)
+        np.testing.assert_array_equal(nodes, [0, 1, 2, 4])
+        for node, torque in zip(nodes, torques):
+            np.testing.assert_allclose(torque, reference[node], atol=1e-9)
+
+    def test_torques_identical_to_loop(self):
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        reference = self._reference_torques(cur_positions)
+
+        nodes, torques = self.uut.calculate_torques(cur_positions)
+
+        self.assertListEqual(nodes.tolist(), sorted(reference.keys()))
+        for node, torque in zip(nodes, torques):
+            np.testing.assert_array_equal(torque, reference[node])
+
+    def test_animate_sets_forces(self):
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        self.eo.mech_obj.position.value = cur_positions
+        reference = self._reference_torques(cur_positions)
+
+        self.uut.onAnimateBeginEvent(None)
+
+        self.assertEqual(self.force_field.forces.writes, 1)
+        for node in range(len(self.positions)):
+            np.testing.assert_array_equal(
+                self.eo.vertex_forces[node].forces[0], reference[node])
+
+    def test_per_element_dipoles(self):
+        uut = MagneticController(
+            self.eo, self.material_loader, per_element_dipoles=True)
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        reference = self._reference_torques(cur_positions)
+
+        nodes, torques = uut.calculate_torques(cur_positions)
+
+        # Each torque is scaled by the volume of the tetrahedron it is defined by
+        for node, torque in zip(nodes, torques):
+            volume = uut._volumes[uut._node_owners[node]]
+            np.testing.assert_allclose(
+                torque, reference[node] * volume / uut._volume)
+
+    def test_remanence_update(self):
+        self.eo.mech_obj.position.value = self.positions
+        new_remanence = Tesla.from_T(Config.get_remanence().T * 3)
+        old_dipole_moments = self.uut._dipole_moments.copy()
+
+        self.material_loader.set_remanence(new_remanence)
+        self.uut.onAnimateBeginEvent(None)
+
+        np.testing.assert_allclose(
+            self.uut._dipole_moments, old_dipole_moments * 3)
+        self.assertAlmostEqual(self.uut._remanence, new_remanence.T)
+
+    def test_no_remanence_update(self):
+        self.eo.mech_obj.position.value = self.positions
+        with unittest.mock.patch.object(self.uut, '_update_dipole_moments') as update:
+            self.uut.onAnimateBeginEvent(None)
+            self.material_loader.set_density(Density.from_kgpm3(2))
+            self.uut.onAnimateBeginEvent(None)
+            update.assert_not_called()
+
+    def test_b_field(self):
+        np.testing.assert_array_equal(
+            self.uut.get_b_field(), Config.get_b_field())
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+        _, torques = self.uut.calculate_torques(cur_positions)
+
+        self.uut.set_b_field(Config.get_b_field() * -2)
+        _, new_torques = self.uut.calculate_torques(cur_positions)
+
+        np.testing.assert_allclose(new_torques, torques * -2)
+        with self.assertRaises(ValueError):
+            self.uut.set_b_field(np.zeros(4))
+
+    def test_chunked_torques(self):
+        executor = ChunkedExecutor(3)
+        executor.MIN_CHUNK_ROWS = 1
+        executor.CHUNK_BYTES = 256
+        field_map = FieldMap(np.random.rand(2, 2, 2, 3), np.zeros(3), 1)
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+
+        for uniform in (True, False):
+            uut = MagneticController(self.eo, self.material_loader, executor=executor,
+                                     field_map=None if uniform else field_map)
+            self.uut.set_field_map(None if uniform else field_map)
+
+            nodes, torques = uut.calculate_torques(cur_positions)
+            ref_nodes, ref_torques = self.uut.calculate_torques(cur_positions)
+
+            np.testing.assert_array_equal(nodes, ref_nodes)
+            np.testing.assert_array_equal(torques, ref_torques)
+        executor.shutdown()
+
+    def test_uniform_field_map(self):
+        field = np.broadcast_to(Config.get_b_field(), (2, 2, 2, 3))
+        uut = MagneticController(self.eo, self.material_loader,
+                                 field_map=FieldMap(field, np.zeros(3), 1))
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+
+        _, torques = uut.calculate_torques(cur_positions)
+        _, ref_torques = self.uut.calculate_torques(cur_positions)
+
+        np.testing.assert_allclose(torques, ref_torques)
+
+    def test_field_map_at_centroids(self):
+        # Field pointing along z that grows linearly along x
+        field = np.zeros((2, 2, 2, 3))
+        field[1, :, :, 2] = 1
+        self.uut.set_field_map(FieldMap(field, np.zeros(3), 1))
+        self.assertIsNotNone(self.uut.get_field_map())
+
+        nodes, torques = self.uut.calculate_torques(self.positions)
+
+        for index, (node, torque) in enumerate(zip(nodes, torques)):
+            owner = self.uut._node_owners[node]
+            tetrahedron = self.tetrahedra[owner]
+            b_field = np.array(
+                [0, 0, self.positions[tetrahedron].mean(axis=0)[0]])
+            normal = MagneticController._normal(self.positions, tetrahedron)[0]
+            m = self.uut._node_dipole_moments[index] * \
+                self.uut._element_rotations[owner] @ normal
+            np.testing.assert_allclose(
+                torque, np.cross(m, b_field), atol=1e-6)
+
+        self.uut.set_field_map(None)
+        self.assertIsNone(self.uut.get_field_map())
+
+    def test_keyframe_schedule(self):
+        self.eo.mech_obj.position.value = self.positions
+        fields = np.array([[0, 0, 0], [0, 0, 1]])
+        self.uut.set_field_schedule(
+            FieldSchedule.keyframes([0, 0.01], fields), 0.005)
+
+        b_fields = []
+        for _ in range(4):
+            self.uut.onAnimateBeginEvent(None)
+            b_fields.append(self.uut.get_b_field())
+
+        # The last keyframe is held
+        np.testing.assert_allclose(
+            b_fields, [[0, 0, 0], [0, 0, 0.5], [0, 0, 1], [0, 0, 1]])
+
+    def test_periodic_schedule(self):
+        self.eo.mech_obj.position.value = self.positions
+        schedule = FieldSchedule.rotating(1, 50)
+        table = schedule.compile(0.005)
+        self.uut.set_field_schedule(schedule, 0.005)
+
+        for step in range(len(table) + 1):
+            self.uut.onAnimateBeginEvent(None)
+            np.testing.assert_array_equal(
+                self.uut.get_b_field(), table[step % len(table)])
+
+        # Removing the schedule keeps the current field
+        self.uut.set_field_schedule(None, 0.005)
+        self.uut.onAnimateBeginEvent(None)
+        np.testing.assert_array_equal(self.uut.get_b_field(), table[0])
+
+    def test_lazy_schedule(self):
+        self.eo.mech_obj.position.value = self.positions
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        uut.set_field_schedule(FieldSchedule.keyframes(
+            [0, 0.005], [Config.get_b_field(), Config.get_b_field() * 2]), 0.005)
+
+        # Each change of the field updates all torques
+        refreshed = []
+        for _ in range(3):
+            uut.onAnimateBeginEvent(None)
+            refreshed.append(uut.refreshed_elements)
+        self.assertListEqual(refreshed, [len(uut._owner_tetrahedra)] * 2 + [0])
+
+    def test_state(self):
+        self.eo.mech_obj.position.value = self.positions
+        schedule = FieldSchedule.rotating(1, 50)
+        table = schedule.compile(0.005)
+        self.uut.set_field_schedule(schedule, 0.005)
+        for _ in range(3):
+            self.uut.onAnimateBeginEvent(None)
+        state = self.uut.get_state()
+
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        uut.set_field_schedule(schedule, 0.005)
+        uut.calculate_outdated_torques(self.positions)
+        uut.set_state(state)
+
+        # The schedule continues and all torques are recalculated
+        uut.onAnimateBeginEvent(None)
+        np.testing.assert_array_equal(uut.get_b_field(), table[3])
+        self.assertEqual(uut.refreshed_elements, len(uut._owner_tetrahedra))
+
+    def test_lazy_first_update(self):
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        cur_positions = self.positions + np.random.rand(8, 3) * 0.1
+
+        nodes, torques = uut.calculate_outdated_torques(cur_positions)
+        ref_nodes, ref_torques = self.uut.calculate_torques(cur_positions)
+
+        self.assertEqual(uut.refreshed_elements, len(uut._owner_tetrahedra))
+        np.testing.assert_array_equal(nodes, ref_nodes)
+        np.testing.assert_array_equal(torques, ref_torques)
+
+    def test_lazy_within_tolerance(self):
+        tolerance = 0.01
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=tolerance)
+        uut.calculate_outdated_torques(self.positions)
+
+        rotation = Rotation.from_rotvec([0, 0, tolerance / 2])
+        cur_positions = rotation.apply(self.positions)
+        nodes, torques = uut.calculate_outdated_torques(cur_positions)
+
+        self.assertEqual(uut.refreshed_elements, 0)
+        self.assertEqual(len(nodes), 0)
+        self.assertEqual(torques.shape, (0, 3))
+
+    def test_lazy_partial_update(self):
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        uut.calculate_outdated_torques(self.positions)
+
+        # Only the normal of the first tetrahedron depends on node 0
+        cur_positions = self.positions.copy()
+        cur_positions[0] += [0, 0, 0.3]
+        nodes, torques = uut.calculate_outdated_torques(cur_positions)
+        ref_nodes, ref_torques = self.uut.calculate_torques(cur_positions)
+
+        self.assertEqual(uut.refreshed_elements, 1)
+        self.assertListEqual(nodes.tolist(), [0, 1, 2, 4])
+        np.testing.assert_array_equal(torques, ref_torques[np.isin(ref_nodes, nodes)])
+
+    def test_lazy_accuracy(self):
+        tolerance = 0.05
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=tolerance)
+        uut.calculate_outdated_torques(self.positions)
+        _, stale_torques = uut.calculate_torques(self.positions)
+
+        rotation = Rotation.from_rotvec([tolerance * 0.9, 0, 0])
+        cur_positions = rotation.apply(self.positions)
+        nodes, _ = uut.calculate_outdated_torques(cur_positions)
+        _, torques = uut.calculate_torques(cur_positions)
+
+        self.assertEqual(len(nodes), 0)
+        bound = np.linalg.norm(uut._node_dipole_moments[:, np.newaxis]
+                               * uut.get_b_field(), axis=1) * tolerance
+        self.assertTrue(np.all(np.linalg.norm(
+            torques - stale_torques, axis=1) <= bound))
+
+    def test_lazy_refresh_on_b_field(self):
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        uut.calculate_outdated_torques(self.positions)
+
+        uut.set_b_field(Config.get_b_field() * 2)
+        nodes, _ = uut.calculate_outdated_torques(self.positions)
+
+        self.assertEqual(uut.refreshed_elements, len(uut._owner_tetrahedra))
+        self.assertEqual(len(nodes), len(self.positions))
+
+    def test_lazy_animate(self):
+        uut = MagneticController(
+            self.eo, self.material_loader, lazy_tolerance=0.01)
+        self.eo.mech_obj.position.value = self.positions
+        uut.onAnimateBeginEvent(None)
+        uut.onAnimateBeginEvent(None)
+
+        # The second step has nothing to update
+        self.assertEqual(self.force_field.forces.writes, 1)
+        self.assertEqual(uut.refreshed_elements, 0)
+
+    def test_lazy_exceptional(self):
+        with self.assertRaises(ValueError):
+            MagneticController(
+                self.eo, self.material_loader, lazy_tolerance=-0.01)
+        with self.assertRaises(ValueError):
+            self.uut.calculate_outdated_torques(self.positions)
+        with self.assertRaises(ValueError):
+            MagneticController(self.eo, self.material_loader, lazy_tolerance=0.01,
+                               field_map=FieldMap(np.zeros((2, 2, 2, 3)), np.zeros(3), 1))
+
+    def tearDown(self):
+        Config.reset()
+
+
 def suite() -> unittest.TestSuite:
     test_suite = unittest.TestSuite()
 
@@ -155,6 +561,7 @@ def suite() -> unittest.TestSuite:
     tests = [
         TestAngles,
         TestRotation,
+        TestTorques,
     ]
 
     # Load tests
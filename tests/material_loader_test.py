@@ -78,10 +78,17 @@ class TestNormalBehavior(unittest.TestCase):
         self.assertAlmostEqual(eo.remanence.T, expected_remanence)
         self.assertAlmostEqual(uut.get_remanence().T, expected_remanence)
 
+    def test_update_reported(self):
+        eo = unittest.mock.Mock()
+        uut = MaterialLoader(eo)
+        uut.set_remanence(Tesla.from_T(uniform(-100, 100)))
+        self.assertTrue(uut.update_elastic_object())
+        self.assertFalse(uut.update_elastic_object())
+
     def test_no_update_made(self):
         eo = unittest.mock.Mock()
         uut = MaterialLoader(eo)
-        uut.update_elastic_object()
+        self.assertFalse(uut.update_elastic_object())
         for func in [
             eo.remanence,
             eo.FEM_force_field.setDataValues,
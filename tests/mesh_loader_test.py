@@ -24,11 +24,16 @@
 This module provides testcases for module src.MeshLoader (US13).
 """
 import unittest
+import tempfile
 from pathlib import Path
 import random
 import string
+import numpy as np
 from src import MeshLoader
-from src.mesh_loader import Mode
+from src.mesh_loader import (Mode, CACHE_DIRECTORY, MeshData, boundary_faces, decimate_surface,
+                             node_bandwidth, read_level_of_detail, read_mesh, read_surface,
+                             reorder_nodes, surface_node_indices, vertex_normals,
+                             write_gmsh)
 from .assets import DummyNode
 
 
@@ -177,6 +182,404 @@ class TestNormalBehavior(unittest.TestCase):
         self.assertEqual(f'@{rand_name}_surface', uut.reference(Mode.SURFACE))
 
 
+class TestReader(unittest.TestCase):
+    """
+    This testcase tests reading meshes without SOFA.
+    """
+
+    positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0],
+                          [0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1]], dtype=float)
+    tetrahedra = np.array([[0, 1, 2, 4], [1, 3, 2, 7], [1, 2, 4, 7], [1, 5, 4, 7], [2, 4, 7, 6]])
+    triangles = np.array([[0, 2, 1], [1, 2, 3], [4, 5, 7], [4, 7, 6]])
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def write(self, name: str, content) -> Path:
+        path = self.path / name
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content, encoding="utf-8")
+        return path
+
+    def assert_mesh(self, mesh, triangles=True, tetrahedra=True):
+        np.testing.assert_array_equal(mesh.positions, self.positions)
+        if triangles:
+            np.testing.assert_array_equal(mesh.triangles, self.triangles)
+        if tetrahedra:
+            np.testing.assert_array_equal(mesh.tetrahedra, self.tetrahedra)
+
+    def test_gmsh_4(self):
+        # Nodes in two blocks with tags starting at 10, elements in three blocks
+        nodes = [f"{i + 10}" for i in range(8)]
+        coordinates = [" ".join(map(str, p)) for p in self.positions]
+        content = "\n".join([
+            "$MeshFormat", "4.1 0 8", "$EndMeshFormat",
+            "$Nodes", "2 8 10 17",
+            "0 1 0 3", *nodes[:3], *coordinates[:3],
+            "3 1 0 5", *nodes[3:], *coordinates[3:],
+            "$EndNodes",
+            "$Elements", "3 10 1 10",
+            "2 1 2 4", *[f"{i + 1} " + " ".join(str(n + 10) for n in t)
+                         for i, t in enumerate(self.triangles)],
+            "1 1 1 1", "5 10 11",
+            "3 1 4 5", *[f"{i + 6} " + " ".join(str(n + 10) for n in t)
+                         for i, t in enumerate(self.tetrahedra)],
+            "$EndElements", ""])
+        self.assert_mesh(read_mesh(self.write("cube.msh", content), use_cache=False))
+
+    def test_gmsh_4_0(self):
+        # Version 4.0 lists the tags with the coordinates, the second block is parametric
+        coordinates = [f"{i + 10} " + " ".join(map(str, p)) for i, p in enumerate(self.positions)]
+        content = "\n".join([
+            "$MeshFormat", "4 0 8", "$EndMeshFormat",
+            "$Nodes", "2 8",
+            "1 0 0 3", *coordinates[:3],
+            "1 2 1 5", *[f"{c} 0.5 0.5" for c in coordinates[3:]],
+            "$EndNodes",
+            "$Elements", "3 10",
+            "1 2 2 4", *[f"{i + 1} " + " ".join(str(n + 10) for n in t)
+                         for i, t in enumerate(self.triangles)],
+            "1 1 1 1", "5 10 11",
+            "1 3 4 5", *[f"{i + 6} " + " ".join(str(n + 10) for n in t)
+                         for i, t in enumerate(self.tetrahedra)],
+            "$EndElements", ""])
+        self.assert_mesh(read_mesh(self.write("cube.msh", content), use_cache=False))
+
+        # The MeshFormat of files written by Gmsh 4.0 states the minor version
+        self.assert_mesh(read_mesh(self.write("cube.msh", content.replace("4 0 8", "4.0 0 8")),
+                                   use_cache=False))
+
+    def test_gmsh_2(self):
+        content = "\n".join([
+            "$MeshFormat", "2.2 0 8", "$EndMeshFormat",
+            "$Nodes", "8", *[f"{i + 1} " + " ".join(map(str, p))
+                             for i, p in enumerate(self.positions)], "$EndNodes",
+            "$Elements", "10",
+            *[f"{i + 1} 2 2 0 1 " + " ".join(str(n + 1) for n in t)
+              for i, t in enumerate(self.triangles)],
+            "5 15 2 0 1 1",
+            *[f"{i + 6} 4 3 0 1 2 " + " ".join(str(n + 1) for n in t)
+              for i, t in enumerate(self.tetrahedra)],
+            "$EndElements", ""])
+        self.assert_mesh(read_mesh(self.write("cube.msh", content), use_cache=False))
+
+    def test_gmsh_1(self):
+        mesh = read_mesh(Path('tests/assets/mesh_loader_test/beam.msh'), use_cache=False)
+        self.assertEqual(mesh.positions.shape, (24, 3))
+        self.assertEqual(mesh.tetrahedra.shape, (20, 4))
+        np.testing.assert_array_equal(mesh.tetrahedra[0], [0, 4, 2, 1])
+
+    def test_gmsh_binary(self):
+        content = "$MeshFormat\n4.1 1 8\n$EndMeshFormat\n"
+        with self.assertRaises(ValueError):
+            read_mesh(self.write("cube.msh", content), use_cache=False)
+
+    def test_stl(self):
+        vertices = self.positions[self.triangles].astype(np.float32)
+        records = np.zeros(len(self.triangles), dtype=[
+            ("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")])
+        records["vertices"] = vertices
+        # Binary files may start with "solid" as well
+        binary = b"solid".ljust(80) + np.uint32(len(records)).tobytes() + records.tobytes()
+        ascii_content = "solid cube\n" + "".join(
+            "facet normal 0 0 0\nouter loop\n" +
+            "".join(f"vertex {x} {y} {z}\n" for x, y, z in triangle) +
+            "endloop\nendfacet\n" for triangle in vertices) + "endsolid cube\n"
+
+        for name, content in [("binary.stl", binary), ("ascii.stl", ascii_content)]:
+            mesh = read_mesh(self.write(name, content), use_cache=False)
+            # Nodes are merged in the order of their first appearance
+            np.testing.assert_array_equal(
+                mesh.positions, self.positions[[0, 2, 1, 3, 4, 5, 7, 6]])
+            np.testing.assert_array_equal(
+                mesh.positions[mesh.triangles], self.positions[self.triangles])
+
+    def test_off(self):
+        content = "\n".join([
+            "OFF", "# comment", "8 3 0",
+            *[" ".join(map(str, p)) for p in self.positions],
+            "3 0 2 1", "3 1 2 3", "4 4 5 7 6 255 0 0", ""])
+        self.assert_mesh(read_mesh(self.write("cube.off", content), use_cache=False),
+                         tetrahedra=False)
+
+    def test_vtk(self):
+        cells = [[3, *t] for t in self.triangles] + [[4, *t] for t in self.tetrahedra]
+        content = "\n".join([
+            "# vtk DataFile Version 3.0", "cube", "ASCII", "DATASET UNSTRUCTURED_GRID",
+            "POINTS 8 double", *[" ".join(map(str, p)) for p in self.positions],
+            f"CELLS 9 {sum(map(len, cells))}", *[" ".join(map(str, c)) for c in cells],
+            "CELL_TYPES 9", *["5"] * 4, *["10"] * 5, ""])
+        self.assert_mesh(read_mesh(self.write("cube.vtk", content), use_cache=False))
+
+        content = content.replace("ASCII", "BINARY")
+        with self.assertRaises(ValueError):
+            read_mesh(self.write("binary.vtk", content), use_cache=False)
+
+    def test_obj(self):
+        content = "\n".join([
+            "# comment", "o cube", *["v " + " ".join(map(str, p)) for p in self.positions],
+            "vn 0 0 1", "f 1/1/1 3/1/1 2/1/1", "f 2 3 4", "f -4 -3 -1 -2", ""])
+        self.assert_mesh(read_mesh(self.write("cube.obj", content), use_cache=False),
+                         tetrahedra=False)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            read_mesh(self.write("cube.obj", "v 0 0 0\nf 1 2 3\n"), use_cache=False)
+        with self.assertRaises(ValueError):
+            read_mesh(self.write("cube.stl", b"no mesh"), use_cache=False)
+        with self.assertRaises(ValueError):
+            read_mesh(self.write("cube.abc", "v 0 0 0"))
+        with self.assertRaises(FileNotFoundError):
+            read_mesh(self.path / "missing.msh")
+
+    def test_cache(self):
+        source = Path('tests/assets/mesh_loader_test/beam.msh')
+        path = self.write("beam.msh", source.read_bytes())
+        mesh = read_mesh(path)
+        cache = self.path / CACHE_DIRECTORY
+        self.assertEqual(len(list(cache.iterdir())), 1)
+
+        # Cached arrays are memory-mapped
+        cached = read_mesh(path)
+        self.assertIsInstance(cached.positions, np.memmap)
+        for array, cached_array in zip(mesh, cached):
+            np.testing.assert_array_equal(array, cached_array)
+
+        # Changed content replaces the entry
+        path.write_text(source.read_text().replace("5 1 1", "5 1 2"))
+        changed = read_mesh(path)
+        self.assertEqual(changed.positions[23, 2], 2)
+        self.assertEqual(len(list(cache.iterdir())), 1)
+
+    def test_loader_scaling(self):
+        uut = MeshLoader(scaling_factor=0.5)
+        uut.load_file(Path('tests/assets/mesh_loader_test/beam.obj'), Mode.SURFACE)
+        mesh = uut.read(Mode.SURFACE, use_cache=False)
+        self.assertEqual(mesh.positions.max(), 2.5)
+        with self.assertRaises(FileNotFoundError):
+            uut.read(Mode.VOLUMETRIC)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+class TestReorder(unittest.TestCase):
+    """
+    This testcase tests the bandwidth reducing renumbering of nodes.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        # A beam of 30 cubes whose nodes are numbered along the short axes last
+        grid = np.stack(np.meshgrid(np.arange(31), np.arange(2), np.arange(2),
+                                    indexing="ij"), axis=-1).reshape(-1, 3)
+        order = np.lexsort((grid[:, 0], grid[:, 1], grid[:, 2]))
+        positions = grid[order].astype(float)
+        number = {tuple(p): i for i, p in enumerate(positions.astype(int))}
+        corners = [(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0),
+                   (0, 0, 1), (1, 0, 1), (0, 1, 1), (1, 1, 1)]
+        cube = np.array([[0, 1, 2, 4], [1, 3, 2, 7], [1, 2, 4, 7], [1, 5, 4, 7], [2, 4, 7, 6]])
+        tetrahedra = [[number[(x + corners[c][0], corners[c][1], corners[c][2])] for c in t]
+                      for x in range(30) for t in cube]
+        triangles = [t[:3] for t in tetrahedra[::5]]
+        self.mesh = MeshData(positions, np.array(triangles), np.array(tetrahedra))
+
+    def test_reorder_nodes(self):
+        reordered, order = reorder_nodes(self.mesh)
+
+        self.assertEqual(node_bandwidth(self.mesh), 93)
+        self.assertLessEqual(node_bandwidth(reordered), 7)
+        np.testing.assert_array_equal(np.sort(order), np.arange(len(self.mesh.positions)))
+        np.testing.assert_array_equal(reordered.positions, self.mesh.positions[order])
+        # Every element keeps its nodes
+        for old, new in ((self.mesh.triangles, reordered.triangles),
+                         (self.mesh.tetrahedra, reordered.tetrahedra)):
+            np.testing.assert_array_equal(reordered.positions[new], self.mesh.positions[old])
+
+    def test_write_gmsh(self):
+        path = self.path / "beam.msh"
+        write_gmsh(path, self.mesh)
+        for array, read_array in zip(self.mesh, read_mesh(path, use_cache=False)):
+            np.testing.assert_array_equal(array, read_array)
+
+    def test_surface_node_indices(self):
+        surface = MeshData(self.mesh.positions[:40].astype(np.float32), self.mesh.triangles,
+                           np.empty((0, 4), dtype=np.int64))
+        self.assertIsNone(surface_node_indices(self.mesh.positions, surface.positions))
+
+        reordered, order = reorder_nodes(self.mesh)
+        indices = surface_node_indices(reordered.positions, surface.positions)
+        np.testing.assert_array_equal(order[indices], np.arange(40))
+        # The order of the vertices does not matter
+        indices = surface_node_indices(reordered.positions, surface.positions[::-1])
+        np.testing.assert_array_equal(order[indices], np.arange(40)[::-1])
+
+        with self.assertRaises(ValueError):
+            surface_node_indices(reordered.positions, surface.positions + 0.5)
+
+    def test_loader_surface_nodes(self):
+        models = Path(__file__).parents[1] / "lib/models"
+        reordered, order = reorder_nodes(read_mesh(models / "beam.msh", use_cache=False))
+        path = self.path / "beam.msh"
+        write_gmsh(path, reordered)
+        uut = MeshLoader()
+        uut.load_file(path, Mode.VOLUMETRIC)
+        uut.load_file(models / "beam.stl", Mode.SURFACE)
+
+        indices = uut.surface_nodes(use_cache=False)
+        # The vertices of the surface mesh are the first nodes before the reordering
+        vertex_count = len(read_mesh(models / "beam.stl", use_cache=False).positions)
+        np.testing.assert_array_equal(order[indices], np.arange(vertex_count))
+
+        uut.derive_surface()
+        self.assertIsNone(uut.surface_nodes(use_cache=False))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+class TestSurface(unittest.TestCase):
+    """
+    This testcase tests deriving the surface from the volumetric mesh.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        positions = TestReader.positions
+        # Mix the orientations of the tetrahedra
+        tetrahedra = TestReader.tetrahedra.copy()
+        tetrahedra[::2] = tetrahedra[::2, [1, 0, 2, 3]]
+        self.mesh = MeshData(positions, np.zeros((0, 3), dtype=np.int64), tetrahedra)
+
+    def test_boundary_faces(self):
+        faces = boundary_faces(self.mesh)
+
+        # The 6 sides of the cube, 2 triangles each
+        self.assertEqual(faces.shape, (12, 3))
+        corners = self.mesh.positions[faces]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        outwards = corners.mean(axis=1) - 0.5
+        self.assertTrue(np.all(np.einsum("ij,ij->i", normals, outwards) > 0))
+
+    def test_vertex_normals(self):
+        mesh = self.mesh._replace(positions=np.vstack((self.mesh.positions, [[2, 2, 2]])),
+                                  triangles=boundary_faces(self.mesh))
+        normals = vertex_normals(mesh)
+
+        np.testing.assert_allclose(np.linalg.norm(normals[:8], axis=1), 1)
+        # The normals of the corners point away from the center
+        self.assertTrue(np.all(np.einsum("ij,ij->i", normals[:8], mesh.positions[:8] - 0.5) > 0))
+        np.testing.assert_array_equal(normals[8], 0)
+
+    def test_read_surface(self):
+        path = self.path / "cube.msh"
+        write_gmsh(path, self.mesh)
+
+        surface = read_surface(path)
+        np.testing.assert_array_equal(surface.positions, self.mesh.positions)
+        np.testing.assert_array_equal(surface.triangles, boundary_faces(self.mesh))
+        self.assertEqual(len(surface.tetrahedra), 0)
+
+        cached = read_surface(path)
+        self.assertIsInstance(cached.triangles, np.memmap)
+        np.testing.assert_array_equal(cached.triangles, surface.triangles)
+
+        write_gmsh(path, self.mesh._replace(tetrahedra=self.mesh.tetrahedra[:0]))
+        with self.assertRaises(ValueError):
+            read_surface(path)
+
+    def test_loader_derive_surface(self):
+        path = self.path / "cube.msh"
+        write_gmsh(path, self.mesh)
+        uut = MeshLoader(scaling_factor=2)
+        with self.assertRaises(FileNotFoundError):
+            uut.derive_surface()
+
+        uut.load_file(path, Mode.VOLUMETRIC)
+        uut.derive_surface()
+        self.assertTrue(uut.surface_from_volume)
+        surface = uut.read(Mode.SURFACE, use_cache=False)
+        np.testing.assert_array_equal(surface.positions, self.mesh.positions * 2)
+        self.assertEqual(len(surface.triangles), 12)
+        with self.assertRaises(ValueError):
+            uut.load_mesh_into(DummyNode(), Mode.SURFACE)
+
+        # A surface mesh file replaces the derived surface
+        uut.load_file(path, Mode.SURFACE)
+        self.assertFalse(uut.surface_from_volume)
+        self.assertEqual(uut.load_mesh_into(DummyNode(), Mode.SURFACE)['filename'],
+                         str(path.absolute()))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    """
+    This testcase tests the decimation of surfaces.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "beam.msh"
+        self.path.write_bytes(Path("lib/models/beam.msh").read_bytes())
+        self.surface = read_surface(self.path, use_cache=False)
+
+    def test_decimate_surface(self):
+        for target in (400, 100, 40):
+            indices, decimated = decimate_surface(self.surface, target)
+
+            self.assertLessEqual(len(decimated.triangles), target)
+            # The nodes are a subset of the nodes of the surface
+            self.assertTrue(np.all(np.isin(indices, self.surface.triangles)))
+            np.testing.assert_array_equal(decimated.positions, self.surface.positions[indices])
+            np.testing.assert_array_equal(np.unique(decimated.triangles),
+                                          np.arange(len(indices)))
+            triangles = decimated.triangles
+            self.assertFalse(np.any((triangles[:, 0] == triangles[:, 1]) |
+                                    (triangles[:, 1] == triangles[:, 2]) |
+                                    (triangles[:, 0] == triangles[:, 2])))
+            self.assertEqual(len(np.unique(np.sort(triangles, axis=1), axis=0)), len(triangles))
+
+    def test_decimate_coarse_target(self):
+        indices, decimated = decimate_surface(self.surface, 1000)
+        self.assertEqual(len(decimated.triangles), 576)
+        np.testing.assert_array_equal(indices, np.unique(self.surface.triangles))
+        np.testing.assert_array_equal(indices[decimated.triangles], self.surface.triangles)
+
+        # The beam can not be decimated to 4 triangles without losing all triangles
+        self.assertGreater(len(decimate_surface(self.surface, 4)[1].triangles), 0)
+        with self.assertRaises(ValueError):
+            decimate_surface(self.surface, 0)
+
+    def test_read_level_of_detail(self):
+        indices, decimated = read_level_of_detail(self.path, 100)
+        cached_indices, cached = read_level_of_detail(self.path, 100)
+
+        self.assertIsInstance(cached_indices, np.memmap)
+        np.testing.assert_array_equal(cached_indices, indices)
+        np.testing.assert_array_equal(cached.triangles, decimated.triangles)
+        # Each target has its own entry
+        self.assertLessEqual(len(read_level_of_detail(self.path, 50)[1].triangles), 50)
+
+    def test_loader_level_of_detail(self):
+        uut = MeshLoader(scaling_factor=0.5)
+        with self.assertRaises(FileNotFoundError):
+            uut.read_level_of_detail(100)
+
+        uut.load_file(self.path, Mode.VOLUMETRIC)
+        indices, decimated = uut.read_level_of_detail(100, use_cache=False)
+        np.testing.assert_array_equal(decimated.positions, self.surface.positions[indices] * 0.5)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
 def suite() -> unittest.TestSuite:
     """
     Provides MeshLoader tests.
@@ -187,6 +590,10 @@ def suite() -> unittest.TestSuite:
     tests = [
         TestExceptionalBehavior,
         TestNormalBehavior,
+        TestReader,
+        TestReorder,
+        TestSurface,
+        TestLevelOfDetail,
     ]
 
     # Load tests
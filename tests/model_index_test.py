@@ -0,0 +1,129 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from src import ModelIndex
+from src.model_index import INDEX_FILE
+
+
+class TestModelIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        for name in ("beam.msh", "beam.obj"):
+            shutil.copy2(Path("tests/assets/mesh_loader_test") / name, self.path)
+        (self.path / ".gitkeep").touch()
+
+    def test_refresh(self):
+        entries = ModelIndex(self.path).refresh()
+
+        self.assertEqual(list(entries), ["beam"])
+        entry = entries["beam"]
+        self.assertEqual(entry["nodes"], 24)
+        self.assertEqual(entry["tetrahedra"], 20)
+        self.assertEqual(entry["triangles"], 44)
+        self.assertEqual(entry["bounding_box"], [[0, 0, 0], [5, 1, 1]])
+        self.assertEqual(entry["scale"], 0.01)
+        self.assertEqual(set(entry["files"]), {"beam.msh", "beam.obj"})
+        self.assertTrue((self.path / INDEX_FILE).is_file())
+
+    def test_persistence(self):
+        ModelIndex(self.path).refresh()
+
+        # Unchanged files are neither read nor hashed again
+        with unittest.mock.patch("src.model_index.read_mesh") as read_mesh, \
+                unittest.mock.patch("src.model_index._file_digest") as digest:
+            entry = ModelIndex(self.path).get("beam")
+        read_mesh.assert_not_called()
+        digest.assert_not_called()
+        self.assertEqual(entry["nodes"], 24)
+
+    def test_changed_files(self):
+        uut = ModelIndex(self.path)
+        uut.refresh()
+        path = self.path / "beam.msh"
+
+        # A new modification time with the same content only updates the file state
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with unittest.mock.patch("src.model_index.read_mesh") as read_mesh:
+            entry = uut.get("beam")
+        read_mesh.assert_not_called()
+        self.assertEqual(entry["files"]["beam.msh"]["mtime_ns"], stat.st_mtime_ns + 10**9)
+
+        # Changed content is read again
+        path.write_text(path.read_text().replace("5 1 1", "5 1 2"))
+        self.assertEqual(uut.get("beam")["bounding_box"][1], [5, 1, 2])
+        self.assertEqual(json.loads((self.path / INDEX_FILE).read_text())
+                         ["models"]["beam"]["bounding_box"][1], [5, 1, 2])
+
+    def test_removed_model(self):
+        uut = ModelIndex(self.path)
+        uut.refresh()
+        (self.path / "beam.msh").unlink()
+        (self.path / "beam.obj").unlink()
+
+        self.assertEqual(uut.refresh(), {})
+        with self.assertRaises(KeyError):
+            uut.get("beam")
+
+    def test_derived_surface(self):
+        (self.path / "beam.obj").unlink()
+        # The 20 tetrahedra of the test beam share no faces
+        self.assertEqual(ModelIndex(self.path).get("beam")["triangles"], 80)
+
+    def test_invalid_model(self):
+        (self.path / "broken.msh").write_text("no mesh")
+        entry = ModelIndex(self.path).get("broken")
+        self.assertIsNone(entry["nodes"])
+        self.assertIsNone(entry["bounding_box"])
+
+    def test_invalid_index(self):
+        (self.path / INDEX_FILE).write_text("{")
+        self.assertEqual(ModelIndex(self.path).get("beam")["nodes"], 24)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestModelIndex,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
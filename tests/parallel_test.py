@@ -0,0 +1,105 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import threading
+import unittest
+import numpy as np
+
+from src import ChunkedExecutor
+
+
+class TestChunkedExecutor(unittest.TestCase):
+    def setUp(self):
+        self.uut = ChunkedExecutor(4)
+        # Small chunks to test the splitting on small arrays
+        self.uut.MIN_CHUNK_ROWS = 1
+        self.uut.CHUNK_BYTES = 80
+
+    def test_chunks(self):
+        chunks = self.uut.map(lambda start, stop: (start, stop), 35, 8)
+        self.assertListEqual(chunks, [(0, 10), (10, 20), (20, 30), (30, 35)])
+
+    def test_chunk_rows(self):
+        self.assertEqual(self.uut.chunk_rows(8), 10)
+        self.assertEqual(self.uut.chunk_rows(1000), 1)
+        self.assertEqual(ChunkedExecutor(2).chunk_rows(1024),
+                         ChunkedExecutor.MIN_CHUNK_ROWS)
+
+    def test_results(self):
+        values = np.random.rand(1000)
+        out = np.empty_like(values)
+
+        def square(start, stop):
+            out[start:stop] = values[start:stop] ** 2
+            return values[start:stop].sum()
+
+        sums = self.uut.map(square, len(values), 8)
+        np.testing.assert_array_equal(out, values ** 2)
+        self.assertAlmostEqual(sum(sums), values.sum())
+
+    def test_serial(self):
+        uut = ChunkedExecutor()
+        uut.MIN_CHUNK_ROWS = 1
+        threads = uut.map(
+            lambda start, stop: (start, stop, threading.current_thread()), 35, 8)
+        self.assertListEqual(
+            threads, [(0, 35, threading.current_thread())])
+
+    def test_shared(self):
+        shared = ChunkedExecutor.shared(2)
+        self.assertIs(ChunkedExecutor.shared(2), shared)
+        replaced = ChunkedExecutor.shared(3)
+        self.assertIsNot(replaced, shared)
+        self.assertEqual(replaced.workers, 3)
+
+        # A shut down executor runs on the calling thread
+        self.assertListEqual(shared.map(lambda start, stop: (start, stop),
+                                        10**6, 8), [(0, 10**6)])
+
+        replaced.shutdown()
+        self.assertIsNot(ChunkedExecutor.shared(3), replaced)
+        ChunkedExecutor.shared(3).shutdown()
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            ChunkedExecutor(0)
+
+    def tearDown(self):
+        self.uut.shutdown()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestChunkedExecutor,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
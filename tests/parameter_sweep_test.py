@@ -0,0 +1,166 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import json
+import sys
+import unittest
+import unittest.mock
+import numpy as np
+
+from src import parameter_sweep
+
+
+class TestExpandGrid(unittest.TestCase):
+    def test_base_only(self):
+        self.assertListEqual(parameter_sweep.expand_grid({"model": "beam"}),
+                             [{"model": "beam"}])
+
+    def test_grid(self):
+        runs = parameter_sweep.expand_grid(
+            {"model": "beam", "remanence": 0.1},
+            {"remanence": [0.2, 0.3], "magnetic_force": [0.01, 0.02]})
+
+        self.assertEqual(len(runs), 4)
+        self.assertListEqual(
+            [(run["remanence"], run["magnetic_force"]) for run in runs],
+            [(0.2, 0.01), (0.2, 0.02), (0.3, 0.01), (0.3, 0.02)])
+        self.assertTrue(all(run["model"] == "beam" for run in runs))
+
+    def test_variations(self):
+        runs = parameter_sweep.expand_grid(
+            {"model": "beam"},
+            {"magnetic_force": [0.01, 0.02]},
+            [{"magnetic_dir": [1, 0, 0]}, {"model": "butterfly"}])
+
+        self.assertEqual(len(runs), 4)
+        self.assertListEqual([run["model"] for run in runs],
+                             ["beam", "beam", "butterfly", "butterfly"])
+        self.assertNotIn("magnetic_dir", runs[2])
+
+
+class TestConsolidate(unittest.TestCase):
+    @staticmethod
+    def _result(nodes: int) -> dict:
+        return {
+            "steps": np.array(10),
+            "stopped": np.array(True),
+            "steady_state_step": np.array(4),
+            "positions": np.random.rand(nodes, 3),
+            "max_deformation": np.random.rand(nodes, 3),
+            "min_deformation": -np.random.rand(nodes, 3),
+            "max_stress": np.array(5.),
+        }
+
+    def test_consolidate(self):
+        runs = [{"model": "beam"}, {"model": "error"}, {"model": "butterfly"}]
+        results = [self._result(4), {"error": "ValueError: test"}, self._result(6)]
+
+        consolidated = parameter_sweep.consolidate(runs, results)
+
+        self.assertEqual(json.loads(consolidated["settings"][2]), runs[2])
+        self.assertListEqual(consolidated["errors"].tolist(),
+                             ["", "ValueError: test", ""])
+        self.assertListEqual(consolidated["steps"].tolist(), [10, 0, 10])
+        self.assertListEqual(consolidated["steady_state_step"].tolist(), [4, -1, 4])
+        np.testing.assert_array_equal(
+            consolidated["max_deformation"][0], results[0]["max_deformation"].max(axis=0))
+        np.testing.assert_array_equal(
+            consolidated["min_deformation"][2], results[2]["min_deformation"].min(axis=0))
+        self.assertTrue(np.isnan(consolidated["max_stress"][1]))
+        self.assertTrue(np.all(np.isnan(consolidated["max_deformation"][1])))
+
+        offsets = consolidated["position_offsets"]
+        self.assertListEqual(offsets.tolist(), [0, 4, 4, 10])
+        np.testing.assert_array_equal(
+            consolidated["positions"][offsets[2]:offsets[3]], results[2]["positions"])
+
+    def test_all_failed(self):
+        consolidated = parameter_sweep.consolidate(
+            [{}], [{"error": "ValueError: test"}])
+        self.assertEqual(consolidated["positions"].shape, (0, 3))
+
+    def test_no_runs(self):
+        with self.assertRaises(ValueError):
+            parameter_sweep.run_sweep([], 10)
+
+
+class TestWorker(unittest.TestCase):
+    def test_init_error(self):
+        # The import of SOFA fails in the worker
+        with unittest.mock.patch.dict(sys.modules, {"Sofa.Core": None}):
+            parameter_sweep._init_worker()
+
+        result = parameter_sweep._run(({"model": "beam"}, 10, None, None))
+
+        self.assertTrue(result["error"].startswith("Worker initialization failed"))
+        self.assertIn("Sofa.Core", result["error"])
+
+    @unittest.mock.patch("src.headless.run", side_effect=RuntimeError("test"))
+    @unittest.mock.patch("src.headless.build")
+    @unittest.mock.patch("src.headless.apply_settings")
+    @unittest.mock.patch("Sofa.Simulation.unload")
+    def test_unload_failed_run(self, unload, _apply_settings, build, _run):
+        result = parameter_sweep._run(({"model": "beam"}, 10, None, None))
+
+        self.assertEqual(result["error"], "RuntimeError: test")
+        unload.assert_called_once_with(build.return_value)
+
+    def tearDown(self):
+        parameter_sweep._init_error = None
+
+
+class TestSweep(unittest.TestCase):
+    def test_sweep(self):
+        runs = parameter_sweep.expand_grid(
+            {"model": "beam", "poisson_ratio": 0.47, "youngs_modulus": 1e8,
+             "density": 1100, "remanence": 0.35},
+            {"magnetic_force": [0.01, 0.05]},
+            [{}, {"poisson_ratio": 0.6}])
+
+        results = parameter_sweep.run_sweep(runs, 3, processes=2)
+
+        self.assertListEqual(results["steps"].tolist(), [3, 3, 0, 0])
+        self.assertEqual(results["errors"][0], "")
+        self.assertTrue(results["errors"][2].startswith("ValueError"))
+        self.assertListEqual(
+            results["position_offsets"].tolist(), [0, 306, 612, 612, 612])
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestExpandGrid,
+        TestConsolidate,
+        TestWorker,
+        TestSweep,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
@@ -0,0 +1,134 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import csv
+import json
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+import numpy as np
+
+from src import Profiler, ProfilerController
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.uut = Profiler(capacity=4)
+
+    def test_record(self):
+        for duration in [1, 2, 3]:
+            self.uut.record("step", duration)
+        np.testing.assert_array_equal(self.uut.get_samples("step"), [1, 2, 3])
+        self.assertListEqual(self.uut.get_names(), ["step"])
+
+    def test_ring_buffer(self):
+        for duration in range(10):
+            self.uut.record("step", duration)
+        np.testing.assert_array_equal(
+            self.uut.get_samples("step"), [6, 7, 8, 9])
+        self.assertEqual(self.uut.summary()["step"]["count"], 10)
+
+    def test_summary(self):
+        samples = np.random.rand(4)
+        for duration in samples:
+            self.uut.record("step", duration)
+
+        summary = self.uut.summary()["step"]
+        self.assertAlmostEqual(summary["mean_ms"], samples.mean() * 1e3)
+        self.assertAlmostEqual(summary["p50_ms"], np.median(samples) * 1e3)
+        self.assertAlmostEqual(
+            summary["p95_ms"], np.percentile(samples, 95) * 1e3)
+        self.assertAlmostEqual(summary["max_ms"], samples.max() * 1e3)
+
+    def test_instrument(self):
+        controller = unittest.mock.Mock()
+        controller.onAnimateBeginEvent.return_value = 42
+
+        self.uut.instrument(controller)
+        result = controller.onAnimateBeginEvent("event")
+        controller.onAnimateBeginEvent("event")
+
+        self.assertEqual(result, 42)
+        name = "Mock.onAnimateBeginEvent"
+        self.assertEqual(len(self.uut.get_samples(name)), 2)
+        self.assertTrue(np.all(self.uut.get_samples(name) >= 0))
+
+    def test_instrumented_before_first_call(self):
+        controller = unittest.mock.Mock()
+        self.uut.instrument(controller)
+        self.assertEqual(self.uut.summary(), {})
+        with self.assertRaises(KeyError):
+            self.uut.get_samples("missing")
+
+    def test_export(self):
+        self.uut.record("step", 0.002)
+        self.uut.record("step", 0.004)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "profile.json"
+            self.uut.export(json_path)
+            with open(json_path, encoding="utf-8") as file:
+                self.assertDictEqual(json.load(file), self.uut.summary())
+
+            csv_path = Path(directory) / "profile.csv"
+            self.uut.export(csv_path)
+            with open(csv_path, encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]["name"], "step")
+            self.assertAlmostEqual(float(rows[0]["mean_ms"]), 3)
+
+            with self.assertRaises(ValueError):
+                self.uut.export(Path(directory) / "profile.txt")
+
+    def test_controller(self):
+        controller = ProfilerController(self.uut)
+        controller.onAnimateEndEvent(None)
+        self.assertNotIn(ProfilerController.NAME, self.uut.get_names())
+
+        for _ in range(3):
+            controller.onAnimateBeginEvent(None)
+            controller.onAnimateEndEvent(None)
+        self.assertEqual(
+            len(self.uut.get_samples(ProfilerController.NAME)), 3)
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            Profiler(capacity=0)
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestProfiler,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
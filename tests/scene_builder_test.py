@@ -21,6 +21,7 @@
 # ____________________________________________________________________________________ #
 
 import unittest
+from pathlib import Path
 from random import choices
 import string
 import numpy as np
@@ -28,6 +29,8 @@ import numpy as np
 import Sofa
 
 from src import SceneBuilder, Config
+from src.scene_builder import SAP_ELEMENT_THRESHOLD, select_broad_phase
+from src.sofa_instantiator import count_collision_elements
 
 
 class TestSceneBuilder(unittest.TestCase):
@@ -131,6 +134,60 @@ class TestSceneBuilder(unittest.TestCase):
         child = root.getChild(name)
         self.assertIsNotNone(child)
 
+    def test_scene_profile(self):
+        root = Sofa.Core.Node("root")
+        SceneBuilder(root)
+
+        self.assertIsNotNone(root.getObject('FreeMotionAnimationLoop'))
+        self.assertIsNotNone(root.getObject('CollisionPipeline'))
+
+        Config.set_scene_profile(Config.SceneProfile.FREE)
+        root = Sofa.Core.Node("root")
+        SceneBuilder(root)
+        Config.set_scene_profile()
+
+        self.assertIsNotNone(root.getObject('DefaultAnimationLoop'))
+        for name in ['FreeMotionAnimationLoop', 'GenericConstraintSolver', 'CollisionPipeline']:
+            self.assertIsNone(root.getObject(name))
+
+    def test_select_broad_phase(self):
+        self.assertEqual(select_broad_phase(0), Config.BroadPhase.BRUTE_FORCE)
+        self.assertEqual(select_broad_phase(SAP_ELEMENT_THRESHOLD, 4),
+                         Config.BroadPhase.BRUTE_FORCE)
+        self.assertEqual(select_broad_phase(SAP_ELEMENT_THRESHOLD + 1),
+                         Config.BroadPhase.INCREMENTAL_SAP)
+        self.assertEqual(select_broad_phase(SAP_ELEMENT_THRESHOLD + 1, 4),
+                         Config.BroadPhase.PARALLEL_BRUTE_FORCE)
+
+    def test_total_collision_elements(self):
+        volume_path = Path(__file__).parents[1] / "lib/models/beam.msh"
+        elements = count_collision_elements([volume_path])
+
+        # The copies of a model count towards the total
+        self.assertGreater(elements, 0)
+        self.assertEqual(count_collision_elements([volume_path] * 3), 3 * elements)
+        self.assertEqual(count_collision_elements([]), 0)
+        copies = SAP_ELEMENT_THRESHOLD // elements + 1
+        self.assertEqual(select_broad_phase(count_collision_elements([volume_path] * copies)),
+                         Config.BroadPhase.INCREMENTAL_SAP)
+
+    def test_broad_phase(self):
+        root = Sofa.Core.Node("root")
+        uut = SceneBuilder(root, total_collision_elements=SAP_ELEMENT_THRESHOLD + 1)
+
+        self.assertEqual(uut.broad_phase, Config.BroadPhase.INCREMENTAL_SAP)
+        self.assertEqual(root.getObject('BroadPhase').getClassName(), 'IncrSAP')
+        self.assertIsNone(root.getObject('NarrowPhase'))
+
+        Config.set_broad_phase(Config.BroadPhase.BRUTE_FORCE)
+        root = Sofa.Core.Node("root")
+        uut = SceneBuilder(root, total_collision_elements=SAP_ELEMENT_THRESHOLD + 1)
+        Config.set_broad_phase()
+
+        self.assertEqual(uut.broad_phase, Config.BroadPhase.BRUTE_FORCE)
+        self.assertEqual(root.getObject('BroadPhase').getClassName(), 'BruteForceBroadPhase')
+        self.assertIsNotNone(root.getObject('NarrowPhase'))
+
     @classmethod
     def tearDownClass(cls):
         Config.reset()
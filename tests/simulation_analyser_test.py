@@ -27,11 +27,12 @@ from pathlib import Path
 import numpy as np
 import Sofa
 
-from src import (SimulationAnalyser, MeshLoader, ElasticObject,
-                 Config, SimulationAnalysisController, AnalysisParameters)
+from src import (SimulationAnalyser, MeshLoader, ElasticObject, Config,
+                 SimulationAnalysisController, AnalysisParameters, ConvergenceMonitor)
 from src import sofa_instantiator
 from src.mesh_loader import Mode
 from src.units import YoungsModulus, Density
+from tests.assets.dummy_data import DummyData
 
 
 class TestAnalyserUtils(unittest.TestCase):
@@ -433,6 +434,62 @@ class TestAnalysisController(unittest.TestCase):
         # widget.update_results.assert_not_called()
 
 
+class TestConvergenceMonitor(unittest.TestCase):
+
+    def setUp(self):
+        root = unittest.mock.MagicMock()
+        self.dofs = root.getChild.return_value.getObject.return_value
+        self.dofs.position = DummyData(np.zeros((4, 3)))
+        self.dofs.velocity = DummyData(np.zeros((4, 3)))
+        self.analyser = SimulationAnalyser(root)
+
+    def test_energy(self):
+        uut = ConvergenceMonitor(self.analyser, window=3, energy_tolerance=0.5,
+                                 masses=np.full(4, 2.))
+        self.dofs.velocity.value[0] = [1, 0, 0]
+        self.assertFalse(uut.update())
+        self.assertAlmostEqual(uut.get_kinetic_energy(), 1.)
+
+        # The energy has to stay below the tolerance for the whole window
+        self.dofs.velocity.value[0] = [0.1, 0, 0]
+        self.assertListEqual([uut.update() for _ in range(4)],
+                             [False, False, True, True])
+        self.assertEqual(uut.steady_state_step, 2)
+
+    def test_displacement(self):
+        uut = ConvergenceMonitor(self.analyser, window=2, displacement_tolerance=0.01)
+        steady = []
+        for offset in [0.1, 0.2, 0.205, 0.205, 0.3, 0.3, 0.3]:
+            self.dofs.position.value[1] = [0, offset, 0]
+            steady.append(uut.update())
+
+        self.assertListEqual(steady, [False, False, False, True, False, False, True])
+        self.assertAlmostEqual(uut.get_max_displacement(), 0)
+        # The first steady state is reported
+        self.assertEqual(uut.steady_state_step, 3)
+        self.assertTrue(np.isinf(uut.get_kinetic_energy()))
+
+        uut.reset()
+        self.assertIsNone(uut.steady_state_step)
+        self.assertFalse(uut.update())
+
+    def test_masses_of_model(self):
+        mass = self.analyser.elastic_object.getObject('Mass')
+        mass.vertexMass.value = np.full(4, 3.)
+        self.dofs.velocity.value[:] = 1
+        uut = ConvergenceMonitor(self.analyser, energy_tolerance=1)
+        uut.update()
+        self.assertAlmostEqual(uut.get_kinetic_energy(), 18.)
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(self.analyser)
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(self.analyser, window=0, displacement_tolerance=1)
+        with self.assertRaises(ValueError):
+            ConvergenceMonitor(self.analyser, displacement_tolerance=-1)
+
+
 def suite() -> unittest.TestSuite:
     test_suite = unittest.TestSuite()
 
@@ -441,6 +498,7 @@ def suite() -> unittest.TestSuite:
         TestAnalyserUtils,
         TestDeformation,
         TestAnalysisController,
+        TestConvergenceMonitor,
     ]
 
     # Load tests
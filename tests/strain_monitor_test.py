@@ -0,0 +1,111 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import unittest
+import unittest.mock
+import warnings
+import numpy as np
+from scipy.spatial.transform import Rotation
+
+from src import StrainMonitor
+from tests.assets.dummy_data import DummyData
+
+
+class TestStrainMonitor(unittest.TestCase):
+    def setUp(self):
+        self.rest_positions = np.array([
+            [0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1],
+        ], dtype=float)
+        self.elastic_object = unittest.mock.MagicMock()
+        self.elastic_object.mesh.tetrahedra = DummyData([[0, 1, 2, 3], [1, 2, 3, 4]])
+        self.elastic_object.mesh.position = DummyData(self.rest_positions)
+        self.elastic_object.mech_obj.position = DummyData(self.rest_positions)
+
+    def rotate(self, angle: float) -> None:
+        rotation = Rotation.from_rotvec([0, 0, angle])
+        self.elastic_object.mech_obj.position.value = rotation.apply(self.rest_positions)
+
+    def test_rotations(self):
+        uut = StrainMonitor(self.elastic_object)
+
+        np.testing.assert_allclose(uut.calculate_rotations(self.rest_positions), 0, atol=1e-7)
+        stretched = self.rest_positions * [2, 1, 0.5] + [3, 0, 0]
+        np.testing.assert_allclose(uut.calculate_rotations(stretched), 0, atol=1e-7)
+        rotated = Rotation.from_rotvec([0.3, 0, 0]).apply(stretched)
+        np.testing.assert_allclose(uut.calculate_rotations(rotated), 0.3)
+
+    def test_check(self):
+        uut = StrainMonitor(self.elastic_object, tolerance=0.1)
+
+        self.rotate(0.05)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertTrue(uut.check())
+        self.assertAlmostEqual(uut.max_rotation, 0.05)
+
+        self.rotate(0.2)
+        with self.assertWarns(RuntimeWarning):
+            self.assertFalse(uut.check())
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertFalse(uut.check())
+
+        self.rotate(0)
+        self.assertTrue(uut.check())
+        self.rotate(0.2)
+        with self.assertWarns(RuntimeWarning):
+            uut.check()
+
+    def test_interval(self):
+        uut = StrainMonitor(self.elastic_object, interval=3)
+        self.rotate(0.2)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            uut.onAnimateBeginEvent(None)
+            uut.onAnimateBeginEvent(None)
+        with self.assertWarns(RuntimeWarning):
+            uut.onAnimateBeginEvent(None)
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            StrainMonitor(self.elastic_object, tolerance=0)
+        with self.assertRaises(ValueError):
+            StrainMonitor(self.elastic_object, interval=0)
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestStrainMonitor,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite
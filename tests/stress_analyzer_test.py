@@ -24,7 +24,7 @@ import unittest
 import unittest.mock
 import numpy as np
 
-from src import StressAnalyzer, AnalysisParameters
+from src import StressAnalyzer, AnalysisParameters, ChunkedExecutor
 
 
 class TestStressAnalyzer(unittest.TestCase):
@@ -53,6 +53,23 @@ class TestStressAnalyzer(unittest.TestCase):
         self.assertAlmostEqual(7.2, uut.max_stress)
         self.assertAlmostEqual(-0.3, uut.min_stress)
 
+    def test_chunked(self):
+        eo_mock = unittest.mock.MagicMock()
+        stress_values = np.random.rand(1000)
+        eo_mock.FEM_force_field.vonMisesPerNode.value = stress_values
+        params = AnalysisParameters(unittest.mock.Mock())
+        params.enable_stress_analysis()
+        executor = ChunkedExecutor(4)
+        executor.MIN_CHUNK_ROWS = 1
+        executor.CHUNK_BYTES = 800
+
+        uut = StressAnalyzer(eo_mock, params, executor)
+        uut.onAnimateBeginEvent(None)
+        executor.shutdown()
+
+        self.assertEqual(uut.max_stress, stress_values.max())
+        self.assertEqual(uut.min_stress, stress_values.min())
+
     def test_none_args(self):
         mock = unittest.mock.Mock()
         with self.assertRaises(ValueError):
@@ -0,0 +1,132 @@
+# ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾ #
+#                        MSR, Magnetic Soft Robotics Simulation                        #
+#   Copyright (C) 2025 Julius Hahnewald, Heiko Hellkamp, Finn Schubert, Carla Wehner   #
+#                                                                                      #
+# This program is free software; you can redistribute it and/or                        #
+# modify it under the terms of the GNU Lesser General Public                           #
+# License as published by the Free Software Foundation; either                         #
+# version 2.1 of the License, or (at your option) any later version.                   #
+#                                                                                      #
+# This program is distributed in the hope that it will be useful,                      #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of                       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU                    #
+# Lesser General Public License for more details.                                      #
+#                                                                                      #
+# You should have received a copy of the GNU Lesser General Public                     #
+# License along with this program; if not, write to the Free Software                  #
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301            #
+# USA                                                                                  #
+# ------------------------------------------------------------------------------------ #
+# Contact information: finn.s.schubert@gmail.com                                       #
+# ____________________________________________________________________________________ #
+
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+import numpy as np
+
+from src import TrajectoryRecorder
+from tests.assets.dummy_data import DummyData
+
+
+class TestTrajectoryRecorder(unittest.TestCase):
+    def setUp(self):
+        self.root = unittest.mock.MagicMock()
+        self.root.dt = DummyData(0.01)
+        self.dofs = self.root.getChild.return_value.getObject.return_value
+        self.dofs.position = DummyData(np.zeros((5, 3)))
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "trajectory.npy"
+
+    def animate(self, recorder: TrajectoryRecorder, steps: int) -> np.ndarray:
+        positions = []
+        for _ in range(steps):
+            self.dofs.position.value = np.random.rand(5, 3)
+            positions.append(self.dofs.position.value)
+            recorder.onAnimateEndEvent(None)
+        return np.array(positions)
+
+    def test_metadata_path(self):
+        # A run config with the same stem is kept
+        config_path = self.path.with_suffix(".json")
+        config_path.write_text("{}", encoding="utf-8")
+        uut = TrajectoryRecorder(self.root, self.path, 10)
+        uut.close()
+
+        self.assertEqual(TrajectoryRecorder.metadata_path(self.path),
+                         Path(self.directory.name) / "trajectory.npy.json")
+        self.assertEqual(config_path.read_text(encoding="utf-8"), "{}")
+        self.assertListEqual(sorted(path.name for path in Path(self.directory.name).iterdir()),
+                             ["trajectory.json", "trajectory.npy", "trajectory.npy.json"])
+
+    def test_record(self):
+        uut = TrajectoryRecorder(self.root, self.path, 10)
+        positions = self.animate(uut, 4)
+        uut.close()
+
+        trajectory, metadata = TrajectoryRecorder.load(self.path)
+        np.testing.assert_array_equal(trajectory, positions)
+        self.assertEqual(metadata["frames_written"], 4)
+        self.assertTrue(metadata["complete"])
+        self.assertEqual(metadata["dt"], 0.01)
+
+    def test_chunks(self):
+        # A buffer of two frames
+        with unittest.mock.patch.object(TrajectoryRecorder, "BUFFER_BYTES", 2 * 5 * 3 * 8):
+            uut = TrajectoryRecorder(self.root, self.path, 10)
+        positions = self.animate(uut, 3)
+
+        # Only complete chunks can be read during the recording
+        trajectory, metadata = TrajectoryRecorder.load(self.path)
+        self.assertFalse(metadata["complete"])
+        np.testing.assert_array_equal(trajectory, positions[:2])
+
+        positions = np.concatenate((positions, self.animate(uut, 9)))
+        uut.close()
+        # Frames beyond the preallocated length are dropped
+        trajectory, _ = TrajectoryRecorder.load(self.path)
+        np.testing.assert_array_equal(trajectory, positions[:10])
+
+    def test_decimation_and_nodes(self):
+        uut = TrajectoryRecorder(self.root, self.path, 10, every=3,
+                                 nodes=[4, 1], dtype=np.float32)
+        positions = self.animate(uut, 7)
+        uut.close()
+
+        trajectory, metadata = TrajectoryRecorder.load(self.path)
+        self.assertEqual(trajectory.dtype, np.float32)
+        np.testing.assert_allclose(trajectory, positions[[2, 5]][:, [4, 1]], rtol=1e-6)
+        self.assertListEqual(metadata["nodes"], [4, 1])
+        self.assertEqual(metadata["every"], 3)
+
+    def test_exceptional(self):
+        with self.assertRaises(ValueError):
+            TrajectoryRecorder(self.root, self.path, 0)
+        with self.assertRaises(ValueError):
+            TrajectoryRecorder(self.root, self.path, 10, every=0)
+        with self.assertRaises(ValueError):
+            TrajectoryRecorder(self.root, self.path, 10, nodes=[5])
+        with self.assertRaises(FileNotFoundError):
+            TrajectoryRecorder.load(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+
+def suite() -> unittest.TestSuite:
+    test_suite = unittest.TestSuite()
+
+    # Insert new tests here
+    tests = [
+        TestTrajectoryRecorder,
+    ]
+
+    # Load tests
+    loaded_tests = []
+    for test in tests:
+        loaded_tests.append(unittest.TestLoader().loadTestsFromTestCase(test))
+
+    # Add tests to test suite
+    test_suite.addTests(loaded_tests)
+    return test_suite